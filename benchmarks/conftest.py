@@ -0,0 +1,15 @@
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--update-baselines",
+        action="store_true",
+        default=False,
+        help="Rewrite benchmarks/baselines.json from the current run instead of checking it",
+    )
+
+
+@pytest.fixture()
+def update_baselines(request: pytest.FixtureRequest) -> bool:
+    return request.config.getoption("--update-baselines")
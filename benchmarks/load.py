@@ -0,0 +1,255 @@
+"""Load driver: runs concurrent tool calls against yutori-mcp over stdio.
+
+Starts the server as a subprocess (the same way an MCP client does) with
+its API base URL pointed at a fake Yutori API, then keeps --concurrency
+calls in flight for --duration seconds using a weighted mix of tools.
+At the end it reports throughput, p50/p99 latency per tool and the
+server's resident memory (read from the yutori://metrics resource).
+
+By default an in-process fake API (tests/fake_api.py) is started
+with the latency/error/429 options given here; use --base-url to target
+one that is already running.
+
+Example:
+    python -m benchmarks.load --concurrency 16 --duration 30 --latency-ms 80 --error-rate 0.02 \\
+        --env YUTORI_MCP_READ_RATE=0
+
+The server's client-side rate limits apply as configured, so with the
+defaults read throughput is capped at YUTORI_MCP_READ_RATE per second.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+import urllib.request
+from collections import defaultdict
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import Any
+
+import anyio
+from mcp import ClientSession
+from mcp.client.stdio import StdioServerParameters, stdio_client
+from pydantic import AnyUrl
+
+from tests.fake_api import FakeYutoriAPI, add_config_arguments, config_from_args
+
+DEFAULT_MIX = "list_scouts=4,get_scout_detail=3,get_scout_updates=3,run_research_task=1,get_research_task_result=1"
+FAKE_API_KEY = "yt-load-test"
+TASK_ID_PATTERN = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
+
+@dataclass
+class LoadResult:
+    duration: float
+    latencies: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    memory: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def calls(self) -> int:
+        return sum(len(v) for v in self.latencies.values())
+
+    def summary(self) -> dict[str, Any]:
+        all_latencies = [x for v in self.latencies.values() for x in v]
+        tools = {
+            tool: {
+                "calls": len(values),
+                "errors": self.errors.get(tool, 0),
+                "p50_ms": percentile(values, 50) * 1000,
+                "p99_ms": percentile(values, 99) * 1000,
+            }
+            for tool, values in sorted(self.latencies.items())
+        }
+        return {
+            "duration_s": self.duration,
+            "calls": self.calls,
+            "errors": sum(self.errors.values()),
+            "throughput_per_s": self.calls / self.duration if self.duration else 0.0,
+            "p50_ms": percentile(all_latencies, 50) * 1000,
+            "p99_ms": percentile(all_latencies, 99) * 1000,
+            "server_rss_bytes": self.memory.get("process_resident_memory_bytes"),
+            "server_peak_rss_bytes": self.memory.get("process_max_resident_memory_bytes"),
+            "tools": tools,
+        }
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile; 0 for an empty list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered) + 0.5) - 1))
+    return ordered[rank]
+
+
+def parse_mix(raw: str) -> dict[str, float]:
+    mix = {}
+    for part in raw.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def parse_memory(metrics_text: str) -> dict[str, float]:
+    memory = {}
+    for line in metrics_text.splitlines():
+        name, _, value = line.partition(" ")
+        if name in ("process_resident_memory_bytes", "process_max_resident_memory_bytes"):
+            memory[name] = float(value)
+    return memory
+
+
+def fetch_scout_ids(base_url: str, api_key: str, limit: int = 100) -> list[str]:
+    request = urllib.request.Request(
+        f"{base_url}/scouting/tasks?page_size={limit}", headers={"x-api-key": api_key}
+    )
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return [s["id"] for s in json.load(response)["scouts"]]
+
+
+class Workload:
+    """Picks the next tool call from the weighted mix."""
+
+    def __init__(self, mix: dict[str, float], scout_ids: list[str], seed: int = 0) -> None:
+        self.tools = list(mix)
+        self.weights = list(mix.values())
+        self.scout_ids = scout_ids
+        self.task_ids: list[str] = []
+        self.rng = random.Random(seed)
+
+    def next_call(self) -> tuple[str, dict[str, Any]]:
+        tool = self.rng.choices(self.tools, self.weights)[0]
+        if tool in ("get_research_task_result", "get_browsing_task_result") and not self.task_ids:
+            tool = "list_scouts"
+        scout_id = self.rng.choice(self.scout_ids) if self.scout_ids else ""
+        if tool == "list_scouts":
+            return tool, {"limit": self.rng.choice((10, 20, 50))}
+        if tool in ("get_scout_detail", "delete_scout"):
+            return tool, {"scout_id": scout_id}
+        if tool == "get_scout_updates":
+            return tool, {"scout_id": scout_id, "limit": 10}
+        if tool == "run_research_task":
+            return tool, {"query": f"load test query {self.rng.randint(0, 10**6)}"}
+        if tool == "run_browsing_task":
+            return tool, {"task": "Summarize the page", "start_url": "https://example.com"}
+        if tool in ("get_research_task_result", "get_browsing_task_result"):
+            return tool, {"task_id": self.rng.choice(self.task_ids)}
+        raise ValueError(f"Unsupported tool in mix: {tool}")
+
+    def record(self, tool: str, text: str) -> None:
+        if tool.startswith("run_"):
+            match = TASK_ID_PATTERN.search(text)
+            if match:
+                self.task_ids.append(match.group(0))
+
+
+async def run_load(
+    base_url: str,
+    *,
+    concurrency: int,
+    duration: float,
+    mix: dict[str, float],
+    env: dict[str, str] | None = None,
+    seed: int = 0,
+) -> LoadResult:
+    """Drive a yutori-mcp subprocess for duration seconds and collect latencies."""
+    workload = Workload(mix, fetch_scout_ids(base_url, FAKE_API_KEY), seed=seed)
+    params = StdioServerParameters(
+        command=sys.executable,
+        args=["-m", "yutori_mcp.server"],
+        env={
+            **os.environ,
+            "YUTORI_API_KEY": FAKE_API_KEY,
+            "YUTORI_MCP_API_BASE_URL": base_url,
+            **(env or {}),
+        },
+    )
+    result = LoadResult(duration=duration)
+    async with stdio_client(params) as (read, write), ClientSession(read, write) as session:
+        await session.initialize()
+        deadline = time.monotonic() + duration
+
+        async def worker() -> None:
+            while time.monotonic() < deadline:
+                tool, arguments = workload.next_call()
+                start = time.perf_counter()
+                try:
+                    response = await session.call_tool(tool, arguments)
+                except Exception:
+                    result.errors[tool] += 1
+                    continue
+                result.latencies[tool].append(time.perf_counter() - start)
+                text = "".join(getattr(c, "text", "") for c in response.content)
+                if response.isError:
+                    result.errors[tool] += 1
+                else:
+                    workload.record(tool, text)
+
+        start = time.monotonic()
+        async with anyio.create_task_group() as tg:
+            for _ in range(concurrency):
+                tg.start_soon(worker)
+        result.duration = time.monotonic() - start
+
+        metrics = await session.read_resource(AnyUrl("yutori://metrics"))
+        result.memory = parse_memory("".join(getattr(c, "text", "") for c in metrics.contents))
+    return result
+
+
+def format_summary(summary: dict[str, Any]) -> str:
+    def mib(value: float | None) -> str:
+        return f"{value / 2**20:.1f} MiB" if value is not None else "n/a"
+
+    lines = [
+        f"calls        {summary['calls']} in {summary['duration_s']:.1f}s "
+        f"({summary['throughput_per_s']:.1f}/s), {summary['errors']} errors",
+        f"latency      p50 {summary['p50_ms']:.1f} ms   p99 {summary['p99_ms']:.1f} ms",
+        f"server RSS   {mib(summary['server_rss_bytes'])} (peak {mib(summary['server_peak_rss_bytes'])})",
+        "",
+        f"{'tool':<28}{'calls':>8}{'errors':>8}{'p50 ms':>10}{'p99 ms':>10}",
+    ]
+    for tool, row in summary["tools"].items():
+        lines.append(f"{tool:<28}{row['calls']:>8}{row['errors']:>8}{row['p50_ms']:>10.1f}{row['p99_ms']:>10.1f}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test yutori-mcp against a fake Yutori API")
+    parser.add_argument("--concurrency", type=int, default=8, help="Tool calls kept in flight")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Weighted tools, e.g. list_scouts=4,get_scout_detail=1")
+    parser.add_argument("--base-url", help="Use an already running API instead of starting a fake one")
+    parser.add_argument(
+        "--env", action="append", default=[], metavar="KEY=VALUE", help="Extra environment for the server"
+    )
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    env = dict(item.split("=", 1) for item in args.env)
+    fake = nullcontext() if args.base_url else FakeYutoriAPI(config_from_args(args))
+    with fake as server:
+        base_url = args.base_url or server.base_url
+        result = anyio.run(
+            lambda: run_load(
+                base_url,
+                concurrency=args.concurrency,
+                duration=args.duration,
+                mix=parse_mix(args.mix),
+                env=env,
+                seed=args.seed,
+            )
+        )
+    summary = result.summary()
+    print(json.dumps(summary, indent=2) if args.json else format_summary(summary))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Benchmark dict_to_markdown against the previous recursive implementation.
+
+Run with: pytest benchmarks/ --benchmark-only
+"""
+
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from yutori_mcp.formatters import dict_to_markdown
+
+
+def _legacy_to_markdown_lines(obj: Any, level: int = 0) -> list[str]:
+    """Recursive renderer as shipped before the iterative rewrite."""
+    lines: list[str] = []
+    indent = "  " * level
+
+    if isinstance(obj, dict):
+        for key, val in obj.items():
+            if isinstance(val, (dict, list)) and val:
+                lines.append(f"{indent}{key}:")
+                lines.extend(_legacy_to_markdown_lines(val, level + 1))
+            elif val is not None and val != "":
+                lines.append(f"{indent}{key}: {val}")
+    elif isinstance(obj, list):
+        for item in obj:
+            if isinstance(item, dict) and item:
+                first_key = next(iter(item))
+                first_val = item[first_key]
+                lines.append(f"{indent}- {first_key}: {first_val}")
+                for k, v in item.items():
+                    if k != first_key and v is not None and v != "":
+                        lines.append(f"{indent}  {k}: {v}")
+            elif item is not None and item != "":
+                lines.append(f"{indent}- {item}")
+    else:
+        if obj is not None and obj != "":
+            lines.append(f"{indent}{obj}")
+
+    return lines
+
+
+def legacy_dict_to_markdown(obj: Any, level: int = 0) -> str:
+    return "\n".join(_legacy_to_markdown_lines(obj, level))
+
+
+def _wide_payload(nodes: int = 10_000) -> dict[str, Any]:
+    """~nodes leaves spread over sections of records, like a structured task result."""
+    per_section = 100
+    return {
+        f"section_{s}": {
+            f"record_{r}": {
+                "title": f"Record {s}-{r}",
+                "url": f"https://example.com/{s}/{r}",
+                "tags": ["alpha", "beta"],
+            }
+            for r in range(per_section // 4)
+        }
+        for s in range(nodes // per_section)
+    }
+
+
+def _deep_payload(depth: int = 500) -> dict[str, Any]:
+    """A single chain of nested dicts, kept under the legacy recursion limit."""
+    obj: dict[str, Any] = {"leaf": "value"}
+    for i in range(depth):
+        obj = {f"level_{i}": obj, "note": "x" * 20}
+    return obj
+
+
+UNBOUNDED = {"max_depth": None, "max_items": None, "max_bytes": None}
+
+
+@pytest.mark.parametrize("payload_fn", [_wide_payload, _deep_payload], ids=["wide", "deep"])
+def test_outputs_match_legacy(payload_fn):
+    payload = payload_fn()
+    assert dict_to_markdown(payload, **UNBOUNDED) == legacy_dict_to_markdown(payload)
+
+
+@pytest.mark.benchmark(group="dict_to_markdown-wide")
+def test_bench_wide_legacy(benchmark):
+    payload = _wide_payload()
+    benchmark(legacy_dict_to_markdown, payload)
+
+
+@pytest.mark.benchmark(group="dict_to_markdown-wide")
+def test_bench_wide_iterative(benchmark):
+    payload = _wide_payload()
+    benchmark(dict_to_markdown, payload, **UNBOUNDED)
+
+
+@pytest.mark.benchmark(group="dict_to_markdown-deep")
+def test_bench_deep_legacy(benchmark):
+    payload = _deep_payload()
+    benchmark(legacy_dict_to_markdown, payload)
+
+
+@pytest.mark.benchmark(group="dict_to_markdown-deep")
+def test_bench_deep_iterative(benchmark):
+    payload = _deep_payload()
+    benchmark(dict_to_markdown, payload, **UNBOUNDED)
@@ -0,0 +1,89 @@
+"""Formatter benchmarks at production payload sizes.
+
+Each case records time (pytest-benchmark), peak memory (tracemalloc) and
+output size. Memory and output size are machine-independent and are
+checked against benchmarks/baselines.json; timings are compared against a
+saved pytest-benchmark run (see README).
+
+Run with: pytest benchmarks/ --benchmark-only
+Refresh the baselines with: pytest benchmarks/test_formatters.py --benchmark-only --update-baselines
+"""
+
+from __future__ import annotations
+
+import json
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from tests import payloads
+from yutori_mcp.formatters import (
+    dict_to_markdown,
+    format_list_scouts,
+    format_scout_updates,
+    format_task_result,
+)
+
+BASELINES_PATH = Path(__file__).with_name("baselines.json")
+
+# Allowed growth over the stored baseline before a case fails
+MEMORY_TOLERANCE = 1.25
+OUTPUT_TOLERANCE = 1.10
+
+CASES: dict[str, tuple[Callable[..., str], Callable[[], dict[str, Any]], dict[str, Any]]] = {
+    "list_scouts_1000": (format_list_scouts, lambda: payloads.scout_list(1000), {}),
+    "scout_updates_100": (format_scout_updates, lambda: payloads.scout_updates(100), {}),
+    "scout_updates_100_delta": (format_scout_updates, lambda: payloads.scout_updates(100), {"delta": True}),
+    "task_result_10k_rows": (format_task_result, lambda: payloads.task_result(10_000), {}),
+    "dict_to_markdown_nested": (dict_to_markdown, lambda: payloads.nested_result(), {}),
+}
+
+
+def _peak_memory(fn: Callable[..., str], payload: dict[str, Any], kwargs: dict[str, Any]) -> int:
+    tracemalloc.start()
+    try:
+        fn(payload, **kwargs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _load_baselines() -> dict[str, dict[str, int]]:
+    if not BASELINES_PATH.exists():
+        return {}
+    return json.loads(BASELINES_PATH.read_text())
+
+
+@pytest.mark.parametrize("case", list(CASES))
+def test_formatter(benchmark, case, update_baselines):
+    fn, make_payload, kwargs = CASES[case]
+    payload = make_payload()
+
+    output = benchmark(fn, payload, **kwargs)
+    measured = {
+        "output_bytes": len(output.encode()),
+        "peak_memory_bytes": _peak_memory(fn, payload, kwargs),
+    }
+    benchmark.extra_info.update(measured)
+
+    baselines = _load_baselines()
+    if update_baselines:
+        baselines[case] = measured
+        BASELINES_PATH.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        return
+
+    baseline = baselines.get(case)
+    if baseline is None:
+        pytest.fail(f"No baseline for {case}; run with --update-baselines")
+    assert measured["output_bytes"] <= baseline["output_bytes"] * OUTPUT_TOLERANCE, (
+        f"{case} output grew to {measured['output_bytes']} bytes (baseline {baseline['output_bytes']})"
+    )
+    assert measured["peak_memory_bytes"] <= baseline["peak_memory_bytes"] * MEMORY_TOLERANCE, (
+        f"{case} peak memory grew to {measured['peak_memory_bytes']} bytes "
+        f"(baseline {baseline['peak_memory_bytes']})"
+    )
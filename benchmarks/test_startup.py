@@ -0,0 +1,89 @@
+"""Startup cost of the yutori-mcp entry point, measured with python -X importtime.
+
+Agents spawn a fresh stdio server per session, so import time is paid on
+every session. The budgets below are regression thresholds, not targets;
+override them with YUTORI_MCP_STARTUP_BUDGET_MS / YUTORI_MCP_SERVE_BUDGET_MS
+on slow machines.
+
+Run with: pytest benchmarks/ --benchmark-only
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+# Cumulative import time of yutori_mcp.server itself (no mcp/SDK)
+STARTUP_BUDGET_MS = float(os.environ.get("YUTORI_MCP_STARTUP_BUDGET_MS", "150"))
+# Everything needed to answer the first tools/list request
+SERVE_BUDGET_MS = float(os.environ.get("YUTORI_MCP_SERVE_BUDGET_MS", "2500"))
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\| ( *)(\S+)")
+
+
+def importtime(code: str) -> dict[str, float]:
+    """Run code in a fresh interpreter and return cumulative import ms per module.
+
+    Only modules imported by code are included, not interpreter startup
+    (site, encodings). The "<total>" key holds the sum over top-level imports.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative: dict[str, float] = {}
+    total = 0.0
+    for match in _IMPORTTIME_LINE.finditer(proc.stderr):
+        ms, indent, module = int(match.group(2)) / 1000, match.group(3), match.group(4)
+        if not indent and module == "site":
+            # Everything up to here is interpreter startup
+            cumulative.clear()
+            total = 0.0
+            continue
+        cumulative[module] = ms
+        if not indent:
+            total += ms
+    cumulative["<total>"] = total
+    return cumulative
+
+
+def _best_of(code: str, module: str, rounds: int = 5) -> float:
+    return min(importtime(code)[module] for _ in range(rounds))
+
+
+def test_server_module_import(benchmark):
+    """Importing the entry point module stays cheap: mcp and the SDK are deferred."""
+    ms = benchmark.pedantic(_best_of, args=("import yutori_mcp.server", "yutori_mcp.server"), rounds=1)
+    assert ms < STARTUP_BUDGET_MS, f"yutori_mcp.server imported in {ms:.0f}ms (budget {STARTUP_BUDGET_MS:.0f}ms)"
+
+
+def test_version_flag(benchmark):
+    """--version answers without importing mcp, pydantic or the SDK."""
+    code = (
+        "import sys\n"
+        "sys.argv = ['yutori-mcp', '--version']\n"
+        "from yutori_mcp.server import main\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+    )
+    timings = benchmark.pedantic(importtime, args=(code,), rounds=3)
+    assert not {"mcp", "pydantic", "yutori"} & set(timings)
+
+
+def test_first_tools_list(benchmark):
+    """Cost of everything imported before the server can answer tools/list."""
+    code = "from yutori_mcp.server import create_server, get_tools\ncreate_server()\nget_tools()"
+    timings = benchmark.pedantic(importtime, args=(code,), rounds=3)
+    total = timings["<total>"]
+    assert total < SERVE_BUDGET_MS, f"serving imports took {total:.0f}ms (budget {SERVE_BUDGET_MS:.0f}ms)"
+    # The SDK and formatters are only imported by the first tool call
+    assert "yutori" not in timings
+    assert "yutori_mcp.formatters" not in timings
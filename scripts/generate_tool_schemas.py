@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Regenerate src/yutori_mcp/tool_schemas.json from the pydantic input models.
+
+The server ships these simplified JSON schemas as data so that startup does
+not import pydantic models or build schemas. Run this after changing
+schemas.py; tests/test_server.py fails while the file is out of date.
+
+Usage: python scripts/generate_tool_schemas.py [--check]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from yutori_mcp import schemas  # noqa: E402
+from yutori_mcp.server import TOOL_DEFINITIONS, TOOL_SCHEMAS_PATH, _get_simplified_schema  # noqa: E402
+
+
+def build() -> dict:
+    names = sorted({d["schema"] for d in TOOL_DEFINITIONS})
+    return {name: _get_simplified_schema(getattr(schemas, name)) for name in names}
+
+
+def render(data: dict) -> str:
+    return json.dumps(data, indent=2) + "\n"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the file is out of date")
+    args = parser.parse_args()
+
+    content = render(build())
+    if args.check:
+        if TOOL_SCHEMAS_PATH.read_text() != content:
+            print(f"{TOOL_SCHEMAS_PATH} is out of date; run {sys.argv[0]}")
+            return 1
+        return 0
+    TOOL_SCHEMAS_PATH.write_text(content)
+    print(f"Wrote {TOOL_SCHEMAS_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,27 +2,99 @@
 
 Wraps YutoriClient namespace methods, preserving the same interface that
 server.py's _handle_tool() expects. Catches SDK APIError and re-raises
-as YutoriAPIError for consistent MCP error formatting.
+as YutoriAPIError for consistent MCP error formatting. Transient failures
+are retried according to the process-wide RetryPolicy (see retry.py), and
+every HTTP attempt first takes a token from the shared RateLimiter
+(see ratelimit.py) and passes through the shared CircuitBreaker
+(see breaker.py). While the circuit is open, reads are served from the
+ResponseCache of last known values (see cache.py) when possible.
+Identical reads issued concurrently by different adapters are coalesced
+into a single upstream call (see singleflight.py), and repeated identical
+task launches return the original task (see idempotency.py). Research
+launches can be answered from recently completed identical research (see
+memo.py). After list_scouts, the listed scouts' details, and after an
+updates page its next page, can be fetched in the background ahead of the
+follow-up calls (see prefetch.py). Every scout seen is fed into a local
+index that find_scouts searches (see index.py). An updates page can be
+held until the scout's next scheduled run and served again without a
+request (see schedule.py). Scout reads can be answered from recent cached
+responses while they are refreshed in the background, or from the cache
+alone in offline mode (see revalidate.py). Updates pushed by scout webhooks
+are read from the local update store (see store.py). HTTP attempts can be
+recorded to, or replayed from, a cassette file (see cassette.py).
+
+An adapter can be cancelled from another thread: cancel() shuts down the
+sockets of its in-flight HTTP request, so the request fails at once, and
+interrupts any backoff or rate-limit wait.
 """
 
 from __future__ import annotations
 
+import dataclasses
+import socket
+import threading
+import time
+import weakref
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager, nullcontext
 from typing import Any
 
-from yutori.auth.credentials import resolve_api_key
+import httpcore
+import httpx
 from yutori.client import YutoriClient
 from yutori.exceptions import APIError, AuthenticationError
 
+from . import metrics, tracing
+from .breaker import CircuitBreaker, CircuitOpenError, default_breaker
+from .cache import ResponseCache, cache_key, default_cache
+from .cassette import Cassette, CassetteEntry, default_cassette
+from .config import env_str
+from .credentials import resolve_api_key
+from .idempotency import TaskDeduplicator, UncertainLaunchError, default_task_deduplicator, launch_fingerprint
+from .index import ScoutIndex, default_scout_index
+from .memo import ResearchMemo, default_research_memo, research_memo_key
+from .prefetch import Prefetcher, default_prefetcher
+from .ratelimit import RateLimiter, default_rate_limiter
+from .revalidate import Revalidator, default_revalidator
+from .retry import RetryPolicy, call_with_retry, default_retry_policy, parse_retry_after
+from .schedule import UpdateSchedule, default_update_schedule
+from .singleflight import SingleFlight, default_singleflight
+from .store import UpdateStore, default_update_store, is_local_cursor, updates_after
+
 ERROR_NO_API_KEY = "API key required. Run 'uvx yutori-mcp login' or set YUTORI_API_KEY."
 
+# Idempotent operations, retried on any transient failure
+READ_OPERATIONS = frozenset(
+    {
+        "list_scouts",
+        "get_scout_detail",
+        "get_scout_updates",
+        "get_browsing_task",
+        "get_research_task",
+    }
+)
+
+_SCOUT_WRITES = frozenset({"create_scout", "edit_scout", "delete_scout"})
+
+# Page size of the listing that reloads the scout index
+_INDEX_LISTING_LIMIT = 1000
+
+# Launches of billable cloud tasks, deduplicated within a window
+TASK_LAUNCHES = frozenset({"run_browsing_task", "run_research_task"})
+
 
 class YutoriAPIError(Exception):
     """Raised when the Yutori API returns an error (MCP-facing wrapper)."""
 
-    def __init__(self, message: str, status_code: int):
+    def __init__(self, message: str, status_code: int, retry_after: float | None = None):
         super().__init__(message)
         self.message = message
         self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class CallCancelled(Exception):
+    """Raised inside an adapter call after cancel() has been requested."""
 
 
 class MCPClientAdapter:
@@ -30,17 +102,114 @@ class MCPClientAdapter:
 
     All methods filter out None-valued kwargs before forwarding to the SDK,
     so callers can pass optional fields unconditionally.
+
+    Args:
+        deadline: Seconds the whole tool call may take. Caps the HTTP timeout
+            and the retry deadline. Shared components default to the
+            process-wide instances.
+
+    Attributes:
+        stale_age: Age in seconds of the oldest cached response served in
+            place of a live one during this adapter's lifetime, or None if
+            every response was live.
+        stale_reason: Why that response was served: "unavailable" (the
+            circuit was open), "revalidating" (it is being refreshed in the
+            background) or "offline"; None if every response was live.
+        reused_task_age: Seconds since the original launch when a task launch
+            returned an earlier identical launch's task, or None.
+        memo_age: Age in seconds of the completed research result returned by
+            run_research_task in place of a new task, or None.
+        schedule_hold: (age in seconds, next run as epoch seconds) when
+            get_scout_updates returned a page held until the scout's next
+            run instead of making a request, or None.
+        upstream_seconds: Total time spent in API calls (including retries
+            and rate-limit waits) during this adapter's lifetime.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        breaker: CircuitBreaker | None = None,
+        cache: ResponseCache | None = None,
+        deadline: float | None = None,
+        singleflight: SingleFlight | None = None,
+        cassette: Cassette | None = None,
+        task_deduplicator: TaskDeduplicator | None = None,
+        research_memo: ResearchMemo | None = None,
+        prefetcher: Prefetcher | None = None,
+        scout_index: ScoutIndex | None = None,
+        update_schedule: UpdateSchedule | None = None,
+        revalidator: Revalidator | None = None,
+        update_store: UpdateStore | None = None,
+    ) -> None:
+        self._cassette = cassette if cassette is not None else default_cassette()
         api_key = resolve_api_key()
         if not api_key:
-            raise ValueError(ERROR_NO_API_KEY)
-        self._client = YutoriClient(api_key=api_key)
+            if not self._cassette.replaying:
+                raise ValueError(ERROR_NO_API_KEY)
+            # Replay never reaches the network, so no key is needed
+            api_key = "replay"
+        self._api_key = api_key
+        client_kwargs: dict[str, Any] = {"timeout": deadline} if deadline else {}
+        base_url = env_str("API_BASE_URL", "")
+        if base_url:
+            client_kwargs["base_url"] = base_url.rstrip("/")
+        self._client = YutoriClient(api_key=api_key, **client_kwargs)
+        self._sockets = _SocketTracker.install(self._client)
+        self._retry_policy = retry_policy or default_retry_policy()
+        if deadline and deadline < self._retry_policy.deadline:
+            self._retry_policy = dataclasses.replace(self._retry_policy, deadline=deadline)
+        self._rate_limiter = rate_limiter or default_rate_limiter()
+        self._breaker = breaker or default_breaker()
+        self._cache = cache if cache is not None else default_cache()
+        self._flights = singleflight or default_singleflight()
+        self._launches = task_deduplicator or default_task_deduplicator()
+        self._memo = research_memo if research_memo is not None else default_research_memo()
+        self._prefetcher = prefetcher if prefetcher is not None else default_prefetcher()
+        self._scout_index = scout_index if scout_index is not None else default_scout_index()
+        self._schedule = update_schedule if update_schedule is not None else default_update_schedule()
+        self._revalidator = revalidator if revalidator is not None else default_revalidator()
+        self._store = update_store if update_store is not None else default_update_store()
+        self.stale_age: float | None = None
+        self.stale_reason: str | None = None
+        self.reused_task_age: float | None = None
+        self.memo_age: float | None = None
+        self.schedule_hold: tuple[float, float] | None = None
+        self.upstream_seconds = 0.0
+        self._cancelled = threading.Event()
+        # Guards cancel() against a task launch that is on the wire
+        self._shield_lock = threading.Lock()
+        self._shielded = False
+        # Whether the current launch may have reached the API
+        self._launch_sent = False
 
     def close(self) -> None:
         self._client.close()
 
+    def cancel(self) -> None:
+        """Abort the current call from another thread.
+
+        The adapter's open sockets are shut down, so a request waiting on the
+        server fails immediately, and the HTTP client is closed; the failure
+        surfaces as CallCancelled rather than an API error. A request that
+        was already sent may still be carried out by the API.
+
+        A task launch request that is already on the wire is left to finish,
+        so the task it starts is remembered for identical retries (see
+        idempotency.py); nothing is attempted after it.
+        """
+        with self._shield_lock:
+            self._cancelled.set()
+            if self._shielded:
+                return
+        self._sockets.abort()
+        self.close()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
     def __enter__(self) -> MCPClientAdapter:
         return self
 
@@ -52,47 +221,393 @@ class MCPClientAdapter:
     # -------------------------------------------------------------------------
 
     def list_scouts(self, **kwargs: Any) -> dict[str, Any]:
-        return self._call(self._client.scouts.list, **_strip_none(kwargs))
+        kwargs = _strip_none(kwargs)
+        result = self._request("list_scouts", self._client.scouts.list, **kwargs)
+        if self.stale_age is None:
+            self._prefetcher.after_list(result)
+            if isinstance(result, dict):
+                complete = "status" not in kwargs and result.get("has_more") is not True
+                self._scout_index.observe_list(result, complete=complete)
+        return result
+
+    def find_scouts(self, text: str | None = None, **filters: Any) -> dict[str, Any]:
+        """Search the local scout index (see index.py), reloading it first if it is stale.
+
+        If the reload fails, an index that already has scouts is still searched.
+        """
+        index = self._scout_index
+        for scout in self._store.new_scouts():
+            index.upsert(scout)
+        if index.stale:
+            try:
+                listing = self.list_scouts(limit=_INDEX_LISTING_LIMIT)
+                if isinstance(listing, dict) and listing.get("has_more") is True:
+                    index.mark_refreshed()
+            except Exception:
+                if not len(index):
+                    raise
+        scouts, total = index.find(text, **_strip_none(filters))
+        return {
+            "scouts": scouts,
+            "total": total,
+            "indexed": len(index),
+            "index_age": None if index.refreshed_at is None else time.time() - index.refreshed_at,
+        }
 
     def get_scout_detail(self, scout_id: str) -> dict[str, Any]:
-        return self._call(self._client.scouts.get, scout_id)
+        result = self._request("get_scout_detail", self._client.scouts.get, scout_id)
+        if self.stale_age is None:
+            self._scout_index.upsert(result)
+        return result
 
     def create_scout(self, query: str, **kwargs: Any) -> dict[str, Any]:
-        return self._call(self._client.scouts.create, query, **_strip_none(kwargs))
+        kwargs = _strip_none(kwargs)
+        result = self._request("create_scout", self._client.scouts.create, query, **kwargs)
+        self._scout_index.observe_write("create_scout", "", result, {"query": query, **kwargs})
+        return result
 
     def edit_scout(self, scout_id: str, **kwargs: Any) -> dict[str, Any]:
-        return self._call(self._client.scouts.update, scout_id, **_strip_none(kwargs))
+        kwargs = _strip_none(kwargs)
+        result = self._request("edit_scout", self._client.scouts.update, scout_id, **kwargs)
+        self._scout_index.observe_write("edit_scout", scout_id, result, kwargs)
+        return result
 
     def delete_scout(self, scout_id: str) -> dict[str, Any]:
-        return self._call(self._client.scouts.delete, scout_id)
+        result = self._request("delete_scout", self._client.scouts.delete, scout_id)
+        self._scout_index.observe_write("delete_scout", scout_id, result, {})
+        return result
 
     def get_scout_updates(self, scout_id: str, **kwargs: Any) -> dict[str, Any]:
-        return self._call(self._client.scouts.get_updates, scout_id, **_strip_none(kwargs))
+        """Read a page of updates.
+
+        Scouts with webhook-pushed updates are answered from the update store
+        (see store.py) until its updates run out, then from the API;
+        otherwise a page held until the scout's next run may be returned
+        (see schedule.py).
+        """
+        kwargs = _strip_none(kwargs)
+        cursor = kwargs.get("cursor")
+        if self._store.enabled and (cursor is None or is_local_cursor(cursor)):
+            stored = self._store.page(scout_id, kwargs.get("limit"), cursor)
+            if stored is not None:
+                return stored
+            if cursor is not None:
+                return self._updates_after_store(scout_id, cursor, {k: v for k, v in kwargs.items() if k != "cursor"})
+        return self._read_updates(scout_id, kwargs)
+
+    def _updates_after_store(self, scout_id: str, cursor: str, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """The API page of updates older than those stored, continuing a local cursor.
+
+        The API's pages are read from the start, skipping the updates the
+        store already served; the page returned carries the API's cursor.
+        """
+        while True:
+            page = self._read_updates(scout_id, kwargs)
+            older = updates_after(cursor, page.get("updates") or [])
+            if older or not page.get("has_more") or not page.get("next_cursor"):
+                return {**page, "updates": older}
+            kwargs = {**kwargs, "cursor": page["next_cursor"]}
+
+    def _read_updates(self, scout_id: str, kwargs: dict[str, Any]) -> dict[str, Any]:
+        key = cache_key("get_scout_updates", (scout_id,), kwargs)
+        held = self._schedule.lookup(scout_id, key)
+        if held is not None:
+            result, age, next_run = held
+            self.schedule_hold = (age, next_run)
+            return result
+        result = self._request("get_scout_updates", self._client.scouts.get_updates, scout_id, **kwargs)
+        if self.stale_age is None:
+            self._prefetcher.after_updates(scout_id, kwargs, result)
+            self._schedule.record(scout_id, key, kwargs, result, self._scout_index.get(scout_id))
+        return result
 
     # -------------------------------------------------------------------------
     # Browsing operations
     # -------------------------------------------------------------------------
 
-    def run_browsing_task(self, task: str, start_url: str, **kwargs: Any) -> dict[str, Any]:
-        return self._call(self._client.browsing.create, task, start_url, **_strip_none(kwargs))
+    def run_browsing_task(
+        self, task: str, start_url: str, idempotency_key: str | None = None, **kwargs: Any
+    ) -> dict[str, Any]:
+        return self._launch(
+            "run_browsing_task",
+            self._client.browsing.create,
+            (task, start_url),
+            _strip_none(kwargs),
+            idempotency_key,
+        )
 
     def get_browsing_task(self, task_id: str) -> dict[str, Any]:
-        return self._call(self._client.browsing.get, task_id)
+        return self._request("get_browsing_task", self._client.browsing.get, task_id)
 
     # -------------------------------------------------------------------------
     # Research operations
     # -------------------------------------------------------------------------
 
-    def run_research_task(self, query: str, **kwargs: Any) -> dict[str, Any]:
-        return self._call(self._client.research.create, query, **_strip_none(kwargs))
+    def run_research_task(
+        self,
+        query: str,
+        idempotency_key: str | None = None,
+        max_age: float | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Start a research task, or with max_age, reuse a recent identical one's result."""
+        kwargs = _strip_none(kwargs)
+        memo_key = research_memo_key(query, kwargs)
+        if max_age is not None:
+            entry = self._memo.lookup(memo_key, max_age)
+            if entry is not None:
+                self.memo_age = entry.age()
+                return entry.result
+        result = self._launch("run_research_task", self._client.research.create, (query,), kwargs, idempotency_key)
+        self._memo.track(str(result.get("task_id") or ""), memo_key)
+        return result
 
     def get_research_task(self, task_id: str) -> dict[str, Any]:
-        return self._call(self._client.research.get, task_id)
+        result = self._request("get_research_task", self._client.research.get, task_id)
+        self._memo.complete(task_id, result)
+        return result
 
     # -------------------------------------------------------------------------
     # Internal
     # -------------------------------------------------------------------------
 
+    def _request(self, operation: str, fn: Any, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        """Call an SDK method via _call(), guarded, rate limited and retried.
+
+        Identical concurrent reads share one upstream call (see
+        singleflight.py). Successful reads are cached; if the circuit breaker
+        rejects a read, the last cached value is returned instead and
+        stale_age is set.
+        """
+        start = time.perf_counter()
+        with tracing.span(f"yutori.{operation}", _span_attributes(operation, args)):
+            try:
+                return self._dispatch(operation, fn, args, kwargs)
+            finally:
+                self.upstream_seconds += time.perf_counter() - start
+
+    def _launch(
+        self,
+        operation: str,
+        fn: Any,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        idempotency_key: str | None,
+    ) -> dict[str, Any]:
+        """Start a task via _request(), unless an identical launch was made recently.
+
+        The idempotency key only distinguishes launches locally; it is not
+        sent to the API.
+        """
+        key = launch_fingerprint(operation, args, kwargs, idempotency_key)
+        self._launch_sent = False
+        try:
+            result, age = self._launches.launch(
+                key,
+                lambda: self._request(operation, fn, *args, **kwargs),
+                label=operation,
+                cancelled=self._cancelled.is_set,
+                uncertain=lambda e: self._launch_sent,
+            )
+        except UncertainLaunchError as e:
+            raise YutoriAPIError(
+                message=f"{e}. Pass a different idempotency_key to start another task.", status_code=409
+            ) from e
+        if age is not None:
+            self.reused_task_age = age
+        return result
+
+    def _dispatch(
+        self, operation: str, fn: Any, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Body of _request(): writes go straight through, reads are coalesced.
+
+        A read answered by a fresh prefetch (see prefetch.py), or from the
+        cache while it is revalidated or offline (see revalidate.py), makes
+        no request.
+        """
+        if self._revalidator.offline:
+            return self._offline(operation, cache_key(operation, args, kwargs))
+        if operation not in READ_OPERATIONS:
+            try:
+                result = self._invoke(operation, fn, args, kwargs)
+            except CircuitOpenError as e:
+                raise YutoriAPIError(message=str(e), status_code=503) from e
+            if operation in _SCOUT_WRITES:
+                # Scout lists and this scout's cached detail/updates are now outdated
+                self._cache.invalidate(operation="list_scouts")
+                if args:
+                    self._cache.invalidate(resource_id=str(args[0]))
+                    self._prefetcher.invalidate(str(args[0]))
+                    self._schedule.invalidate(str(args[0]))
+            return result
+
+        key = cache_key(operation, args, kwargs)
+        prefetched = self._prefetcher.take(key)
+        if prefetched is not None:
+            return prefetched
+        cached = self._revalidator.serve(operation, key, self._cache)
+        if cached is not None:
+            self._revalidator.revalidate(key, operation, *args, **kwargs)
+            self._served_stale(cached.age(), "revalidating")
+            return cached.value
+        while True:
+            try:
+                result, age = self._flights.do(
+                    key,
+                    lambda: self._read_through(operation, key, fn, args, kwargs),
+                    label=operation,
+                    cancelled=self._cancelled.is_set,
+                )
+                break
+            except CallCancelled:
+                if self.cancelled:
+                    raise
+                # The shared call was cancelled by its own caller, not by us
+        if age is not None:
+            self._served_stale(age, "unavailable")
+        return result
+
+    def _offline(self, operation: str, key: str) -> dict[str, Any]:
+        """Answer a call in offline mode: reads from the stored cache, nothing else."""
+        if operation not in READ_OPERATIONS:
+            raise YutoriAPIError(
+                message=f"Offline mode (YUTORI_MCP_OFFLINE) is on; {operation} needs the Yutori API.",
+                status_code=503,
+            )
+        entry = self._revalidator.stored(key, self._cache)
+        if entry is None:
+            raise YutoriAPIError(
+                message=f"Offline mode (YUTORI_MCP_OFFLINE) is on and no stored {operation} response matches this call.",
+                status_code=503,
+            )
+        self._served_stale(entry.age(), "offline")
+        return entry.value
+
+    def _served_stale(self, age: float, reason: str) -> None:
+        if self.stale_age is None or age > self.stale_age:
+            self.stale_age, self.stale_reason = age, reason
+
+    def _read_through(
+        self, operation: str, key: str, fn: Any, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> tuple[dict[str, Any], float | None]:
+        """Perform a read, returning (result, age of the cached value or None if live)."""
+        try:
+            result = self._invoke(operation, fn, args, kwargs)
+        except CircuitOpenError as e:
+            cached = self._cache.get(key)
+            if cached is None:
+                raise YutoriAPIError(message=str(e), status_code=503) from e
+            return cached.value, cached.age()
+        resource_id = str(args[0]) if args else None
+        self._cache.put(key, result, operation=operation, resource_id=resource_id)
+        return result, None
+
+    def _invoke(
+        self, operation: str, fn: Any, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Run one logical API call with breaker, rate limiting and retries."""
+        deadline_at = time.monotonic() + self._retry_policy.deadline
+
+        def attempt() -> dict[str, Any]:
+            self._raise_if_cancelled()
+            # Queue for a request slot within the time the call has left, before
+            # the breaker, so the wait is neither a probe nor upstream latency
+            self._rate_limiter.acquire(
+                operation, timeout=max(0.0, deadline_at - time.monotonic()), sleep=self._sleep
+            )
+            with self._breaker.guard():
+                try:
+                    with self._shield() if operation in TASK_LAUNCHES else nullcontext():
+                        result = self._upstream(operation, fn, args, kwargs)
+                except Exception as e:
+                    if _launch_rejected(e):
+                        self._launch_sent = False
+                    # A request aborted by cancel() is not an upstream failure
+                    self._raise_if_cancelled(e)
+                    metrics.upstream_requests.inc(operation, _status_label(e))
+                    raise
+                metrics.upstream_requests.inc(operation, "2xx")
+                return result
+
+        return call_with_retry(
+            attempt,
+            operation=operation,
+            idempotent=operation in READ_OPERATIONS,
+            policy=self._retry_policy,
+            sleep=self._sleep,
+        )
+
+    def _upstream(
+        self, operation: str, fn: Any, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Make one HTTP attempt via _call(), or record/replay it with the cassette."""
+        cassette = self._cassette
+        if cassette.replaying:
+            return self._replay(operation, args, kwargs)
+        if not cassette.recording:
+            return self._call(fn, *args, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            result = self._call(fn, *args, **kwargs)
+        except Exception as e:
+            if not self.cancelled:
+                entry = CassetteEntry(
+                    seconds=time.perf_counter() - start,
+                    status=getattr(e, "status_code", None),
+                    error=getattr(e, "message", None) or str(e),
+                    error_type=None if isinstance(e, YutoriAPIError) else type(e).__name__,
+                    retry_after=getattr(e, "retry_after", None),
+                )
+                cassette.record(operation, args, kwargs, entry, secrets=(self._api_key,))
+            raise
+        entry = CassetteEntry(seconds=time.perf_counter() - start, body=result)
+        cassette.record(operation, args, kwargs, entry, secrets=(self._api_key,))
+        return result
+
+    def _replay(self, operation: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Answer an attempt from the cassette, taking the recorded (scaled) time."""
+        entry = self._cassette.next(operation, args, kwargs)
+        if entry is None:
+            raise YutoriAPIError(message=f"No recorded response for {operation} in cassette", status_code=404)
+        delay = entry.seconds * self._cassette.timing
+        if delay > 0:
+            self._sleep(delay)
+        if entry.error is None:
+            return entry.body
+        if entry.error_type is not None:
+            # Network errors are replayed as the httpx exception that was recorded
+            error_class = getattr(httpx, entry.error_type, httpx.TransportError)
+            if not (isinstance(error_class, type) and issubclass(error_class, httpx.TransportError)):
+                error_class = httpx.TransportError
+            raise error_class(entry.error)
+        raise YutoriAPIError(
+            message=entry.error, status_code=entry.status or 500, retry_after=entry.retry_after
+        )
+
+    @contextmanager
+    def _shield(self) -> Iterator[None]:
+        """Keep cancel() from aborting a task launch once its request may be sent."""
+        with self._shield_lock:
+            self._raise_if_cancelled()
+            self._shielded = True
+            self._launch_sent = True
+        try:
+            yield
+        finally:
+            with self._shield_lock:
+                self._shielded = False
+
+    def _sleep(self, seconds: float) -> None:
+        """Sleep that wakes up (and raises) as soon as the call is cancelled."""
+        if self._cancelled.wait(seconds):
+            raise CallCancelled("Call cancelled")
+
+    def _raise_if_cancelled(self, cause: BaseException | None = None) -> None:
+        if self._cancelled.is_set():
+            raise CallCancelled("Call cancelled") from cause
+
     @staticmethod
     def _call(fn: Any, *args: Any, **kwargs: Any) -> dict[str, Any]:
         """Call an SDK method, converting SDK APIError to MCP YutoriAPIError."""
@@ -101,7 +616,147 @@ class MCPClientAdapter:
         except AuthenticationError as e:
             raise YutoriAPIError(message=str(e), status_code=401) from e
         except APIError as e:
-            raise YutoriAPIError(message=e.message, status_code=e.status_code) from e
+            raise YutoriAPIError(
+                message=e.message,
+                status_code=e.status_code,
+                retry_after=_retry_after(e),
+            ) from e
+
+
+class _SocketTracker:
+    """Remembers the sockets an SDK client opens, so abort() can shut them down.
+
+    Closing an httpx client does not interrupt a request blocked reading
+    from the server; shutting its socket down does, from any thread.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._sockets: weakref.WeakSet[socket.socket] = weakref.WeakSet()
+        self._aborted = False
+
+    @classmethod
+    def install(cls, client: YutoriClient) -> _SocketTracker:
+        """Route the SDK client's connections through a new tracker."""
+        tracker = cls()
+        http = getattr(client, "_client", None)
+        transports = [getattr(http, "_transport", None), *(getattr(http, "_mounts", None) or {}).values()]
+        for transport in transports:
+            pool = getattr(transport, "_pool", None)
+            # Proxies are ConnectionPool subclasses and connect through the same backend
+            if isinstance(pool, httpcore.ConnectionPool):
+                pool._network_backend = _TrackingBackend(pool._network_backend, tracker)
+        return tracker
+
+    def add(self, stream: httpcore.NetworkStream) -> httpcore.NetworkStream:
+        sock = stream.get_extra_info("socket")
+        if sock is not None:
+            with self._lock:
+                self._sockets.add(sock)
+                aborted = self._aborted
+            if aborted:
+                _shutdown(sock)
+        return _TrackedStream(stream, self)
+
+    def abort(self) -> None:
+        """Shut down every open socket; connections opened later are shut down at once."""
+        with self._lock:
+            self._aborted = True
+            sockets = list(self._sockets)
+        for sock in sockets:
+            _shutdown(sock)
+
+
+class _TrackingBackend(httpcore.NetworkBackend):
+    """httpcore network backend reporting each new connection to a _SocketTracker."""
+
+    def __init__(self, backend: httpcore.NetworkBackend, tracker: _SocketTracker) -> None:
+        self._backend = backend
+        self._tracker = tracker
+
+    def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Iterable[Any] | None = None,
+    ) -> httpcore.NetworkStream:
+        return self._tracker.add(self._backend.connect_tcp(host, port, timeout, local_address, socket_options))
+
+    def connect_unix_socket(
+        self, path: str, timeout: float | None = None, socket_options: Iterable[Any] | None = None
+    ) -> httpcore.NetworkStream:
+        return self._tracker.add(self._backend.connect_unix_socket(path, timeout, socket_options))
+
+    def sleep(self, seconds: float) -> None:
+        self._backend.sleep(seconds)
+
+
+class _TrackedStream(httpcore.NetworkStream):
+    """Connection whose TLS upgrade is tracked too; wrapping moves the socket to a new object."""
+
+    def __init__(self, stream: httpcore.NetworkStream, tracker: _SocketTracker) -> None:
+        self._stream = stream
+        self._tracker = tracker
+
+    def read(self, max_bytes: int, timeout: float | None = None) -> bytes:
+        return self._stream.read(max_bytes, timeout)
+
+    def write(self, buffer: bytes, timeout: float | None = None) -> None:
+        self._stream.write(buffer, timeout)
+
+    def close(self) -> None:
+        self._stream.close()
+
+    def start_tls(
+        self, ssl_context: Any, server_hostname: str | None = None, timeout: float | None = None
+    ) -> httpcore.NetworkStream:
+        return self._tracker.add(self._stream.start_tls(ssl_context, server_hostname, timeout))
+
+    def get_extra_info(self, info: str) -> Any:
+        return self._stream.get_extra_info(info)
+
+
+def _shutdown(sock: socket.socket) -> None:
+    try:
+        # The plain socket method, so an SSLSocket's TLS state is left to its reader
+        socket.socket.shutdown(sock, socket.SHUT_RDWR)
+    except OSError:
+        # Already closed
+        pass
+
+
+def _retry_after(error: APIError) -> float | None:
+    """Extract Retry-After (seconds) from the HTTP response behind an SDK error."""
+    headers = getattr(error.response, "headers", None)
+    if not headers:
+        return None
+    return parse_retry_after(headers.get("Retry-After"))
+
+
+def _span_attributes(operation: str, args: tuple[Any, ...]) -> dict[str, Any]:
+    """Trace attributes for an adapter call; the first argument is the scout or task id."""
+    attributes: dict[str, Any] = {"yutori.operation": operation}
+    if args and operation in {"get_scout_detail", "edit_scout", "delete_scout", "get_scout_updates"}:
+        attributes["yutori.scout_id"] = str(args[0])
+    elif args and operation in {"get_browsing_task", "get_research_task"}:
+        attributes["yutori.task_id"] = str(args[0])
+    return attributes
+
+
+def _launch_rejected(error: BaseException) -> bool:
+    """Whether a failed launch attempt certainly did not start a task: a 4xx or no connection."""
+    status = getattr(error, "status_code", None)
+    if isinstance(status, int):
+        return 400 <= status < 500
+    return isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout))
+
+
+def _status_label(error: BaseException) -> str:
+    """Metrics label for a failed attempt: the HTTP status, else the error type."""
+    status = getattr(error, "status_code", None)
+    return str(status) if status is not None else type(error).__name__
 
 
 def _strip_none(d: dict[str, Any]) -> dict[str, Any]:
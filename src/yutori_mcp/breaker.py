@@ -0,0 +1,199 @@
+"""Circuit breaker for the Yutori API.
+
+When the API is degraded, waiting out a full HTTP timeout on every tool call
+stalls agents for tens of seconds. The breaker watches upstream outcomes over
+a rolling window and, once the failure rate crosses a threshold, opens: calls
+fail immediately (the adapter serves stale cached reads where it can). After a
+cooldown a single half-open probe is let through; success closes the circuit,
+failure re-opens it.
+
+Only upstream health counts: 5xx/408 responses and network errors are
+failures, any other response (including 4xx) is a success, and local errors
+such as rate-limit timeouts are ignored.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import httpx
+
+from .config import env_float, env_int
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the API while the circuit is open."""
+
+    def __init__(self, retry_in: float):
+        super().__init__(
+            f"Yutori API is currently unavailable (circuit open); failing fast. Retry in {retry_in:.0f}s."
+        )
+        self.retry_in = retry_in
+
+
+def counts_as_failure(exc: BaseException) -> bool | None:
+    """Classify an attempt's exception: True (upstream failure), False (upstream
+    answered), or None (local error that says nothing about upstream health)."""
+    status_code = getattr(exc, "status_code", None)
+    if isinstance(status_code, int):
+        return status_code >= 500 or status_code == 408
+    if isinstance(exc, httpx.TransportError):
+        return True
+    return None
+
+
+class CircuitBreaker:
+    """Thread-safe failure-rate circuit breaker.
+
+    Args:
+        failure_rate: Fraction of failed calls in the window that trips the
+            breaker. 0 disables the breaker.
+        min_calls: Minimum calls in the window before the rate is evaluated.
+        window: Rolling window length in seconds.
+        cooldown: Seconds to stay open before allowing a half-open probe.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        min_calls: int = 5,
+        window: float = 30.0,
+        cooldown: float = 15.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.window = window
+        self.cooldown = cooldown
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.transitions: Counter[str] = Counter()
+        self.rejected = 0
+
+    @classmethod
+    def from_env(cls) -> CircuitBreaker:
+        """Build a breaker from YUTORI_MCP_BREAKER_* environment variables."""
+        return cls(
+            failure_rate=env_float("BREAKER_FAILURE_RATE", 0.5),
+            min_calls=env_int("BREAKER_MIN_CALLS", 5),
+            window=env_float("BREAKER_WINDOW", 30.0),
+            cooldown=env_float("BREAKER_COOLDOWN", 15.0),
+        )
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open(self._clock())
+            return self._state
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """Wrap one upstream attempt: reject it if open, then record its outcome.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a
+                probe already in flight.
+        """
+        probe = self._before_call()
+        try:
+            yield
+        except BaseException as e:
+            self._after_call(counts_as_failure(e), probe)
+            raise
+        self._after_call(False, probe)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current state and counters, for metrics."""
+        with self._lock:
+            self._maybe_half_open(self._clock())
+            return {
+                "state": self._state,
+                "transitions": dict(self.transitions),
+                "rejected": self.rejected,
+            }
+
+    # -------------------------------------------------------------------------
+    # Internal
+    # -------------------------------------------------------------------------
+
+    def _before_call(self) -> bool:
+        """Admit or reject a call; returns True if it is the half-open probe."""
+        if self.failure_rate <= 0:
+            return False
+        with self._lock:
+            now = self._clock()
+            self._maybe_half_open(now)
+            if self._state == CLOSED:
+                return False
+            if self._state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.rejected += 1
+            retry_in = max(0.0, self._opened_at + self.cooldown - now)
+            raise CircuitOpenError(retry_in)
+
+    def _after_call(self, failed: bool | None, probe: bool) -> None:
+        if self.failure_rate <= 0:
+            return
+        with self._lock:
+            now = self._clock()
+            if probe:
+                self._probe_in_flight = False
+                if failed is None:
+                    return  # Inconclusive; let the next call probe
+                if failed:
+                    self._transition(OPEN, now)
+                else:
+                    self._outcomes.clear()
+                    self._transition(CLOSED, now)
+                return
+            if failed is None or self._state != CLOSED:
+                return
+
+            self._outcomes.append((now, failed))
+            while self._outcomes and self._outcomes[0][0] < now - self.window:
+                self._outcomes.popleft()
+            calls = len(self._outcomes)
+            failures = sum(1 for _, f in self._outcomes if f)
+            if calls >= self.min_calls and failures / calls >= self.failure_rate:
+                self._transition(OPEN, now)
+
+    def _maybe_half_open(self, now: float) -> None:
+        if self._state == OPEN and now - self._opened_at >= self.cooldown:
+            self._transition(HALF_OPEN, now)
+
+    def _transition(self, state: str, now: float) -> None:
+        previous, self._state = self._state, state
+        if state == OPEN:
+            self._opened_at = now
+        self.transitions[f"{previous}->{state}"] += 1
+        log = logger.warning if state == OPEN else logger.info
+        log("Yutori API circuit breaker: %s -> %s", previous, state)
+
+
+_default_breaker: CircuitBreaker | None = None
+
+
+def default_breaker() -> CircuitBreaker:
+    """Return the process-wide breaker, read from the environment on first use."""
+    global _default_breaker
+    if _default_breaker is None:
+        _default_breaker = CircuitBreaker.from_env()
+    return _default_breaker
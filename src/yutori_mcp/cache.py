@@ -0,0 +1,183 @@
+"""In-process cache of recent Yutori API read responses.
+
+Successful reads are remembered per (operation, arguments) in a bounded LRU
+so the adapter can fall back to the last known value when the API is
+unavailable. Writes invalidate the entries they affect. The cache can be
+saved to and loaded from a snapshot file, so those values outlive the
+process (see warmup.py).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .config import env_int
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A cached response and where it came from."""
+
+    value: dict[str, Any]
+    stored_at: float
+    operation: str
+    resource_id: str | None
+
+    def age(self, now: float | None = None) -> float:
+        """Seconds since the response was fetched."""
+        return (time.time() if now is None else now) - self.stored_at
+
+
+def cache_key(operation: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+    """Normalize an adapter call into a stable cache key."""
+    return json.dumps([operation, list(args), kwargs], sort_keys=True, default=str)
+
+
+class ResponseCache:
+    """Thread-safe, size-bounded LRU of read responses."""
+
+    def __init__(self, max_entries: int = 512, *, clock: Callable[[], float] = time.time) -> None:
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> ResponseCache:
+        return cls(max_entries=env_int("CACHE_SIZE", 512))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(
+        self,
+        key: str,
+        value: dict[str, Any],
+        *,
+        operation: str,
+        resource_id: str | None = None,
+    ) -> None:
+        if self.max_entries <= 0:
+            return
+        entry = CacheEntry(value, self._clock(), operation, resource_id)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *, operation: str | None = None, resource_id: str | None = None) -> int:
+        """Drop entries matching operation and/or resource_id; returns how many."""
+        with self._lock:
+            doomed = [
+                key
+                for key, entry in self._entries.items()
+                if (operation is None or entry.operation == operation)
+                and (resource_id is None or entry.resource_id == resource_id)
+            ]
+            for key in doomed:
+                del self._entries[key]
+            return len(doomed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def entries(self) -> list[tuple[str, CacheEntry]]:
+        """(key, entry) pairs from least to most recently used."""
+        with self._lock:
+            return list(self._entries.items())
+
+    def save(self, path: Path) -> int:
+        """Write all entries to path (JSON lines); returns how many."""
+        items = self.entries()
+        lines = [
+            json.dumps(
+                {
+                    "key": key,
+                    "stored_at": e.stored_at,
+                    "operation": e.operation,
+                    "resource_id": e.resource_id,
+                    "value": e.value,
+                },
+                default=str,
+            )
+            for key, e in items
+        ]
+        tmp = path.with_name(path.name + ".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text("".join(line + "\n" for line in lines), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning("Cannot write cache snapshot %s: %s", path, e)
+            return 0
+        return len(lines)
+
+    def load(self, path: Path) -> int:
+        """Add the entries saved in path, keeping their original age; returns how many.
+
+        Entries already in the cache are newer and are kept.
+        """
+        try:
+            text = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return 0
+        except OSError as e:
+            logger.warning("Cannot read cache snapshot %s: %s", path, e)
+            return 0
+        loaded = 0
+        with self._lock:
+            # Newest first, each in front of the last, so the file's order is kept
+            for line in reversed(text.splitlines()):
+                try:
+                    record = json.loads(line)
+                    key = record["key"]
+                    entry = CacheEntry(
+                        record["value"], float(record["stored_at"]), record["operation"], record.get("resource_id")
+                    )
+                except (ValueError, KeyError, TypeError):
+                    continue
+                if key in self._entries:
+                    continue
+                # Older than anything already cached, so evicted first
+                self._entries[key] = entry
+                self._entries.move_to_end(key, last=False)
+                loaded += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return loaded
+
+
+_default_cache: ResponseCache | None = None
+
+
+def default_cache() -> ResponseCache:
+    """Return the process-wide cache, sized from the environment on first use."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ResponseCache.from_env()
+    return _default_cache
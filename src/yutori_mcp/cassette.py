@@ -0,0 +1,201 @@
+"""Record/replay of Yutori API traffic.
+
+With YUTORI_MCP_CASSETTE=<path> and YUTORI_MCP_CASSETTE_MODE=record, every
+HTTP attempt the adapter makes is appended to <path> as one compact JSON
+line: the operation, its arguments, how long it took and the response body
+or error. API keys and credential-like fields are scrubbed before writing.
+
+With YUTORI_MCP_CASSETTE_MODE=replay, the adapter makes no HTTP requests;
+each attempt is answered from the cassette after sleeping the recorded
+duration times YUTORI_MCP_CASSETTE_TIMING (1 = original timings, 0 = no
+delay). Identical requests are answered with their recordings in order;
+once those run out, the last one is repeated.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TextIO
+
+from .cache import cache_key
+from .config import env_float, env_str
+
+logger = logging.getLogger(__name__)
+
+OFF = "off"
+RECORD = "record"
+REPLAY = "replay"
+
+REDACTED = "[REDACTED]"
+
+# Field names whose values are never written to a cassette
+_SECRET_FIELDS = frozenset({"api_key", "x-api-key", "authorization", "password", "secret", "token"})
+
+
+@dataclass(frozen=True)
+class CassetteEntry:
+    """One recorded HTTP attempt.
+
+    Attributes:
+        seconds: How long the attempt took when recorded.
+        body: Response body of a successful attempt.
+        status: HTTP status of a failed attempt, or None for a network error.
+        error: Error message of a failed attempt; None on success.
+        error_type: Exception class name of a network error (e.g. ConnectError).
+        retry_after: Retry-After of a failed attempt, in seconds.
+    """
+
+    seconds: float
+    body: Any = None
+    status: int | None = None
+    error: str | None = None
+    error_type: str | None = None
+    retry_after: float | None = None
+
+
+def scrub(value: Any, secrets: tuple[str, ...] = ()) -> Any:
+    """Return value with credential fields and occurrences of secrets redacted."""
+    if isinstance(value, dict):
+        return {
+            k: REDACTED if str(k).lower() in _SECRET_FIELDS else scrub(v, secrets)
+            for k, v in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [scrub(v, secrets) for v in value]
+    if isinstance(value, str):
+        for secret in secrets:
+            value = value.replace(secret, REDACTED)
+    return value
+
+
+class Cassette:
+    """Append-only recorder, or replayer, of adapter HTTP attempts.
+
+    Args:
+        path: Cassette file (JSON lines).
+        mode: OFF, RECORD or REPLAY. A replay cassette is loaded on creation.
+        timing: Multiplier for recorded durations during replay.
+    """
+
+    def __init__(self, path: Path | None = None, mode: str = OFF, timing: float = 1.0) -> None:
+        if mode not in (OFF, RECORD, REPLAY):
+            raise ValueError(f"Unknown cassette mode: {mode!r}")
+        if mode != OFF and path is None:
+            raise ValueError(f"Cassette mode {mode!r} needs a path")
+        self.path = Path(path) if path is not None else None
+        self.mode = mode
+        self.timing = max(0.0, timing)
+        self._lock = threading.Lock()
+        self._file: TextIO | None = None
+        self._entries: dict[str, deque[CassetteEntry]] = {}
+        if mode == REPLAY:
+            self._load()
+
+    @classmethod
+    def from_env(cls) -> Cassette:
+        path = env_str("CASSETTE")
+        if path is None:
+            return cls()
+        mode = env_str("CASSETTE_MODE", RECORD).strip().lower()
+        if mode not in (RECORD, REPLAY):
+            logger.warning("Unknown YUTORI_MCP_CASSETTE_MODE %r; cassette disabled", mode)
+            return cls()
+        try:
+            return cls(Path(path).expanduser(), mode, timing=env_float("CASSETTE_TIMING", 1.0))
+        except OSError as e:
+            logger.warning("Cannot read cassette %s (%s); cassette disabled", path, e)
+            return cls()
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == RECORD
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == REPLAY
+
+    def record(
+        self,
+        operation: str,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        entry: CassetteEntry,
+        *,
+        secrets: tuple[str, ...] = (),
+    ) -> None:
+        """Append one attempt, with credentials scrubbed."""
+        record: dict[str, Any] = {
+            "op": operation,
+            "args": list(args),
+            "kwargs": kwargs,
+            "ms": round(entry.seconds * 1000, 3),
+        }
+        if entry.error is None:
+            record["body"] = entry.body
+        else:
+            record.update(status=entry.status, error=entry.error)
+            if entry.error_type is not None:
+                record["error_type"] = entry.error_type
+            if entry.retry_after is not None:
+                record["retry_after"] = entry.retry_after
+        line = json.dumps(scrub(record, tuple(s for s in secrets if s)), separators=(",", ":"), default=str)
+        with self._lock:
+            if self._file is None:
+                assert self.path is not None
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.path.open("a", encoding="utf-8")
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def next(self, operation: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> CassetteEntry | None:
+        """Return the recorded answer for this request, or None if it was never recorded."""
+        key = cache_key(operation, tuple(scrub(list(args))), scrub(kwargs))
+        with self._lock:
+            queue = self._entries.get(key)
+            if not queue:
+                return None
+            return queue.popleft() if len(queue) > 1 else queue[0]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _load(self) -> None:
+        assert self.path is not None
+        with self.path.open(encoding="utf-8") as f:
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    key = cache_key(record["op"], tuple(record.get("args", [])), record.get("kwargs", {}))
+                    entry = CassetteEntry(
+                        seconds=float(record.get("ms", 0)) / 1000,
+                        body=record.get("body"),
+                        status=record.get("status"),
+                        error=record.get("error"),
+                        error_type=record.get("error_type"),
+                        retry_after=record.get("retry_after"),
+                    )
+                except (ValueError, KeyError, TypeError):
+                    logger.warning("Skipping malformed line %d in cassette %s", number, self.path)
+                    continue
+                self._entries.setdefault(key, deque()).append(entry)
+
+
+_default_cassette: Cassette | None = None
+
+
+def default_cassette() -> Cassette:
+    """Return the process-wide cassette, configured from the environment on first use."""
+    global _default_cassette
+    if _default_cassette is None:
+        _default_cassette = Cassette.from_env()
+    return _default_cassette
@@ -0,0 +1,70 @@
+"""Environment-based settings for the MCP server.
+
+All tunables are read from ``YUTORI_MCP_*`` environment variables so they can
+be set in an MCP client's server config. Malformed values are logged and the
+default is used instead of failing server startup.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+ENV_PREFIX = "YUTORI_MCP_"
+
+
+def env_str(name: str, default: str | None = None) -> str | None:
+    """Return the raw value of YUTORI_MCP_<name>, or default if unset/empty."""
+    value = os.environ.get(ENV_PREFIX + name)
+    return value if value else default
+
+
+def env_float(name: str, default: float) -> float:
+    """Return YUTORI_MCP_<name> as a float."""
+    value = env_str(name)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning("Ignoring invalid %s%s=%r; using %s", ENV_PREFIX, name, value, default)
+        return default
+
+
+def env_int(name: str, default: int) -> int:
+    """Return YUTORI_MCP_<name> as an int."""
+    value = env_str(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning("Ignoring invalid %s%s=%r; using %s", ENV_PREFIX, name, value, default)
+        return default
+
+
+def env_bool(name: str, default: bool = False) -> bool:
+    """Return YUTORI_MCP_<name> as a bool (1/true/yes/on are true)."""
+    value = env_str(name)
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def env_float_map(name: str) -> dict[str, float]:
+    """Return YUTORI_MCP_<name> parsed as ``key=value,key=value`` floats."""
+    value = env_str(name)
+    result: dict[str, float] = {}
+    if value is None:
+        return result
+    for item in value.split(","):
+        key, sep, raw = item.partition("=")
+        try:
+            if not sep:
+                raise ValueError(item)
+            result[key.strip()] = float(raw)
+        except ValueError:
+            logger.warning("Ignoring invalid entry %r in %s%s", item, ENV_PREFIX, name)
+    return result
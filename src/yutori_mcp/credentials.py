@@ -0,0 +1,109 @@
+"""Process-wide cache of the resolved Yutori API key.
+
+The SDK's resolve_api_key() reads ~/.yutori/config.json on every call. The
+server creates an adapter per tool call, so the key is resolved once and
+reused until YUTORI_API_KEY changes or the config file is replaced (a
+`yutori-mcp login`/`logout` in another process). The file is checked with a
+stat() at most once per check interval, never re-read while unchanged.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from yutori.auth.credentials import get_config_path
+from yutori.auth.credentials import resolve_api_key as _resolve_api_key
+
+from .config import env_float
+
+API_KEY_ENV = "YUTORI_API_KEY"
+
+# (mtime_ns, size, inode) of the config file, or None if it doesn't exist
+FileSignature = tuple[int, int, int] | None
+
+
+def _file_signature(path: Path) -> FileSignature:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class CredentialCache:
+    """Thread-safe cache of the resolved API key.
+
+    Args:
+        check_interval: Seconds between config file checks. 0 checks on
+            every lookup.
+    """
+
+    def __init__(
+        self,
+        check_interval: float = 1.0,
+        *,
+        resolve: Callable[[], str | None] = _resolve_api_key,
+        config_path: Callable[[], Path] = get_config_path,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.check_interval = check_interval
+        self._resolve = resolve
+        self._config_path = config_path
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._valid = False
+        self._key: str | None = None
+        self._env: str | None = None
+        self._signature: FileSignature = None
+        self._next_check = 0.0
+
+    @classmethod
+    def from_env(cls) -> CredentialCache:
+        return cls(check_interval=env_float("CREDENTIAL_CHECK_INTERVAL", 1.0))
+
+    def get(self) -> str | None:
+        """Return the API key, resolving it again only if its sources changed."""
+        env = os.environ.get(API_KEY_ENV)
+        now = self._clock()
+        with self._lock:
+            if self._valid and env == self._env:
+                if now < self._next_check:
+                    return self._key
+                signature = _file_signature(self._config_path())
+                if signature == self._signature:
+                    self._next_check = now + self.check_interval
+                    return self._key
+            else:
+                signature = _file_signature(self._config_path())
+            # Stat before reading, so a write racing with resolve() is seen next time
+            self._key = self._resolve()
+            self._env = env
+            self._signature = signature
+            self._valid = True
+            self._next_check = now + self.check_interval
+            return self._key
+
+    def invalidate(self) -> None:
+        """Forget the cached key; the next get() resolves it again."""
+        with self._lock:
+            self._valid = False
+
+
+_default_credentials: CredentialCache | None = None
+
+
+def default_credentials() -> CredentialCache:
+    """Return the process-wide credential cache."""
+    global _default_credentials
+    if _default_credentials is None:
+        _default_credentials = CredentialCache.from_env()
+    return _default_credentials
+
+
+def resolve_api_key() -> str | None:
+    """Cached equivalent of yutori.auth.resolve_api_key() (env var, then config file)."""
+    return default_credentials().get()
@@ -0,0 +1,203 @@
+"""Local deduplication of browsing and research task launches.
+
+An MCP client that times out on run_research_task or run_browsing_task
+often retries the same call, which would start a second cloud task. Each
+successful launch is remembered by a fingerprint of its normalized
+arguments (and the caller's optional idempotency key) for
+YUTORI_MCP_TASK_DEDUPE_WINDOW seconds; an identical launch inside that
+window returns the original task instead of starting a new one. An
+identical launch made while the first is still in flight waits for it.
+A launch that failed in a way that may still have started a task (a
+timeout or 5xx after the request was sent) is remembered as uncertain,
+and identical launches in the window are refused instead of risking a
+second billable task.
+
+The Yutori API has no idempotency key, so deduplication is per server
+process.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from .config import env_float
+
+# Upper bound on remembered launches, whatever the window
+_MAX_ENTRIES = 1024
+
+# How often a caller waiting on an in-flight launch re-checks whether it was cancelled
+_WAITER_POLL_SECONDS = 0.05
+
+
+def _normalize(value: Any) -> Any:
+    """Collapse whitespace in strings so trivially different retries still match."""
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, dict):
+        return {k: _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return value
+
+
+def launch_fingerprint(
+    operation: str,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    idempotency_key: str | None = None,
+) -> str:
+    """Stable identity of a task launch."""
+    return json.dumps(
+        [operation, _normalize(list(args)), _normalize(kwargs), idempotency_key],
+        sort_keys=True,
+        default=str,
+    )
+
+
+class UncertainLaunchError(Exception):
+    """Raised for a launch identical to a recent one that failed but may have started a task."""
+
+    def __init__(self, label: str, age: float, cause: BaseException) -> None:
+        super().__init__(
+            f"An identical {label or 'launch'} {age:.0f}s ago failed ({cause}) but may still have started a task"
+        )
+        self.age = age
+        self.cause = cause
+
+
+class _Launch:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: dict[str, Any] | None = None
+        self.launched_at = 0.0
+        # Failure of a launch that may still have started a task
+        self.error: BaseException | None = None
+
+
+class TaskDeduplicator:
+    """Thread-safe memory of recent task launches.
+
+    Args:
+        window: Seconds a launch is remembered; 0 disables deduplication.
+    """
+
+    def __init__(self, window: float = 600.0, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self.window = window
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._launches: OrderedDict[str, _Launch] = OrderedDict()
+        self.deduplicated: Counter[str] = Counter()
+
+    @classmethod
+    def from_env(cls) -> TaskDeduplicator:
+        return cls(window=env_float("TASK_DEDUPE_WINDOW", 600.0))
+
+    def launch(
+        self,
+        key: str,
+        fn: Callable[[], dict[str, Any]],
+        *,
+        label: str = "",
+        cancelled: Callable[[], bool] | None = None,
+        uncertain: Callable[[BaseException], bool] | None = None,
+    ) -> tuple[dict[str, Any], float | None]:
+        """Launch via fn() unless an identical launch is recent or in flight.
+
+        Args:
+            key: Fingerprint from launch_fingerprint().
+            fn: Starts the task.
+            label: Name used for the deduplicated counter (e.g. operation).
+            cancelled: Polled while waiting for an in-flight launch; when it
+                returns True the caller stops waiting and calls fn itself,
+                which is expected to raise promptly for a cancelled caller.
+            uncertain: Whether an error raised by fn() leaves it unknown if
+                the task was started. Such a launch stays remembered and
+                identical launches raise UncertainLaunchError; after any
+                other error an identical launch tries again. None treats
+                every error as proof that nothing was started.
+
+        Returns:
+            (result, age) where age is the seconds since the original launch
+            when its result was reused, or None if fn() was called.
+
+        Raises:
+            UncertainLaunchError: An identical recent launch may have started a task.
+        """
+        if self.window <= 0:
+            return fn(), None
+
+        while True:
+            with self._lock:
+                self._expire()
+                launch = self._launches.get(key)
+                if launch is None:
+                    launch = self._launches[key] = _Launch()
+                    break
+                if launch.done.is_set():
+                    return self._reuse(launch, label)
+            # The original launch is still in flight; if it fails, launch ourselves
+            while not launch.done.wait(_WAITER_POLL_SECONDS):
+                if cancelled is not None and cancelled():
+                    return fn(), None
+            if launch.result is not None or launch.error is not None:
+                with self._lock:
+                    return self._reuse(launch, label)
+
+        try:
+            result = fn()
+        except BaseException as e:
+            with self._lock:
+                if uncertain is not None and isinstance(e, Exception) and uncertain(e):
+                    launch.error = e
+                    launch.launched_at = self._clock()
+                elif self._launches.get(key) is launch:
+                    del self._launches[key]
+            launch.done.set()
+            raise
+        with self._lock:
+            launch.result = result
+            launch.launched_at = self._clock()
+            launch.done.set()
+        return result, None
+
+    def _reuse(self, launch: _Launch, label: str) -> tuple[dict[str, Any], float]:
+        """Answer from a finished launch; called with the lock held."""
+        age = self._clock() - launch.launched_at
+        if launch.error is not None:
+            raise UncertainLaunchError(label, age, launch.error)
+        self.deduplicated[label] += 1
+        return launch.result, age  # type: ignore[return-value]
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {"deduplicated": dict(self.deduplicated), "remembered": len(self._launches)}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._launches.clear()
+
+    def _expire(self) -> None:
+        """Drop launches older than the window, oldest first; called with the lock held."""
+        cutoff = self._clock() - self.window
+        for key, launch in list(self._launches.items()):
+            if not launch.done.is_set():
+                continue  # in flight
+            if launch.launched_at > cutoff and len(self._launches) <= _MAX_ENTRIES:
+                break
+            del self._launches[key]
+
+
+_default_deduplicator: TaskDeduplicator | None = None
+
+
+def default_task_deduplicator() -> TaskDeduplicator:
+    """Return the process-wide deduplicator, configured from the environment on first use."""
+    global _default_deduplicator
+    if _default_deduplicator is None:
+        _default_deduplicator = TaskDeduplicator.from_env()
+    return _default_deduplicator
@@ -0,0 +1,284 @@
+"""Local index of the user's scouts, behind the find_scouts tool.
+
+list_scouts can only filter by status, so finding one scout among hundreds
+means paging them all through the model. The adapter instead feeds every
+scout it sees into this index: list_scouts results, scout details, and
+created, edited or deleted scouts. When the index is older than
+YUTORI_MCP_SCOUT_INDEX_TTL seconds, find_scouts first reloads it with one
+full listing; otherwise it answers from memory.
+
+Scouts are indexed by id, status, display name and query words, interval,
+webhook and next run. Search terms match word prefixes (an inverted index
+over a sorted vocabulary), or substrings of the name and query when no word
+matches. With YUTORI_MCP_SCOUT_INDEX set to a file path, the index is saved
+there, so a new server process starts with it.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+from .config import env_float, env_str
+
+logger = logging.getLogger(__name__)
+
+# Scout fields kept in the index
+_FIELDS = (
+    "id",
+    "display_name",
+    "query",
+    "status",
+    "output_interval",
+    "next_output_timestamp",
+    "webhook_url",
+    "created_at",
+)
+
+_WORD = re.compile(r"\w+")
+
+SORT_ORDERS = ("next_run", "name", "created")
+
+
+def _words(text: str) -> set[str]:
+    return set(_WORD.findall(text.lower()))
+
+
+def _searchable(scout: dict[str, Any]) -> str:
+    return f"{scout.get('display_name') or ''}\n{scout.get('query') or ''}".lower()
+
+
+class ScoutIndex:
+    """Thread-safe in-memory index of scouts.
+
+    Args:
+        path: Optional file the index is saved to and loaded from.
+        ttl: Seconds after the last full listing before find_scouts reloads it.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        ttl: float = 300.0,
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = path
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._scouts: dict[str, dict[str, Any]] = {}
+        # Lowercased name and query, for substring search
+        self._texts: dict[str, str] = {}
+        self._postings: dict[str, set[str]] = {}
+        self._vocabulary: list[str] = []
+        self._vocabulary_dirty = False
+        # When the index last reflected a complete listing, or None
+        self.refreshed_at: float | None = None
+        if path is not None:
+            self._load()
+
+    @classmethod
+    def from_env(cls) -> ScoutIndex:
+        path = env_str("SCOUT_INDEX")
+        return cls(
+            path=Path(path).expanduser() if path else None,
+            ttl=env_float("SCOUT_INDEX_TTL", 300.0),
+        )
+
+    def __len__(self) -> int:
+        return len(self._scouts)
+
+    @property
+    def stale(self) -> bool:
+        return self.refreshed_at is None or self._clock() - self.refreshed_at > self.ttl
+
+    def observe_list(self, listing: dict[str, Any], complete: bool) -> None:
+        """Index a list_scouts result.
+
+        complete: the listing covered every scout (no status filter, no more
+        pages), so scouts missing from it were deleted elsewhere.
+        """
+        scouts = [s for s in listing.get("scouts") or [] if isinstance(s, dict) and s.get("id")]
+        with self._lock:
+            if complete:
+                listed = {str(s["id"]) for s in scouts}
+                for scout_id in [i for i in self._scouts if i not in listed]:
+                    self._remove(scout_id)
+                self.refreshed_at = self._clock()
+            for scout in scouts:
+                self._upsert(scout)
+        if complete:
+            self.save()
+
+    def get(self, scout_id: str) -> dict[str, Any] | None:
+        """The indexed fields of one scout, or None."""
+        with self._lock:
+            scout = self._scouts.get(scout_id)
+            return dict(scout) if scout is not None else None
+
+    def mark_refreshed(self) -> None:
+        """Treat the index as fresh though the last full listing was truncated."""
+        with self._lock:
+            self.refreshed_at = self._clock()
+
+    def upsert(self, scout: dict[str, Any]) -> None:
+        """Index a scout detail."""
+        if not isinstance(scout, dict) or not scout.get("id"):
+            return
+        with self._lock:
+            self._upsert(scout)
+
+    def observe_write(self, operation: str, scout_id: str, result: Any, fields: dict[str, Any]) -> None:
+        """Apply a successful create_scout, edit_scout or delete_scout, and save."""
+        with self._lock:
+            if operation == "delete_scout":
+                self._remove(scout_id)
+            else:
+                returned = result if isinstance(result, dict) and result.get("id") else {}
+                if not (returned.get("id") or scout_id):
+                    return
+                self._upsert({**fields, **returned, "id": returned.get("id") or scout_id})
+        self.save()
+
+    def find(
+        self,
+        text: str | None = None,
+        *,
+        status: str | None = None,
+        has_webhook: bool | None = None,
+        output_interval: int | None = None,
+        sort: str = "next_run",
+        limit: int = 20,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Return up to limit matching scouts, and how many matched."""
+        with self._lock:
+            ids: Iterable[str] = self._match(text) if text and text.strip() else self._scouts
+            scouts = [self._scouts[i] for i in ids]
+        if status is not None:
+            scouts = [s for s in scouts if s.get("status") == status]
+        if has_webhook is not None:
+            scouts = [s for s in scouts if bool(s.get("webhook_url")) is has_webhook]
+        if output_interval is not None:
+            scouts = [s for s in scouts if s.get("output_interval") == output_interval]
+        if sort == "name":
+            scouts.sort(key=lambda s: (s.get("display_name") or s.get("query") or "").lower())
+        elif sort == "created":
+            scouts.sort(key=lambda s: str(s.get("created_at") or ""), reverse=True)
+        else:
+            # ISO timestamps sort chronologically; scouts without a next run last
+            scouts.sort(key=lambda s: (not s.get("next_output_timestamp"), str(s.get("next_output_timestamp"))))
+        return [dict(s) for s in scouts[:limit]], len(scouts)
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        with self._save_lock:
+            with self._lock:
+                data = {"refreshed_at": self.refreshed_at, "scouts": list(self._scouts.values())}
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp.write_text(json.dumps(data, default=str), encoding="utf-8")
+                os.replace(tmp, self.path)
+            except OSError as e:
+                logger.warning("Cannot write scout index %s: %s", self.path, e)
+
+    # -------------------------------------------------------------------------
+    # Internal (called with the lock held, except _load)
+    # -------------------------------------------------------------------------
+
+    def _upsert(self, scout: dict[str, Any]) -> None:
+        scout_id = str(scout["id"])
+        previous = self._scouts.get(scout_id, {})
+        # Listings may omit fields (such as the webhook) that a detail provided
+        record = {**previous, **{k: scout[k] for k in _FIELDS if k in scout}, "id": scout_id}
+        if previous:
+            for word in _words(self._texts[scout_id]):
+                self._unpost(word, scout_id)
+        self._scouts[scout_id] = record
+        self._texts[scout_id] = text = _searchable(record)
+        for word in _words(text):
+            if word not in self._postings:
+                self._postings[word] = set()
+                self._vocabulary_dirty = True
+            self._postings[word].add(scout_id)
+
+    def _remove(self, scout_id: str) -> None:
+        if self._scouts.pop(scout_id, None) is not None:
+            for word in _words(self._texts.pop(scout_id)):
+                self._unpost(word, scout_id)
+
+    def _unpost(self, word: str, scout_id: str) -> None:
+        posting = self._postings.get(word)
+        if posting is not None:
+            posting.discard(scout_id)
+            if not posting:
+                del self._postings[word]
+                self._vocabulary_dirty = True
+
+    def _match(self, text: str) -> list[str]:
+        """Ids of scouts matching every search term, in index order."""
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+        matched: set[str] | None = None
+        for term in text.lower().split():
+            ids = self._term_ids(term)
+            matched = ids if matched is None else matched & ids
+            if not matched:
+                return []
+        return [i for i in self._scouts if i in (matched or ())]
+
+    def _term_ids(self, term: str) -> set[str]:
+        ids: set[str] = set()
+        if term in self._scouts:
+            ids.add(term)
+        words = _WORD.findall(term)
+        if len(words) == 1 and words[0] == term:
+            start = bisect.bisect_left(self._vocabulary, term)
+            for word in self._vocabulary[start:]:
+                if not word.startswith(term):
+                    break
+                ids |= self._postings[word]
+        if not ids:
+            # Not a word prefix (e.g. "$1.50" or the middle of a word)
+            ids = {i for i, text in self._texts.items() if term in text}
+        return ids
+
+    def _load(self) -> None:
+        assert self.path is not None
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            scouts = data["scouts"]
+            refreshed_at = data.get("refreshed_at")
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Cannot read scout index %s: %s", self.path, e)
+            return
+        with self._lock:
+            for scout in scouts:
+                if isinstance(scout, dict) and scout.get("id"):
+                    self._upsert(scout)
+            self.refreshed_at = float(refreshed_at) if refreshed_at is not None else None
+
+
+_default_index: ScoutIndex | None = None
+
+
+def default_scout_index() -> ScoutIndex:
+    """Return the process-wide scout index, configured from the environment on first use."""
+    global _default_index
+    if _default_index is None:
+        _default_index = ScoutIndex.from_env()
+    return _default_index
@@ -0,0 +1,358 @@
+"""HTTP listener that stores scout webhook payloads (yutori-mcp ingest).
+
+A scout created with a webhook_url and webhook_format "scout" POSTs each
+new update to that URL as JSON. `yutori-mcp ingest` accepts those POSTs on
+any path, validates them and appends the updates to the local update store
+(see store.py), which the server then answers get_scout_updates from
+without polling. Webhook URLs must use https://, so expose the listener
+through a TLS-terminating proxy or tunnel. With YUTORI_MCP_INGEST_TOKEN
+set, a request must carry the token in the `token` query parameter or as
+an `Authorization: Bearer` header.
+
+Request threads only parse and validate; accepted updates go onto a
+bounded queue (answered 202, or 503 when full so the sender retries), and
+one writer thread stores them in batches of up to YUTORI_MCP_INGEST_BATCH
+per transaction, so a burst of deliveries costs a few SQLite commits.
+Redelivered updates (same scout and update id) are stored once.
+
+A payload is an object naming the scout (scout_id, task_id, or a scout
+object with an id) and carrying its update(s) as `update`, `updates`, or
+update fields at the top level.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import logging
+import queue
+import signal
+import threading
+import time
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from .config import env_float, env_int, env_str
+from .store import StoredUpdate, UpdateStore
+from .subscriptions import parse_timestamp
+
+logger = logging.getLogger(__name__)
+
+# Largest request body accepted
+MAX_BODY_BYTES = 1 << 20
+
+# Scout fields a payload may carry, kept for the scout index
+_SCOUT_FIELDS = ("display_name", "query", "status", "output_interval", "next_output_timestamp", "webhook_url")
+
+# Top-level keys that describe the delivery rather than the update
+_ENVELOPE_KEYS = frozenset({"scout_id", "task_id", "scout", "update", "updates", "event", "type", *_SCOUT_FIELDS})
+
+_STOP = object()
+
+
+class PayloadError(ValueError):
+    """Raised for a webhook payload that cannot be stored."""
+
+
+def parse_payload(payload: Any, received_at: float | None = None) -> list[StoredUpdate]:
+    """Validate a scout-format webhook payload and return the updates it carries."""
+    received_at = time.time() if received_at is None else received_at
+    if not isinstance(payload, dict):
+        raise PayloadError("payload must be a JSON object")
+    scout = payload.get("scout") if isinstance(payload.get("scout"), dict) else {}
+    scout_id = payload.get("scout_id") or payload.get("task_id") or scout.get("id")
+    if not isinstance(scout_id, str) or not scout_id.strip() or len(scout_id) > 200:
+        raise PayloadError("payload must name the scout (scout_id, task_id or scout.id)")
+    fields = {k: v for k, v in {**payload, **scout}.items() if k in _SCOUT_FIELDS and v is not None}
+
+    if "updates" in payload:
+        updates = payload["updates"]
+        if not isinstance(updates, list) or not updates:
+            raise PayloadError("updates must be a non-empty list")
+    elif "update" in payload:
+        updates = [payload["update"]]
+    else:
+        updates = [{k: v for k, v in payload.items() if k not in _ENVELOPE_KEYS}]
+
+    records = []
+    for update in updates:
+        _check_update(update)
+        update_id = update.get("id")
+        if update_id is None:
+            # Stable across redeliveries of the same update
+            digest = hashlib.sha256(json.dumps(update, sort_keys=True, default=str).encode()).hexdigest()
+            update_id = digest[:32]
+        created_at = parse_timestamp(update.get("created_at") or update.get("timestamp"))
+        if created_at is None:
+            created_at = received_at
+            update = {**update, "created_at": _iso(received_at)}
+        records.append(
+            StoredUpdate(scout_id.strip(), str(update_id), created_at, received_at, update, fields or None)
+        )
+    return records
+
+
+def _check_update(update: Any) -> None:
+    if not isinstance(update, dict):
+        raise PayloadError("each update must be a JSON object")
+    if not any(update.get(k) for k in ("content", "result", "findings", "sources", "output")):
+        raise PayloadError("update has no content, result, findings, sources or output")
+    for key, kind in (("content", str), ("findings", list), ("sources", list)):
+        if update.get(key) is not None and not isinstance(update[key], kind):
+            raise PayloadError(f"update {key} must be a {'string' if kind is str else 'list'}")
+    stamp = update.get("created_at") or update.get("timestamp")
+    if stamp is not None and parse_timestamp(stamp) is None:
+        raise PayloadError("update created_at/timestamp is not a timestamp")
+
+
+def _iso(timestamp: float) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(timestamp))
+
+
+class IngestQueue:
+    """Bounded queue of parsed updates, drained into the store in batches by one thread.
+
+    Args:
+        store: Where updates are written.
+        max_pending: Payloads waiting at most; offers beyond it are refused.
+        batch_size: Most updates written per transaction.
+        flush_interval: Seconds the writer waits to fill a batch.
+    """
+
+    def __init__(
+        self,
+        store: UpdateStore,
+        *,
+        max_pending: int = 10_000,
+        batch_size: int = 500,
+        flush_interval: float = 0.05,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.store = store
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._clock = clock
+        self._queue: queue.Queue[Any] = queue.Queue(max_pending)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self.received = 0
+        self.stored = 0
+        self.batches = 0
+        self.rejected = 0
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="yutori-ingest-writer", daemon=True)
+            self._thread.start()
+
+    def offer(self, records: list[StoredUpdate]) -> bool:
+        """Queue a payload's updates; False if the queue is full."""
+        try:
+            self._queue.put_nowait(records)
+        except queue.Full:
+            with self._lock:
+                self.rejected += 1
+            return False
+        with self._lock:
+            self.received += len(records)
+        return True
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until everything queued so far is stored; False on timeout."""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    def close(self) -> None:
+        """Store what is queued, then stop the writer."""
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "received": self.received,
+                "stored": self.stored,
+                "batches": self.batches,
+                "rejected": self.rejected,
+                "pending": self._queue.qsize(),
+            }
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is _STOP:
+                self._queue.task_done()
+                return
+            items, stop = [first], False
+            size = len(first)
+            deadline = self._clock() + self.flush_interval
+            while size < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - self._clock()))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    self._queue.task_done()
+                    break
+                items.append(item)
+                size += len(item)
+            try:
+                self.stored += self.store.add(record for records in items for record in records)
+                self.batches += 1
+            except Exception:
+                logger.exception("Cannot store %d webhook updates", size)
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+            if stop:
+                return
+
+
+class _IngestHandler(BaseHTTPRequestHandler):
+    server: IngestServer
+
+    def do_POST(self) -> None:
+        if not self.server.authorized(self):
+            self._reply(401, {"error": "missing or wrong ingest token"})
+            return
+        raw_length = self.headers.get("Content-Length")
+        if raw_length is None:
+            # Chunked bodies are not accepted
+            self._reply(411, {"error": "Content-Length is required"})
+            return
+        try:
+            length = int(raw_length)
+            if length < 0:
+                raise ValueError(raw_length)
+        except ValueError:
+            self._reply(400, {"error": "Content-Length is not a byte count"})
+            return
+        if length > MAX_BODY_BYTES:
+            self._reply(413, {"error": f"payload over {MAX_BODY_BYTES} bytes"})
+            return
+        try:
+            records = parse_payload(json.loads(self.rfile.read(length) or b"null"))
+        except (ValueError, UnicodeDecodeError) as e:
+            message = str(e) if isinstance(e, PayloadError) else "body is not valid JSON"
+            self._reply(400, {"error": message})
+            return
+        if not self.server.queue.offer(records):
+            self._reply(503, {"error": "ingest queue is full; retry later"}, retry_after=1)
+            return
+        self._reply(202, {"accepted": len(records)})
+
+    def do_GET(self) -> None:
+        if urlsplit(self.path).path.rstrip("/") != "/health":
+            self._reply(404, {"error": "not found"})
+            return
+        self._reply(200, {"status": "ok", **self.server.queue.stats()})
+
+    def _reply(self, status: int, body: dict[str, Any], retry_after: int | None = None) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if retry_after is not None:
+            self.send_header("Retry-After", str(retry_after))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("ingest: " + format, *args)
+
+
+class IngestServer(ThreadingHTTPServer):
+    """The webhook listener. Use as a context manager to run it in a background thread."""
+
+    daemon_threads = True
+    # Pending connections; a burst of deliveries arrives at once
+    request_queue_size = 128
+
+    def __init__(
+        self,
+        store: UpdateStore,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        token: str | None = None,
+        batch_size: int = 500,
+        flush_interval: float = 0.05,
+    ) -> None:
+        super().__init__((host, port), _IngestHandler)
+        self.token = token
+        self.queue = IngestQueue(store, batch_size=batch_size, flush_interval=flush_interval)
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def from_env(cls, store: UpdateStore, host: str, port: int) -> IngestServer:
+        return cls(
+            store,
+            host,
+            port,
+            token=env_str("INGEST_TOKEN") or None,
+            batch_size=max(1, env_int("INGEST_BATCH", 500)),
+            flush_interval=env_float("INGEST_FLUSH_INTERVAL", 0.05),
+        )
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def authorized(self, request: BaseHTTPRequestHandler) -> bool:
+        if not self.token:
+            return True
+        supplied = parse_qs(urlsplit(request.path).query).get("token", [""])[0]
+        header = request.headers.get("Authorization") or ""
+        if header.startswith("Bearer "):
+            supplied = header[len("Bearer ") :]
+        return hmac.compare_digest(supplied.encode(), self.token.encode())
+
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        self.queue.start()
+        try:
+            super().serve_forever(poll_interval)
+        finally:
+            self.queue.close()
+
+    def __enter__(self) -> IngestServer:
+        self._thread = threading.Thread(target=self.serve_forever, name="yutori-ingest", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.shutdown()
+        if self._thread is not None:
+            self._thread.join()
+        self.server_close()
+
+
+def _interrupt(signum: int, frame: Any) -> None:
+    raise KeyboardInterrupt
+
+
+def run_ingest(host: str, port: int, store_path: Path) -> None:
+    """Serve the webhook listener until interrupted (the `yutori-mcp ingest` command)."""
+    store = UpdateStore(store_path)
+    server = IngestServer.from_env(store, host, port)
+    # Stop like Ctrl-C, so queued updates are written first
+    signal.signal(signal.SIGTERM, _interrupt)
+    print(f"Receiving scout webhooks on {server.url} into {store_path}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        store.close()
@@ -0,0 +1,272 @@
+"""Opt-in memoization of completed research results.
+
+Near-identical research questions are common ("latest AI startup funding
+announcements"). With YUTORI_MCP_RESEARCH_MEMO enabled, the server
+remembers which research task each query launched, and when polling shows
+the task succeeded, stores its result under a normalized key of the query
+(case and whitespace folded, trailing punctuation dropped) plus location,
+timezone and output schema. A run_research_task call with max_age then
+returns a stored result no older than max_age instead of starting a new
+multi-minute task.
+
+Results are kept in memory, at most YUTORI_MCP_RESEARCH_MEMO_SIZE of them
+for YUTORI_MCP_RESEARCH_MEMO_TTL seconds. Setting YUTORI_MCP_RESEARCH_MEMO
+to a file path also appends them to that file (JSON lines), so server
+processes sharing the file share results. Appends and the compaction done
+at startup hold an exclusive lock on a sibling ``.lock`` file, so no
+process's results are lost to a concurrent rewrite.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .config import env_bool, env_float, env_int, env_str
+
+logger = logging.getLogger(__name__)
+
+# Research launches whose completion is still awaited, by task_id
+_MAX_PENDING = 1024
+
+_KEY_FIELDS = ("user_timezone", "user_location", "output_schema")
+
+
+def research_memo_key(query: str, kwargs: dict[str, Any]) -> str:
+    """Normalized identity of a research question."""
+    normalized = " ".join(query.lower().split()).rstrip(" ?!.")
+    return json.dumps([normalized, {k: kwargs.get(k) for k in _KEY_FIELDS}], sort_keys=True, default=str)
+
+
+@dataclass(frozen=True)
+class MemoEntry:
+    """A completed research result."""
+
+    result: dict[str, Any]
+    completed_at: float
+
+    def age(self, now: float | None = None) -> float:
+        return (time.time() if now is None else now) - self.completed_at
+
+
+class ResearchMemo:
+    """Thread-safe store of completed research results.
+
+    Args:
+        enabled: When False nothing is tracked or stored.
+        path: Optional file shared with other processes.
+        max_entries: Results kept; the least recently stored are dropped.
+        ttl: Seconds a result is kept.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        path: Path | None = None,
+        max_entries: int = 256,
+        ttl: float = 86400.0,
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.enabled = enabled
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, MemoEntry] = OrderedDict()
+        self._pending: OrderedDict[str, str] = OrderedDict()
+        self._read_offset = 0
+        self._file_signature: tuple[int, int, int] | None = None
+        self.hits = 0
+        self.misses = 0
+        if enabled and path is not None:
+            self._compact()
+
+    @classmethod
+    def from_env(cls) -> ResearchMemo:
+        raw = env_str("RESEARCH_MEMO")
+        if raw is None:
+            return cls(enabled=False)
+        flag = raw.strip().lower()
+        if flag in {"0", "false", "no", "off"}:
+            return cls(enabled=False)
+        path = None if env_bool("RESEARCH_MEMO") else Path(raw).expanduser()
+        return cls(
+            path=path,
+            max_entries=env_int("RESEARCH_MEMO_SIZE", 256),
+            ttl=env_float("RESEARCH_MEMO_TTL", 86400.0),
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: str, max_age: float) -> MemoEntry | None:
+        """Return the stored result for key if it is at most max_age seconds old."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            self._refresh()
+            entry = self._entries.get(key)
+            if entry is None or entry.age(self._clock()) > min(max_age, self.ttl):
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry
+
+    def track(self, task_id: str, key: str) -> None:
+        """Remember that task_id was launched for key, so its result can be stored."""
+        if not self.enabled or not task_id:
+            return
+        with self._lock:
+            self._pending[task_id] = key
+            while len(self._pending) > _MAX_PENDING:
+                self._pending.popitem(last=False)
+
+    def complete(self, task_id: str, result: dict[str, Any]) -> None:
+        """Store the result of a tracked task if it succeeded."""
+        if not self.enabled or result.get("status") != "succeeded":
+            return
+        with self._lock:
+            key = self._pending.pop(task_id, None)
+            if key is None:
+                return
+            entry = MemoEntry({**result, "task_id": result.get("task_id") or task_id}, self._clock())
+            self._store(key, entry)
+            if self.path is not None:
+                self._append(key, entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._pending.clear()
+
+    # -------------------------------------------------------------------------
+    # Internal (called with the lock held, except _compact)
+    # -------------------------------------------------------------------------
+
+    def _store(self, key: str, entry: MemoEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _append(self, key: str, entry: MemoEntry) -> None:
+        assert self.path is not None
+        line = json.dumps({"key": key, "completed_at": entry.completed_at, "result": entry.result}, default=str)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with _locked(self.path), self.path.open("a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except OSError as e:
+            logger.warning("Cannot write research memo %s: %s", self.path, e)
+
+    def _refresh(self) -> None:
+        """Load results other processes appended to the shared file since the last read."""
+        if self.path is None:
+            return
+        try:
+            with self.path.open("rb") as f:
+                # Stat the open file, so a concurrent replace cannot mix two files
+                st = os.fstat(f.fileno())
+                signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+                if signature == self._file_signature:
+                    return
+                replaced = self._file_signature is not None and st.st_ino != self._file_signature[2]
+                if replaced or st.st_size < self._read_offset:
+                    self._read_offset = 0  # rewritten by a compaction
+                f.seek(self._read_offset)
+                data = f.read()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.warning("Cannot read research memo %s: %s", self.path, e)
+            return
+        # Only consume complete lines; a writer may be mid-append
+        complete = data[: data.rfind(b"\n") + 1]
+        self._read_offset += len(complete)
+        self._file_signature = signature
+        now = self._clock()
+        for line in complete.decode("utf-8", errors="replace").splitlines():
+            try:
+                record = json.loads(line)
+                entry = MemoEntry(record["result"], float(record["completed_at"]))
+                key = record["key"]
+            except (ValueError, KeyError, TypeError):
+                continue
+            if entry.age(now) <= self.ttl:
+                self._store(key, entry)
+
+    def _compact(self) -> None:
+        """Load the shared file and rewrite it without expired or superseded results.
+
+        Holds the file lock throughout, so results other processes append
+        meanwhile wait and land in the rewritten file.
+        """
+        assert self.path is not None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with _locked(self.path), self._lock:
+                self._refresh()
+                if not self.path.exists():
+                    return
+                lines = [
+                    json.dumps({"key": k, "completed_at": e.completed_at, "result": e.result}, default=str)
+                    for k, e in self._entries.items()
+                ]
+                tmp = self.path.with_name(self.path.name + ".tmp")
+                tmp.write_text("".join(line + "\n" for line in lines), encoding="utf-8")
+                os.replace(tmp, self.path)
+                st = os.stat(self.path)
+                self._read_offset = st.st_size
+                self._file_signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+        except OSError as e:
+            logger.warning("Cannot compact research memo %s: %s", self.path, e)
+
+
+@contextmanager
+def _locked(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock shared by every process using path.
+
+    The lock is on a sibling file, since compaction replaces path itself.
+    """
+    with open(path.with_name(path.name + ".lock"), "a+b") as f:
+        if sys.platform == "win32":
+            import msvcrt
+
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+_default_memo: ResearchMemo | None = None
+
+
+def default_research_memo() -> ResearchMemo:
+    """Return the process-wide memo, configured from the environment on first use."""
+    global _default_memo
+    if _default_memo is None:
+        _default_memo = ResearchMemo.from_env()
+    return _default_memo
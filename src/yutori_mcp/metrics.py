@@ -0,0 +1,426 @@
+"""Per-tool metrics in Prometheus text format.
+
+A small, dependency-free registry of labelled counters and histograms.
+Tool calls are recorded by server.py, upstream HTTP attempts by the
+adapter; state owned by other components (retries, circuit breaker, rate
+limiter queues, response cache, request coalescing) and the process's
+resident memory are read at scrape time.
+
+The rendered text is served as the MCP resource METRICS_URI and, when
+YUTORI_MCP_METRICS_PORT is set, on http://127.0.0.1:<port>/metrics.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+METRICS_URI = "yutori://metrics"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+Labels = tuple[str, ...]
+# (name, type, help, [(labels, value), ...]) produced by a collector at render time
+Family = tuple[str, str, str, list[tuple[dict[str, str], float]]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    """Monotonic counter with a fixed set of label names."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        for labels, value in items:
+            yield f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}"
+
+
+class Histogram:
+    """Cumulative-bucket histogram with a fixed set of label names."""
+
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> None:
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # labels -> [per-bucket counts..., +Inf count], sum
+        self._counts: dict[Labels, list[int]] = {}
+        self._sums: dict[Labels, float] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(labels)
+            if counts is None:
+                counts = self._counts[labels] = [0] * (len(self.buckets) + 1)
+            counts[index] += 1
+            self._sums[labels] = self._sums.get(labels, 0.0) + value
+
+    def count(self, *labels: str) -> int:
+        return sum(self._counts.get(labels, ()))
+
+    def sum(self, *labels: str) -> float:
+        return self._sums.get(labels, 0.0)
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            items = sorted((labels, list(counts), self._sums[labels]) for labels, counts in self._counts.items())
+        for labels, counts, total in items:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_format_labels(self.label_names, labels, le)} {cumulative}"
+            label_text = _format_labels(self.label_names, labels)
+            yield f"{self.name}_sum{label_text} {_format_value(total)}"
+            yield f"{self.name}_count{label_text} {cumulative}"
+
+
+class Registry:
+    """A set of metrics plus collectors that produce samples at render time.
+
+    A collector is a callable returning Family tuples.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: list[Counter | Histogram] = []
+        self._collectors: list[Callable[[], Iterable[Family]]] = []
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        metric = Counter(name, help, labels)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(
+        self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        metric = Histogram(name, help, labels, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], Iterable[Family]]) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        for collector in self._collectors:
+            try:
+                families = list(collector())
+            except Exception:
+                logger.exception("Metrics collector failed")
+                continue
+            for name, kind, help, samples in families:
+                lines.append(f"# HELP {name} {help}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    label_text = _format_labels(tuple(labels), tuple(labels.values()))
+                    lines.append(f"{name}{label_text} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+tool_calls = registry.counter(
+    "yutori_mcp_tool_calls_total",
+    "Tool calls by outcome (ok, api_error, error, timeout, cancelled).",
+    ("tool", "outcome"),
+)
+tool_duration = registry.histogram(
+    "yutori_mcp_tool_duration_seconds",
+    "End-to-end tool call latency.",
+    ("tool",),
+)
+tool_phase_duration = registry.histogram(
+    "yutori_mcp_tool_phase_seconds",
+    "Tool call latency by phase: validate (argument parsing and routing), upstream (Yutori API "
+    "including retries and rate-limit waits) and format.",
+    ("tool", "phase"),
+)
+tool_response_bytes = registry.histogram(
+    "yutori_mcp_tool_response_bytes",
+    "Size of the text returned to the client.",
+    ("tool",),
+    buckets=SIZE_BUCKETS,
+)
+upstream_requests = registry.counter(
+    "yutori_mcp_upstream_requests_total",
+    "HTTP attempts against the Yutori API by operation and status code (or error type).",
+    ("operation", "status"),
+)
+
+
+def observe_tool(
+    tool: str,
+    outcome: str,
+    duration: float,
+    *,
+    phases: dict[str, float] | None = None,
+    response_bytes: int | None = None,
+) -> None:
+    """Record one completed (or abandoned) tool call."""
+    tool_calls.inc(tool, outcome)
+    tool_duration.observe(duration, tool)
+    for phase, seconds in (phases or {}).items():
+        tool_phase_duration.observe(seconds, tool, phase)
+    if response_bytes is not None:
+        tool_response_bytes.observe(response_bytes, tool)
+
+
+def _component_metrics() -> Iterable[Family]:
+    """Read counters owned by the resilience components."""
+    from .breaker import CLOSED, HALF_OPEN, OPEN, default_breaker
+    from .cache import default_cache
+    from .idempotency import default_task_deduplicator
+    from .memo import default_research_memo
+    from .prefetch import default_prefetcher
+    from .ratelimit import default_rate_limiter
+    from .retry import retry_stats
+    from .revalidate import default_revalidator
+    from .schedule import default_update_schedule
+    from .singleflight import default_singleflight
+
+    retries = retry_stats.snapshot()
+    yield (
+        "yutori_mcp_upstream_retries_total",
+        "counter",
+        "Retried upstream attempts by operation.",
+        [({"operation": op}, n) for op, n in sorted(retries["retries"].items())],
+    )
+    yield (
+        "yutori_mcp_upstream_retries_exhausted_total",
+        "counter",
+        "Calls that failed after using every retry attempt.",
+        [({"operation": op}, n) for op, n in sorted(retries["exhausted"].items())],
+    )
+
+    breaker = default_breaker().snapshot()
+    yield (
+        "yutori_mcp_circuit_state",
+        "gauge",
+        "1 for the circuit breaker's current state, 0 otherwise.",
+        [({"state": state}, 1 if state == breaker["state"] else 0) for state in (CLOSED, OPEN, HALF_OPEN)],
+    )
+    yield (
+        "yutori_mcp_circuit_rejected_total",
+        "counter",
+        "Calls rejected while the circuit was open.",
+        [({}, breaker["rejected"])],
+    )
+
+    yield (
+        "yutori_mcp_rate_limit_queue_depth",
+        "gauge",
+        "Callers waiting for a rate-limit token, by bucket.",
+        [({"bucket": b}, n) for b, n in sorted(default_rate_limiter().queue_depths().items())],
+    )
+
+    cache = default_cache()
+    yield (
+        "yutori_mcp_cache_lookups_total",
+        "counter",
+        "Response cache lookups by result.",
+        [({"result": "hit"}, cache.hits), ({"result": "miss"}, cache.misses)],
+    )
+    yield ("yutori_mcp_cache_entries", "gauge", "Responses held in the cache.", [({}, len(cache))])
+
+    flights = default_singleflight().snapshot()
+    yield (
+        "yutori_mcp_coalesced_requests_total",
+        "counter",
+        "Reads that shared another caller's in-flight request, by operation.",
+        [({"operation": op}, n) for op, n in sorted(flights["shared"].items())],
+    )
+
+    launches = default_task_deduplicator().snapshot()
+    yield (
+        "yutori_mcp_task_launches_deduplicated_total",
+        "counter",
+        "Task launches answered with an earlier identical launch's task, by operation.",
+        [({"operation": op}, n) for op, n in sorted(launches["deduplicated"].items())],
+    )
+
+    memo = default_research_memo()
+    if memo.enabled:
+        yield (
+            "yutori_mcp_research_memo_lookups_total",
+            "counter",
+            "Research memo lookups (run_research_task with max_age) by result.",
+            [({"result": "hit"}, memo.hits), ({"result": "miss"}, memo.misses)],
+        )
+        yield ("yutori_mcp_research_memo_entries", "gauge", "Completed research results held.", [({}, len(memo))])
+
+    prefetcher = default_prefetcher()
+    prefetch = prefetcher.snapshot()
+    # Warm-up issues prefetches through a prefetcher with both sources off
+    if prefetcher.enabled or prefetcher.next_page or prefetch["issued"]:
+        operations = sorted(prefetch["issued"])
+        yield (
+            "yutori_mcp_prefetches_total",
+            "counter",
+            "Background prefetches (after list_scouts, of the next updates page, and at warm-up) "
+            "by operation and fate (issued, used, wasted).",
+            [
+                ({"operation": op, "result": fate}, prefetch[fate].get(op, 0))
+                for op in operations
+                for fate in ("issued", "used", "wasted")
+            ],
+        )
+        yield (
+            "yutori_mcp_prefetch_hit_ratio",
+            "gauge",
+            "Fraction of issued prefetches that answered a tool call.",
+            [
+                ({"operation": op}, prefetch["used"].get(op, 0) / prefetch["issued"][op])
+                for op in operations
+            ],
+        )
+
+    revalidator = default_revalidator()
+    if revalidator.enabled or revalidator.offline:
+        counts = revalidator.snapshot()
+        yield (
+            "yutori_mcp_stale_reads_total",
+            "counter",
+            "Scout reads answered from the cache while revalidating or offline.",
+            [({}, counts["served"])],
+        )
+        yield (
+            "yutori_mcp_revalidations_total",
+            "counter",
+            "Background refreshes of cached reads by result.",
+            [
+                ({"result": "ok"}, counts["revalidations"] - counts["failures"]),
+                ({"result": "error"}, counts["failures"]),
+            ],
+        )
+
+    schedule = default_update_schedule()
+    if schedule.enabled:
+        counts = schedule.snapshot()
+        yield (
+            "yutori_mcp_scheduled_update_reads_total",
+            "counter",
+            "get_scout_updates reads answered from a page held until the next run, or fetched.",
+            [({"result": "held"}, counts["held"]), ({"result": "fetched"}, counts["fetched"])],
+        )
+        yield (
+            "yutori_mcp_scheduled_refreshes_total",
+            "counter",
+            "Background refreshes of scouts after their scheduled runs.",
+            [({}, counts["refreshes"])],
+        )
+
+
+def _resident_memory() -> tuple[float | None, float | None]:
+    """Return (current, peak) resident set size in bytes; current is None off Linux, peak off Unix."""
+    import os
+    import sys
+
+    try:
+        import resource
+    except ImportError:
+        # Windows has no resource module
+        peak = None
+    else:
+        peak = float(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+        # ru_maxrss is bytes on macOS and kilobytes elsewhere
+        peak = peak if sys.platform == "darwin" else peak * 1024
+    try:
+        with open("/proc/self/statm") as f:
+            current = float(int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE"))
+    except (OSError, ValueError, IndexError, AttributeError):
+        current = None
+    return current, peak
+
+
+def _process_metrics() -> Iterable[Family]:
+    current, peak = _resident_memory()
+    if current is not None:
+        yield ("process_resident_memory_bytes", "gauge", "Resident memory size in bytes.", [({}, current)])
+    if peak is not None:
+        yield ("process_max_resident_memory_bytes", "gauge", "Peak resident memory size in bytes.", [({}, peak)])
+
+
+registry.add_collector(_component_metrics)
+registry.add_collector(_process_metrics)
+
+
+def render() -> str:
+    """Return the process-wide metrics as Prometheus text."""
+    return registry.render()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # noqa: N802
+        if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        # stdout/stderr belong to the stdio transport; keep scrapes quiet
+        logger.debug("metrics: " + format, *args)
+
+
+def start_http_server(port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serve /metrics from a daemon thread; returns the server (call shutdown() to stop)."""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="yutori-mcp-metrics", daemon=True)
+    thread.start()
+    logger.info("Serving metrics on http://%s:%d/metrics", host, server.server_address[1])
+    return server
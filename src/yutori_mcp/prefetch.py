@@ -0,0 +1,259 @@
+"""Speculative prefetch of scout details and the next page of updates.
+
+Agents usually follow list_scouts with get_scout_detail (and often
+get_scout_updates) on a few of the listed scouts, one serial round trip at
+a time. With YUTORI_MCP_PREFETCH=<N>, a successful list_scouts schedules
+background reads of the first N listed scouts' details (and, with
+YUTORI_MCP_PREFETCH_UPDATES, their first updates page). The reads use an
+ordinary adapter, so they go through the shared rate limiter, circuit
+breaker and retries, on at most YUTORI_MCP_PREFETCH_WORKERS threads.
+
+With YUTORI_MCP_PREFETCH_NEXT_PAGE, a get_scout_updates page that has more
+updates also schedules a read of the next page (same scout, cursor and
+limit), since the model usually pages on right away.
+
+A prefetched response is served once to a matching tool call made within
+YUTORI_MCP_PREFETCH_TTL seconds. A matching call made while the prefetch
+is still running joins it through request coalescing (see singleflight.py).
+Prefetches that are never used are counted as wasted, so the hit rate can
+be read from the metrics.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .cache import cache_key
+from .config import env_bool, env_float, env_int
+
+if TYPE_CHECKING:
+    from .adapter import MCPClientAdapter
+
+logger = logging.getLogger(__name__)
+
+# Prefetched responses held at once; the oldest are dropped (as wasted)
+_MAX_RESULTS = 256
+
+# Seconds a background read may take, so a stuck prefetch cannot hold up shutdown
+_FETCH_DEADLINE = 10.0
+
+
+@dataclass(frozen=True)
+class _Prefetched:
+    value: dict[str, Any]
+    fetched_at: float
+    operation: str
+    resource_id: str | None
+
+
+def _default_adapter_factory() -> MCPClientAdapter:
+    from .adapter import MCPClientAdapter
+    from .revalidate import Revalidator
+
+    # A disabled prefetcher and revalidator, so background reads neither consume nor
+    # trigger prefetches and are not answered from the cache while revalidating
+    return MCPClientAdapter(deadline=_FETCH_DEADLINE, prefetcher=Prefetcher(), revalidator=Revalidator())
+
+
+class Prefetcher:
+    """Background warmer for the reads that usually follow list_scouts.
+
+    Args:
+        top_n: Listed scouts to prefetch; 0 disables prefetching.
+        updates: Also prefetch each scout's first updates page.
+        next_page: Prefetch the next page after serving an updates page with more.
+        ttl: Seconds a prefetched response may be served.
+        workers: Background threads.
+        adapter_factory: Creates the adapter used for background reads.
+    """
+
+    def __init__(
+        self,
+        top_n: int = 0,
+        *,
+        updates: bool = False,
+        next_page: bool = False,
+        ttl: float = 60.0,
+        workers: int = 2,
+        adapter_factory: Callable[[], MCPClientAdapter] = _default_adapter_factory,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.top_n = top_n
+        self.updates = updates
+        self.next_page = next_page
+        self.ttl = ttl
+        self.workers = max(1, workers)
+        self._adapter_factory = adapter_factory
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._results: OrderedDict[str, _Prefetched] = OrderedDict()
+        # key -> (operation, scout_id) of running prefetches
+        self._in_flight: dict[str, tuple[str, str | None]] = {}
+        # Running prefetches whose scout was modified; their responses are dropped
+        self._discard: set[str] = set()
+        self.issued: Counter[str] = Counter()
+        self.used: Counter[str] = Counter()
+        self.wasted: Counter[str] = Counter()
+
+    @classmethod
+    def from_env(cls) -> Prefetcher:
+        return cls(
+            top_n=max(0, env_int("PREFETCH", 0)),
+            updates=env_bool("PREFETCH_UPDATES"),
+            next_page=env_bool("PREFETCH_NEXT_PAGE"),
+            ttl=env_float("PREFETCH_TTL", 60.0),
+            workers=env_int("PREFETCH_WORKERS", 2),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.top_n > 0
+
+    def after_list(self, listing: dict[str, Any]) -> None:
+        """Schedule prefetches for the first top_n scouts of a list_scouts result."""
+        if not self.enabled:
+            return
+        scouts = listing.get("scouts") or []
+        ids = [str(s["id"]) for s in scouts[: self.top_n] if isinstance(s, dict) and s.get("id")]
+        for scout_id in ids:
+            self.prefetch("get_scout_detail", scout_id)
+        if self.updates:
+            for scout_id in ids:
+                self.prefetch("get_scout_updates", scout_id)
+
+    def after_updates(self, scout_id: str, kwargs: dict[str, Any], page: dict[str, Any]) -> None:
+        """Schedule a prefetch of the page after a get_scout_updates result.
+
+        kwargs are the call's (None-stripped) arguments; the next page keeps
+        its limit so it matches the model's follow-up call.
+        """
+        if not self.next_page or not isinstance(page, dict) or page.get("has_more") is not True:
+            return
+        cursor = page.get("next_cursor")
+        if not isinstance(cursor, str) or not cursor:
+            return
+        self.prefetch("get_scout_updates", scout_id, **{**kwargs, "cursor": cursor})
+
+    def prefetch(self, operation: str, *args: Any, **kwargs: Any) -> Future[dict[str, Any] | None] | None:
+        """Run an adapter read in the background so take() can serve it.
+
+        kwargs must be None-stripped, as the adapter passes them. Returns a
+        future of the response (None on failure), or None if that read is
+        already held or running.
+        """
+        key = cache_key(operation, args, kwargs)
+        with self._lock:
+            self._expire()
+            if key in self._results or key in self._in_flight:
+                return None
+            self._in_flight[key] = (operation, str(args[0]) if args else None)
+            self.issued[operation] += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="yutori-prefetch")
+            executor = self._executor
+        return executor.submit(self._fetch, key, operation, args, kwargs)
+
+    def take(self, key: str) -> dict[str, Any] | None:
+        """Return (once) a fresh prefetched response for key, or None.
+
+        A read whose prefetch is still running counts as used; it is
+        expected to join that request through the shared SingleFlight.
+        """
+        if not self._results and not self._in_flight:
+            return None
+        with self._lock:
+            self._expire()
+            entry = self._results.pop(key, None)
+            if entry is not None:
+                self.used[entry.operation] += 1
+                return entry.value
+            running = self._in_flight.get(key)
+            if running is not None:
+                self.used[running[0]] += 1
+        return None
+
+    def invalidate(self, resource_id: str) -> None:
+        """Drop prefetched responses for a scout that was just modified."""
+        with self._lock:
+            for key in [k for k, e in self._results.items() if e.resource_id == resource_id]:
+                del self._results[key]
+            self._discard.update(k for k, (_, scout_id) in self._in_flight.items() if scout_id == resource_id)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            self._expire()
+            return {
+                "issued": dict(self.issued),
+                "used": dict(self.used),
+                "wasted": dict(self.wasted),
+                "in_flight": len(self._in_flight),
+                "held": len(self._results),
+            }
+
+    def wait_idle(self, timeout: float = 5.0) -> bool:
+        """Block until no prefetch is running (used by tests)."""
+        deadline = time.monotonic() + timeout
+        while self._in_flight:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    # -------------------------------------------------------------------------
+    # Internal
+    # -------------------------------------------------------------------------
+
+    def _fetch(
+        self, key: str, operation: str, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        try:
+            with self._adapter_factory() as adapter:
+                value = getattr(adapter, operation)(*args, **kwargs)
+                if adapter.stale_age is not None:
+                    # Served from the cache because the circuit is open: not worth holding
+                    value = None
+        except Exception as e:
+            # Speculative: the real call will surface any error
+            logger.debug("Prefetch %s%s failed: %s", operation, args, e)
+            value = None
+        with self._lock:
+            del self._in_flight[key]
+            if key in self._discard:
+                self._discard.discard(key)
+                value = None
+            if value is not None:
+                resource_id = str(args[0]) if args else None
+                self._results[key] = _Prefetched(value, self._clock(), operation, resource_id)
+                self._results.move_to_end(key)
+                while len(self._results) > _MAX_RESULTS:
+                    _, dropped = self._results.popitem(last=False)
+                    self.wasted[dropped.operation] += 1
+        return value
+
+    def _expire(self) -> None:
+        """Drop responses older than the TTL; called with the lock held."""
+        cutoff = self._clock() - self.ttl
+        for key, entry in list(self._results.items()):
+            if entry.fetched_at > cutoff:
+                break
+            del self._results[key]
+            self.wasted[entry.operation] += 1
+
+
+_default_prefetcher: Prefetcher | None = None
+
+
+def default_prefetcher() -> Prefetcher:
+    """Return the process-wide prefetcher, configured from the environment on first use."""
+    global _default_prefetcher
+    if _default_prefetcher is None:
+        _default_prefetcher = Prefetcher.from_env()
+    return _default_prefetcher
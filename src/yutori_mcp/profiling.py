@@ -0,0 +1,166 @@
+"""Opt-in profiling of individual tool calls.
+
+Set YUTORI_MCP_PROFILE to a comma-separated list of tool names (or ``*``)
+and each matching call is profiled in the worker thread that runs it. One
+file per call is written to YUTORI_MCP_PROFILE_DIR, named
+``<timestamp>-<tool>-<duration>ms`` with a ``.prof`` (cProfile/pstats) or
+``.html`` (pyinstrument) suffix. Only the newest YUTORI_MCP_PROFILE_KEEP
+files are kept.
+
+The sampling profiler pyinstrument is used when installed, unless
+YUTORI_MCP_PROFILER=cprofile. Only one call is profiled at a time;
+concurrent matching calls run unprofiled.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import importlib.util
+import logging
+import re
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from .config import env_int, env_str
+
+logger = logging.getLogger(__name__)
+
+CPROFILE = "cprofile"
+PYINSTRUMENT = "pyinstrument"
+
+DEFAULT_PROFILE_DIR = Path(tempfile.gettempdir()) / "yutori-mcp-profiles"
+# Names of the files this module writes; only these are ever pruned
+_PROFILE_NAME = re.compile(r"^\d{8}T\d{6}\.\d{6}-[A-Za-z0-9_.-]+-\d+ms\.(prof|html)$")
+
+
+def _resolve_backend(name: str) -> str:
+    name = name.strip().lower() or "auto"
+    if name == "auto":
+        return PYINSTRUMENT if importlib.util.find_spec("pyinstrument") else CPROFILE
+    if name == PYINSTRUMENT and not importlib.util.find_spec("pyinstrument"):
+        logger.warning("YUTORI_MCP_PROFILER=pyinstrument but pyinstrument is not installed; using cProfile")
+        return CPROFILE
+    if name not in (CPROFILE, PYINSTRUMENT):
+        logger.warning("Unknown YUTORI_MCP_PROFILER %r; using cProfile", name)
+        return CPROFILE
+    return name
+
+
+class CallProfiler:
+    """Profiles matching tool calls and writes one file per call.
+
+    Args:
+        tools: Tool names to profile; None profiles every tool, empty disables.
+        directory: Where profile files are written (created on demand).
+        keep: Maximum number of profile files kept in directory.
+        backend: CPROFILE or PYINSTRUMENT.
+    """
+
+    def __init__(
+        self,
+        tools: frozenset[str] | None = frozenset(),
+        directory: Path = DEFAULT_PROFILE_DIR,
+        keep: int = 50,
+        backend: str = CPROFILE,
+    ) -> None:
+        self.tools = tools
+        self.directory = Path(directory)
+        self.keep = keep
+        self.backend = backend
+        self._active = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> CallProfiler:
+        raw = env_str("PROFILE", "").strip()
+        names = {t.strip() for t in raw.split(",") if t.strip()}
+        tools = None if "*" in names or raw.lower() == "all" else frozenset(names)
+        return cls(
+            tools=tools,
+            directory=Path(env_str("PROFILE_DIR", str(DEFAULT_PROFILE_DIR))).expanduser(),
+            keep=max(1, env_int("PROFILE_KEEP", 50)),
+            backend=_resolve_backend(env_str("PROFILER", "auto")) if tools != frozenset() else CPROFILE,
+        )
+
+    def wants(self, tool: str) -> bool:
+        return self.tools is None or tool in self.tools
+
+    @contextmanager
+    def profile(self, tool: str) -> Iterator[None]:
+        """Profile the block if tool matches and no other call is being profiled."""
+        if not self.wants(tool) or not self._active.acquire(blocking=False):
+            yield
+            return
+        try:
+            try:
+                profiler = self._start()
+            except Exception:
+                # e.g. another profiler already owns the interpreter hook
+                logger.exception(f"Could not start profiler for {tool}")
+                profiler = None
+            start = time.perf_counter()
+            try:
+                yield
+            finally:
+                if profiler is not None:
+                    try:
+                        self._save(profiler, tool, time.perf_counter() - start)
+                    except Exception:
+                        logger.exception(f"Failed to write profile for {tool}")
+        finally:
+            self._active.release()
+
+    def _start(self) -> Any:
+        if self.backend == PYINSTRUMENT:
+            from pyinstrument import Profiler
+
+            profiler = Profiler()
+            profiler.start()
+            return profiler
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+
+    def _save(self, profiler: Any, tool: str, duration: float) -> Path:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%dT%H%M%S.%f")
+        safe_tool = re.sub(r"[^A-Za-z0-9_.-]", "_", tool)
+        stem = f"{stamp}-{safe_tool}-{duration * 1000:.0f}ms"
+        if self.backend == PYINSTRUMENT:
+            profiler.stop()
+            path = self.directory / f"{stem}.html"
+            path.write_text(profiler.output_html(), encoding="utf-8")
+        else:
+            profiler.disable()
+            path = self.directory / f"{stem}.prof"
+            profiler.dump_stats(path)
+        logger.info("Wrote profile %s", path)
+        self._prune()
+        return path
+
+    def _prune(self) -> None:
+        """Delete the oldest profile files beyond keep, leaving any other files alone."""
+        files = sorted(p for p in self.directory.iterdir() if _PROFILE_NAME.match(p.name))
+        for old in files[: max(0, len(files) - self.keep)]:
+            old.unlink(missing_ok=True)
+
+
+_default_profiler: CallProfiler | None = None
+
+
+def default_profiler() -> CallProfiler:
+    """Return the process-wide call profiler, configured from the environment on first use."""
+    global _default_profiler
+    if _default_profiler is None:
+        _default_profiler = CallProfiler.from_env()
+    return _default_profiler
+
+
+def profile(tool: str) -> Any:
+    """Context manager profiling a tool call if YUTORI_MCP_PROFILE selects it."""
+    return default_profiler().profile(tool)
@@ -0,0 +1,165 @@
+"""Client-side token-bucket rate limiting for Yutori API calls.
+
+One process-wide RateLimiter is shared by every tool call. Requests are split
+into three buckets (reads, task launches, scout writes) so a burst of polling
+cannot starve task creation. When a bucket is empty, callers queue (sleep
+until their reserved token is due) instead of failing, which keeps throughput
+at the sustainable rate rather than alternating between bursts and 429s.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+
+from .config import env_float
+
+READS = "reads"
+TASKS = "tasks"
+SCOUT_WRITES = "scout_writes"
+
+# Bucket for each non-read adapter operation; everything else is a read
+_OPERATION_BUCKETS = {
+    "run_browsing_task": TASKS,
+    "run_research_task": TASKS,
+    "create_scout": SCOUT_WRITES,
+    "edit_scout": SCOUT_WRITES,
+    "delete_scout": SCOUT_WRITES,
+}
+
+# (rate per second, burst) defaults and the env var prefix for each bucket
+_BUCKET_DEFAULTS = {
+    READS: ("READ", 10.0, 20.0),
+    TASKS: ("TASK", 1.0, 5.0),
+    SCOUT_WRITES: ("SCOUT_WRITE", 2.0, 5.0),
+}
+
+
+class RateLimitTimeout(Exception):
+    """Raised when a token would not become available within the caller's timeout."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket with FIFO queueing.
+
+    acquire() reserves a token immediately, letting the balance go negative,
+    and then sleeps until the reservation is covered. Reservations are handed
+    out in arrival order, so waiters are served fairly without a condition
+    variable. A rate of 0 disables limiting.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = clock()
+        self._waiting = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of callers currently waiting for a token."""
+        return self._waiting
+
+    def acquire(
+        self, timeout: float | None = None, sleep: Callable[[float], None] | None = None
+    ) -> float:
+        """Take one token, blocking until it is available.
+
+        Args:
+            timeout: Maximum seconds to wait.
+            sleep: Override for the wait, e.g. one that is interruptible.
+
+        Returns:
+            Seconds spent waiting.
+
+        Raises:
+            RateLimitTimeout: If the wait would exceed timeout.
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait = max(0.0, (1 - self._tokens) / self.rate)
+            if timeout is not None and wait > timeout:
+                raise RateLimitTimeout(
+                    f"Client-side rate limit: next request slot in {wait:.1f}s exceeds {timeout:.1f}s"
+                )
+            self._tokens -= 1
+            if wait:
+                self._waiting += 1
+
+        if wait:
+            try:
+                (sleep or self._sleep)(wait)
+            finally:
+                with self._lock:
+                    self._waiting -= 1
+        return wait
+
+
+class RateLimiter:
+    """Set of token buckets keyed by request category."""
+
+    def __init__(self, buckets: dict[str, TokenBucket]) -> None:
+        self.buckets = buckets
+
+    @classmethod
+    def from_env(cls) -> RateLimiter:
+        """Build buckets from YUTORI_MCP_{READ,TASK,SCOUT_WRITE}_{RATE,BURST}."""
+        return cls(
+            {
+                name: TokenBucket(
+                    rate=env_float(f"{prefix}_RATE", rate),
+                    burst=env_float(f"{prefix}_BURST", burst),
+                )
+                for name, (prefix, rate, burst) in _BUCKET_DEFAULTS.items()
+            }
+        )
+
+    @classmethod
+    def unlimited(cls) -> RateLimiter:
+        """A limiter whose buckets never block."""
+        return cls({name: TokenBucket(rate=0, burst=1) for name in _BUCKET_DEFAULTS})
+
+    def acquire(
+        self,
+        operation: str,
+        timeout: float | None = None,
+        sleep: Callable[[float], None] | None = None,
+    ) -> float:
+        """Take a token from the bucket for an adapter operation."""
+        return self.buckets[bucket_for(operation)].acquire(timeout, sleep)
+
+    def queue_depths(self) -> dict[str, int]:
+        """Current number of waiting callers per bucket."""
+        return {name: bucket.queue_depth for name, bucket in self.buckets.items()}
+
+
+def bucket_for(operation: str) -> str:
+    """Return the bucket name an adapter operation draws from."""
+    return _OPERATION_BUCKETS.get(operation, READS)
+
+
+_default_limiter: RateLimiter | None = None
+
+
+def default_rate_limiter() -> RateLimiter:
+    """Return the process-wide limiter, read from the environment on first use."""
+    global _default_limiter
+    if _default_limiter is None:
+        _default_limiter = RateLimiter.from_env()
+    return _default_limiter
@@ -0,0 +1,195 @@
+"""Retry policy for Yutori API calls.
+
+Transient failures (429, 5xx, network errors) are retried inside the server
+with exponential backoff and full jitter, honoring Retry-After, so a brief
+upstream blip costs milliseconds instead of a new LLM turn.
+
+Reads are idempotent and retried on any transient failure. Writes are only
+retried when the request is known not to have been executed (429 responses
+and connection failures), since a 5xx after a create may still have launched
+a task.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, TypeVar
+
+import httpx
+
+from .config import env_float, env_int
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Status codes worth retrying for idempotent requests
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# Status codes that guarantee the request was not executed
+SAFE_WRITE_STATUSES = frozenset({429})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Backoff settings shared by all adapter calls.
+
+    Attributes:
+        read_attempts: Total attempts (including the first) for idempotent reads.
+        write_attempts: Total attempts for writes; 1 disables write retries.
+        base_delay: Backoff base in seconds; attempt n sleeps up to base * 2**n.
+        max_delay: Upper bound for a single backoff sleep, in seconds.
+        deadline: Total seconds a call may spend across all attempts and sleeps.
+    """
+
+    read_attempts: int = 4
+    write_attempts: int = 2
+    base_delay: float = 0.25
+    max_delay: float = 8.0
+    deadline: float = 30.0
+
+    @classmethod
+    def from_env(cls) -> RetryPolicy:
+        """Build a policy from YUTORI_MCP_RETRY_* environment variables."""
+        return cls(
+            read_attempts=max(1, env_int("RETRY_ATTEMPTS", cls.read_attempts)),
+            write_attempts=max(1, env_int("WRITE_RETRY_ATTEMPTS", cls.write_attempts)),
+            base_delay=env_float("RETRY_BASE_DELAY", cls.base_delay),
+            max_delay=env_float("RETRY_MAX_DELAY", cls.max_delay),
+            deadline=env_float("CALL_DEADLINE", cls.deadline),
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number attempt (0-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+class RetryStats:
+    """Thread-safe counters describing retry behaviour, keyed by operation."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.retries: Counter[str] = Counter()
+        self.exhausted: Counter[str] = Counter()
+        self.sleep_seconds = 0.0
+
+    def record_retry(self, operation: str, delay: float) -> None:
+        with self._lock:
+            self.retries[operation] += 1
+            self.sleep_seconds += delay
+
+    def record_exhausted(self, operation: str) -> None:
+        with self._lock:
+            self.exhausted[operation] += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a copy of the counters."""
+        with self._lock:
+            return {
+                "retries": dict(self.retries),
+                "exhausted": dict(self.exhausted),
+                "sleep_seconds": self.sleep_seconds,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.retries.clear()
+            self.exhausted.clear()
+            self.sleep_seconds = 0.0
+
+
+retry_stats = RetryStats()
+
+_default_policy: RetryPolicy | None = None
+
+
+def default_retry_policy() -> RetryPolicy:
+    """Return the process-wide policy, read from the environment on first use."""
+    global _default_policy
+    if _default_policy is None:
+        _default_policy = RetryPolicy.from_env()
+    return _default_policy
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def is_retryable(exc: BaseException, idempotent: bool) -> bool:
+    """Whether exc is a transient failure that is safe to retry."""
+    status_code = getattr(exc, "status_code", None)
+    if isinstance(status_code, int):
+        statuses = RETRYABLE_STATUSES if idempotent else SAFE_WRITE_STATUSES
+        return status_code in statuses
+    if isinstance(exc, httpx.ConnectError):
+        return True
+    return idempotent and isinstance(exc, httpx.TransportError)
+
+
+def call_with_retry(
+    fn: Callable[[], T],
+    *,
+    operation: str,
+    idempotent: bool,
+    policy: RetryPolicy,
+    stats: RetryStats = retry_stats,
+    sleep: Callable[[float], None] = time.sleep,
+) -> T:
+    """Call fn, retrying transient failures according to policy.
+
+    The delay before each retry is the server's Retry-After when present,
+    otherwise full-jitter exponential backoff. The last error is re-raised
+    when attempts run out or the next sleep would overrun the call deadline.
+    """
+    attempts = policy.read_attempts if idempotent else policy.write_attempts
+    deadline_at = time.monotonic() + policy.deadline
+    attempt = 0
+    while True:
+        try:
+            return fn()
+        except Exception as e:
+            attempt += 1
+            if not is_retryable(e, idempotent):
+                raise
+            if attempt >= attempts:
+                stats.record_exhausted(operation)
+                raise
+
+            retry_after = getattr(e, "retry_after", None)
+            delay = retry_after if retry_after is not None else policy.backoff(attempt - 1)
+            if time.monotonic() + delay > deadline_at:
+                stats.record_exhausted(operation)
+                raise
+
+            logger.info(
+                "Retrying %s after %s (attempt %d/%d, sleeping %.2fs)",
+                operation,
+                e,
+                attempt + 1,
+                attempts,
+                delay,
+            )
+            stats.record_retry(operation, delay)
+            sleep(delay)
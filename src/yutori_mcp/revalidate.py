@@ -0,0 +1,176 @@
+"""Stale-while-revalidate and offline reads of scouts.
+
+With YUTORI_MCP_STALE_WHILE_REVALIDATE=<seconds>, a list_scouts,
+get_scout_detail or get_scout_updates call whose response is in the
+response cache (see cache.py) and at most that old is answered from it
+immediately, noting its age, and the same read is repeated in the
+background to refresh the cache for the next call. A slow or failing API
+then no longer shows in those calls' latency.
+
+With YUTORI_MCP_OFFLINE, no request is made at all: every read is answered
+from the response cache, however old, and calls without a stored response
+or that would change something fail. The cache is filled from the snapshot
+file (YUTORI_MCP_CACHE_SNAPSHOT, see warmup.py) before the first read, so
+an offline session serves what earlier sessions fetched.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from .cache import CacheEntry, ResponseCache
+from .config import env_bool, env_float, env_int
+
+if TYPE_CHECKING:
+    from .adapter import MCPClientAdapter
+
+logger = logging.getLogger(__name__)
+
+# Reads that may be answered stale while they are refreshed
+REVALIDATED_OPERATIONS = frozenset({"list_scouts", "get_scout_detail", "get_scout_updates"})
+
+# Seconds a background read may take
+_FETCH_DEADLINE = 10.0
+
+
+def _default_adapter_factory() -> MCPClientAdapter:
+    from .adapter import MCPClientAdapter
+    from .prefetch import Prefetcher
+
+    # A disabled revalidator, so background reads go to the API
+    return MCPClientAdapter(deadline=_FETCH_DEADLINE, prefetcher=Prefetcher(), revalidator=Revalidator())
+
+
+def _load_snapshot() -> None:
+    from .warmup import default_warmup
+
+    default_warmup().load_snapshot()
+
+
+class Revalidator:
+    """Serves cached scout reads while refreshing them, or serves only cached reads offline.
+
+    Args:
+        max_age: Oldest cached response (seconds) answered while it is
+            refreshed; 0 disables stale-while-revalidate.
+        offline: Answer reads only from the cache and refuse everything else.
+        workers: Background refresh threads.
+        adapter_factory: Creates the adapter used for background refreshes.
+        load_store: Called once before the first offline read to fill the cache.
+    """
+
+    def __init__(
+        self,
+        max_age: float = 0.0,
+        *,
+        offline: bool = False,
+        workers: int = 2,
+        adapter_factory: Callable[[], MCPClientAdapter] = _default_adapter_factory,
+        load_store: Callable[[], None] = _load_snapshot,
+    ) -> None:
+        self.max_age = max_age
+        self.offline = offline
+        self.workers = workers
+        self._adapter_factory = adapter_factory
+        self._load_store = load_store
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._in_flight: set[str] = set()
+        self._store_loaded = False
+        self.served = 0
+        self.revalidations = 0
+        self.failures = 0
+
+    @classmethod
+    def from_env(cls) -> Revalidator:
+        return cls(
+            max(0.0, env_float("STALE_WHILE_REVALIDATE", 0.0)),
+            offline=env_bool("OFFLINE"),
+            workers=max(1, env_int("REVALIDATE_WORKERS", 2)),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_age > 0
+
+    def serve(self, operation: str, key: str, cache: ResponseCache) -> CacheEntry | None:
+        """Return a cached response young enough to answer this read while it is refreshed."""
+        if not self.enabled or operation not in REVALIDATED_OPERATIONS:
+            return None
+        entry = cache.get(key)
+        if entry is None or entry.age() > self.max_age:
+            return None
+        with self._lock:
+            self.served += 1
+        return entry
+
+    def stored(self, key: str, cache: ResponseCache) -> CacheEntry | None:
+        """Offline mode: the stored response for this read, of any age."""
+        with self._lock:
+            load = not self._store_loaded
+            self._store_loaded = True
+        if load:
+            try:
+                self._load_store()
+            except Exception as e:
+                logger.warning("Cannot load the offline store: %s", e)
+        entry = cache.get(key)
+        if entry is not None:
+            with self._lock:
+                self.served += 1
+        return entry
+
+    def revalidate(self, key: str, operation: str, *args: Any, **kwargs: Any) -> bool:
+        """Repeat a read in the background to refresh its cached response; False if already running."""
+        with self._lock:
+            if key in self._in_flight:
+                return False
+            self._in_flight.add(key)
+            self.revalidations += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="yutori-revalidate")
+            executor = self._executor
+        executor.submit(self._refresh, key, operation, args, kwargs)
+        return True
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return {"served": self.served, "revalidations": self.revalidations, "failures": self.failures}
+
+    def wait_idle(self, timeout: float = 5.0) -> bool:
+        """Block until no refresh is running (used by tests)."""
+        deadline = time.monotonic() + timeout
+        while self._in_flight:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def _refresh(self, key: str, operation: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        try:
+            # The adapter's read stores the fresh response in the shared cache
+            with self._adapter_factory() as adapter:
+                getattr(adapter, operation)(*args, **kwargs)
+        except Exception as e:
+            logger.debug("Revalidation of %s failed: %s", operation, e)
+            with self._lock:
+                self.failures += 1
+        finally:
+            with self._lock:
+                self._in_flight.discard(key)
+
+
+_default_revalidator: Revalidator | None = None
+
+
+def default_revalidator() -> Revalidator:
+    """Return the process-wide revalidator, configured from the environment on first use."""
+    global _default_revalidator
+    if _default_revalidator is None:
+        _default_revalidator = Revalidator.from_env()
+    return _default_revalidator
@@ -0,0 +1,311 @@
+"""Schedule-aware reads of scout updates.
+
+A scout's updates only change when it runs, and its next_output_timestamp
+says when that will be. With YUTORI_MCP_SCHEDULE_UPDATES, a fetched
+get_scout_updates page is held until the scout's next run, and repeated
+reads of it are answered without a request (the response notes when the
+page was fetched). A first page is only held once it contains an update
+from the previous run, created at or after that run's scheduled time, so
+a run that publishes late is never hidden; pages read with a cursor are
+held when fetched after the previous run. The schedule comes from
+the scout index (see index.py), so pages are held only for active scouts
+whose output_interval and next run are known.
+
+One background thread keeps held scouts current from a priority queue
+ordered by due time. YUTORI_MCP_SCHEDULE_GRACE seconds after a scout's
+expected run it re-reads the scout's detail and those updates pages that
+the run made outdated, so the next tool call is again answered locally.
+While a run's update has not appeared, its pages are fetched on every
+read and the scout is retried with doubling delays of up to
+YUTORI_MCP_SCHEDULE_MAX_INTERVAL seconds. A scout whose updates no tool
+call has read since its last refresh is dropped instead of refreshed, so
+background reads never outnumber the model's.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from .config import env_bool, env_float
+from .subscriptions import parse_timestamp
+
+if TYPE_CHECKING:
+    from .adapter import MCPClientAdapter
+
+logger = logging.getLogger(__name__)
+
+# Scouts tracked at once; the least recently read are dropped
+_MAX_SCOUTS = 1000
+
+# Seconds a background read may take
+_FETCH_DEADLINE = 10.0
+
+
+def newest_update_time(page: dict[str, Any]) -> float | None:
+    """Epoch seconds of the newest update in a get_scout_updates page."""
+    updates = page.get("updates") or []
+    if not updates or not isinstance(updates[0], dict):
+        return None
+    newest = updates[0]
+    return parse_timestamp(newest.get("created_at") or newest.get("timestamp"))
+
+
+def _default_adapter_factory() -> MCPClientAdapter:
+    from .adapter import MCPClientAdapter
+    from .prefetch import Prefetcher
+    from .revalidate import Revalidator
+
+    # A disabled revalidator, so background reads go to the API
+    return MCPClientAdapter(deadline=_FETCH_DEADLINE, prefetcher=Prefetcher(), revalidator=Revalidator())
+
+
+@dataclass
+class _Page:
+    kwargs: dict[str, Any]
+    value: dict[str, Any]
+    fetched_at: float
+    # Served without a request until this time (the scout's next run), if set
+    until: float | None = None
+
+
+@dataclass
+class _Scout:
+    pages: dict[str, _Page] = field(default_factory=dict)
+    # Refreshes since the awaited run's update was last missing
+    attempts: int = 0
+    due: float = 0.0
+    # Read by a tool call since the last refresh
+    wanted: bool = True
+
+
+class UpdateSchedule:
+    """Holds updates pages until each scout's next run and refreshes them after it.
+
+    Args:
+        enabled: Hold pages; when False, lookup() always misses and record() does nothing.
+        grace: Seconds after a scheduled run before its update is expected.
+        max_interval: Longest delay between retries of a scout whose update is late.
+        adapter_factory: Creates the adapter used for background refreshes.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        *,
+        grace: float = 120.0,
+        max_interval: float = 3600.0,
+        adapter_factory: Callable[[], MCPClientAdapter] = _default_adapter_factory,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.enabled = enabled
+        self.grace = grace
+        self.max_interval = max_interval
+        self._adapter_factory = adapter_factory
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._scouts: OrderedDict[str, _Scout] = OrderedDict()
+        self._queue: list[tuple[float, int, str]] = []
+        self._seq = itertools.count()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        # Reads answered from a held page, reads that went upstream, and background refreshes
+        self.held = 0
+        self.fetched = 0
+        self.refreshes = 0
+
+    @classmethod
+    def from_env(cls) -> UpdateSchedule:
+        return cls(
+            env_bool("SCHEDULE_UPDATES"),
+            grace=env_float("SCHEDULE_GRACE", 120.0),
+            max_interval=env_float("SCHEDULE_MAX_INTERVAL", 3600.0),
+        )
+
+    def lookup(self, scout_id: str, key: str) -> tuple[dict[str, Any], float, float] | None:
+        """Return (page, its age, the scout's next run) if a held page answers this read."""
+        if not self.enabled:
+            return None
+        now = self._clock()
+        with self._cond:
+            scout = self._scouts.get(scout_id)
+            page = scout.pages.get(key) if scout is not None else None
+            if page is None or page.until is None or now >= page.until:
+                return None
+            assert scout is not None
+            scout.wanted = True
+            self._scouts.move_to_end(scout_id)
+            self.held += 1
+            return page.value, now - page.fetched_at, page.until
+
+    def record(
+        self,
+        scout_id: str,
+        key: str,
+        kwargs: dict[str, Any],
+        page: dict[str, Any],
+        scout: dict[str, Any] | None,
+    ) -> None:
+        """Remember a page just fetched, holding it if scout (its indexed record) shows it is current."""
+        if not self.enabled or not isinstance(page, dict):
+            return
+        now = self._clock()
+        with self._cond:
+            self.fetched += 1
+            state = self._scouts.get(scout_id)
+            if state is None:
+                state = self._scouts[scout_id] = _Scout()
+                while len(self._scouts) > _MAX_SCOUTS:
+                    self._scouts.popitem(last=False)
+            self._scouts.move_to_end(scout_id)
+            state.wanted = True
+            entry = state.pages[key] = _Page(dict(kwargs), page, now)
+            entry.until = self._hold_until(entry, scout)
+            # An unknown schedule is looked up right away
+            due = now if scout is None else self._next_due(state, scout, now, retry=False)
+            if due is not None:
+                self._schedule(scout_id, state, due)
+
+    def invalidate(self, scout_id: str) -> None:
+        """Forget a scout's pages (after this server edited or deleted it)."""
+        with self._cond:
+            self._scouts.pop(scout_id, None)
+
+    def refresh(self, scout_id: str) -> float | None:
+        """Re-read a scout's detail and outdated pages; return when to refresh it next."""
+        with self._cond:
+            state = self._scouts.get(scout_id)
+            if state is None:
+                return None
+            if not state.wanted:
+                del self._scouts[scout_id]
+                return None
+            pages = list(state.pages.values())
+            due = state.due
+        self.refreshes += 1
+        try:
+            with self._adapter_factory() as adapter:
+                detail = adapter.get_scout_detail(scout_id)
+                with self._cond:
+                    for page in pages:
+                        page.until = self._hold_until(page, detail)
+                if detail.get("status", "active") == "active":
+                    for page in pages:
+                        if page.until is None:
+                            # Recorded (and rescheduled) through the adapter
+                            adapter.get_scout_updates(scout_id, **page.kwargs)
+        except Exception as e:
+            logger.debug("Schedule refresh of scout %s failed: %s", scout_id, e)
+            with self._cond:
+                state.attempts += 1
+                return self._clock() + self._backoff(state)
+        with self._cond:
+            state.wanted = False
+            if state.due != due or self._scouts.get(scout_id) is not state:
+                # Already rescheduled by record(), or forgotten
+                return None
+            return self._next_due(state, detail, self._clock())
+
+    def snapshot(self) -> dict[str, int]:
+        with self._cond:
+            return {"held": self.held, "fetched": self.fetched, "refreshes": self.refreshes}
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    # -------------------------------------------------------------------------
+    # Internal
+    # -------------------------------------------------------------------------
+
+    def _hold_until(self, page: _Page, scout: dict[str, Any] | None) -> float | None:
+        """The scout's next run if the page already has its previous run, else None."""
+        if not isinstance(scout, dict) or scout.get("status", "active") != "active":
+            return None
+        run_at = parse_timestamp(scout.get("next_output_timestamp"))
+        interval = scout.get("output_interval")
+        if run_at is None or isinstance(interval, bool) or not isinstance(interval, (int, float)) or interval <= 0:
+            return None
+        if run_at <= page.fetched_at:
+            return None
+        last_run = run_at - interval
+        if page.kwargs.get("cursor") is not None:
+            # Older pages are not changed by a run
+            return run_at if page.fetched_at >= last_run else None
+        # However late the run publishes, hold only once its update is in
+        newest = newest_update_time(page.value)
+        if newest is None or newest < last_run:
+            return None
+        return run_at
+
+    def _next_due(self, state: _Scout, scout: dict[str, Any], now: float, retry: bool = True) -> float | None:
+        """When to refresh next; None stops refreshing. Called with the lock held.
+
+        retry: a refresh found the last run's update missing, so the delay
+        doubles (a tool call's read does not lengthen it).
+        """
+        if scout.get("status", "active") != "active" or not state.pages:
+            return None
+        held = [page.until for page in state.pages.values() if page.until is not None]
+        if len(held) == len(state.pages):
+            state.attempts = 0
+            return min(held) + self.grace
+        # The last run's update has not appeared yet (or the schedule is unknown)
+        if retry or not state.attempts:
+            state.attempts += 1
+        return now + self._backoff(state)
+
+    def _backoff(self, state: _Scout) -> float:
+        return min(self.grace * 2 ** max(0, state.attempts - 1), self.max_interval)
+
+    def _schedule(self, scout_id: str, state: _Scout, due: float) -> None:
+        """Queue the scout's next refresh; called with the lock held."""
+        state.due = due
+        heapq.heappush(self._queue, (due, next(self._seq), scout_id))
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="yutori-schedule", daemon=True)
+            self._thread.start()
+        self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        return
+                    if not self._queue:
+                        self._cond.wait()
+                        continue
+                    due, _, scout_id = self._queue[0]
+                    delay = due - self._clock()
+                    if delay > 0:
+                        self._cond.wait(delay)
+                        continue
+                    heapq.heappop(self._queue)
+                    state = self._scouts.get(scout_id)
+                    # Skip forgotten scouts and superseded queue entries
+                    if state is not None and state.due == due:
+                        break
+            next_refresh = self.refresh(scout_id)
+            with self._cond:
+                if next_refresh is not None and self._scouts.get(scout_id) is state:
+                    self._schedule(scout_id, state, next_refresh)
+
+
+_default_schedule: UpdateSchedule | None = None
+
+
+def default_update_schedule() -> UpdateSchedule:
+    """Return the process-wide update schedule, configured from the environment on first use."""
+    global _default_schedule
+    if _default_schedule is None:
+        _default_schedule = UpdateSchedule.from_env()
+    return _default_schedule
@@ -183,6 +183,41 @@ class ListScoutsInput(BaseModel):
     )
 
 
+class FindScoutsInput(BaseModel):
+    """Input for searching the local scout index."""
+
+    text: str | None = Field(
+        default=None,
+        description=(
+            "Words to search for in scout names and queries (all must match; word prefixes and "
+            "substrings count), or a scout ID. Omit to match every scout."
+        ),
+    )
+    status: Literal["active", "paused", "done"] | None = Field(
+        default=None,
+        description="Filter by status: 'active', 'paused', or 'done'",
+    )
+    has_webhook: bool | None = Field(
+        default=None,
+        description="If true, only scouts with a webhook; if false, only scouts without one",
+    )
+    output_interval: int | None = Field(
+        default=None,
+        ge=1,
+        description="Only scouts running at this interval, in seconds (e.g. 86400 for daily)",
+    )
+    sort: Literal["next_run", "name", "created"] | None = Field(
+        default="next_run",
+        description="Order: 'next_run' (soonest first), 'name', or 'created' (newest first). Default: next_run",
+    )
+    limit: int | None = Field(
+        default=20,
+        ge=1,
+        le=100,
+        description="Maximum number of scouts to return (1-100). Default: 20",
+    )
+
+
 class GetUpdatesInput(BaseModel):
     """Input for retrieving scout updates."""
 
@@ -197,6 +232,13 @@ class GetUpdatesInput(BaseModel):
         le=100,
         description="Maximum number of updates to return (1-100)",
     )
+    delta: bool | None = Field(
+        default=None,
+        description=(
+            "If true, show only what changed in each update compared with the previous run "
+            "(added/removed paragraphs, findings and sources). The oldest update on the page is shown in full."
+        ),
+    )
 
 
 class BrowsingTaskInput(BaseModel):
@@ -247,6 +289,14 @@ class BrowsingTaskInput(BaseModel):
         default=None,
         description="Webhook payload format: 'scout' (default) or 'slack'",
     )
+    idempotency_key: str | None = Field(
+        default=None,
+        description=(
+            "Optional: Identical launches within a few minutes return the task already started "
+            "instead of launching a duplicate. Pass a new key to deliberately start another run "
+            "with the same inputs, or reuse the key when retrying."
+        ),
+    )
 
     @field_validator("webhook_url")
     @classmethod
@@ -308,6 +358,24 @@ class ResearchTaskInput(BaseModel):
         default=None,
         description="Webhook payload format: 'scout' (default), 'slack', or 'zapier'",
     )
+    idempotency_key: str | None = Field(
+        default=None,
+        description=(
+            "Optional: Identical launches within a few minutes return the task already started "
+            "instead of launching a duplicate. Pass a new key to deliberately start another run "
+            "with the same inputs, or reuse the key when retrying."
+        ),
+    )
+    max_age: int | None = Field(
+        default=None,
+        ge=0,
+        description=(
+            "Optional: Accept a previous result. If research with the same query, location, timezone "
+            "and output_fields completed within this many seconds, its result is returned immediately "
+            "instead of starting a new task. Example: 3600. Only available when the server has research "
+            "memoization enabled; otherwise a new task is started."
+        ),
+    )
 
     @field_validator("webhook_url")
     @classmethod
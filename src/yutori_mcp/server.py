@@ -2,26 +2,30 @@
 
 from __future__ import annotations
 
+import json
 import logging
-from typing import Any
-
-from mcp.server import Server
-from mcp.server.stdio import stdio_server
-from mcp.types import TextContent, Tool
-
-from . import __version__
-from .adapter import MCPClientAdapter, YutoriAPIError
-from .formatters import format_response
-from .schemas import (
-    BrowsingTaskInput,
-    CreateScoutInput,
-    EditScoutInput,
-    GetUpdatesInput,
-    ListScoutsInput,
-    ResearchTaskInput,
-    ScoutIdInput,
-    TaskIdInput,
-)
+import os
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from . import __version__, tracing
+from .config import ENV_PREFIX, env_float, env_float_map, env_int
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from mcp.server import Server
+    from mcp.types import Tool
+
+    from .adapter import MCPClientAdapter
+    from .subscriptions import ScoutWatcher
+
+# Simplified input schemas, generated from schemas.py by
+# scripts/generate_tool_schemas.py so startup needn't build them
+TOOL_SCHEMAS_PATH = Path(__file__).with_name("tool_schemas.json")
 
 logger = logging.getLogger(__name__)
 
@@ -100,128 +104,484 @@ def _output_fields_to_output_schema(
     }
 
 
-# Tool definitions with annotations
-TOOLS = [
+# Tool definitions with annotations. "schema" names the input model in schemas.py.
+TOOL_DEFINITIONS: list[dict[str, Any]] = [
     # Read operations
-    Tool(
+    dict(
         name="list_scouts",
         description=(
             "List all scouts for the authenticated user. "
             "Returns basic metadata; use get_scout_detail for full fields."
         ),
-        inputSchema=_get_simplified_schema(ListScoutsInput),
+        schema="ListScoutsInput",
         annotations={"readOnlyHint": True},
     ),
-    Tool(
+    dict(
+        name="find_scouts",
+        description=(
+            "Search the user's scouts by words in their name or query, status, webhook or interval, "
+            "sorted by next run. Answers from a local index, so it is the fastest way to find a scout."
+        ),
+        schema="FindScoutsInput",
+        annotations={"readOnlyHint": True},
+    ),
+    dict(
         name="get_scout_detail",
         description="Get detailed information about a specific scout.",
-        inputSchema=_get_simplified_schema(ScoutIdInput),
+        schema="ScoutIdInput",
         annotations={"readOnlyHint": True},
     ),
-    Tool(
+    dict(
         name="get_scout_updates",
         description="Get paginated updates/reports for a scout. Each update contains findings from a run.",
-        inputSchema=_get_simplified_schema(GetUpdatesInput),
+        schema="GetUpdatesInput",
         annotations={"readOnlyHint": True},
     ),
     # Scout lifecycle
-    Tool(
+    dict(
         name="create_scout",
         description=(
             "Create a monitoring scout for continuous web monitoring. Scouts track changes relevant to "
             "a query and alert you. Examples: 'news about Yutori', 'H100 pricing below $1.50'."
         ),
-        inputSchema=_get_simplified_schema(CreateScoutInput),
+        schema="CreateScoutInput",
     ),
-    Tool(
+    dict(
         name="edit_scout",
         description=(
             "Update an existing scout's query, schedule, webhook configuration, or status. "
             "Use status='paused' to pause, 'active' to resume, or 'done' to archive."
         ),
-        inputSchema=_get_simplified_schema(EditScoutInput),
+        schema="EditScoutInput",
         annotations={"idempotentHint": True},
     ),
-    Tool(
+    dict(
         name="delete_scout",
         description="Permanently delete a scout and all its data. This action cannot be undone.",
-        inputSchema=_get_simplified_schema(ScoutIdInput),
+        schema="ScoutIdInput",
         annotations={"destructiveHint": True},
     ),
     # Browsing operations
-    Tool(
+    dict(
         name="run_browsing_task",
         description=(
             "Execute a one-time web browsing task. The navigator agent runs a cloud browser and "
             "operates it like a person. Returns a task_id for polling. Example: 'list employees'."
         ),
-        inputSchema=_get_simplified_schema(BrowsingTaskInput),
+        schema="BrowsingTaskInput",
     ),
-    Tool(
+    dict(
         name="get_browsing_task_result",
         description="Poll for browsing task status and result. Call until status is 'succeeded' or 'failed'.",
-        inputSchema=_get_simplified_schema(TaskIdInput),
+        schema="TaskIdInput",
         annotations={"readOnlyHint": True},
     ),
     # Research operations
-    Tool(
+    dict(
         name="run_research_task",
         description=(
             "Execute a one-time deep web research task. The research agent searches, "
             "reads, and synthesizes information from across the web. Returns a task_id for polling. "
             "Example: 'latest AI startup funding announcements'."
         ),
-        inputSchema=_get_simplified_schema(ResearchTaskInput),
+        schema="ResearchTaskInput",
     ),
-    Tool(
+    dict(
         name="get_research_task_result",
         description="Poll for research task status and result. Call until status is 'succeeded' or 'failed'.",
-        inputSchema=_get_simplified_schema(TaskIdInput),
+        schema="TaskIdInput",
         annotations={"readOnlyHint": True},
     ),
 ]
 
 
+def _load_tool_schemas() -> dict[str, dict[str, Any]]:
+    """Read the prebuilt input schemas, keyed by model name."""
+    return json.loads(TOOL_SCHEMAS_PATH.read_text())
+
+
+@lru_cache(maxsize=1)
+def get_tools() -> list[Tool]:
+    """Build the MCP Tool list from TOOL_DEFINITIONS and the prebuilt schemas."""
+    from mcp.types import Tool
+
+    schemas = _load_tool_schemas()
+    return [
+        Tool(
+            name=d["name"],
+            description=d["description"],
+            inputSchema=schemas[d["schema"]],
+            annotations=d.get("annotations"),
+        )
+        for d in TOOL_DEFINITIONS
+    ]
+
+
+def __getattr__(name: str) -> Any:
+    # TOOLS is built on first access so that importing this module stays cheap
+    if name == "TOOLS":
+        return get_tools()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def create_server() -> Server:
     """Create and configure the MCP server."""
+    import asyncio
+
+    import anyio
+    from mcp.server import Server
+    from mcp.server.lowlevel.helper_types import ReadResourceContents
+    from mcp.types import InitializedNotification, Resource, ResourceTemplate, TextContent, Tool
+
+    from . import metrics
+    from .index import default_scout_index
+    from .subscriptions import SCOUT_URI, UPDATES_URI, ScoutWatcher, parse_scout_uri
+    from .warmup import default_warmup
+
     server = Server("yutori-mcp")
+    subscribers = _ResourceSubscribers(ScoutWatcher.from_env())
+
+    async def on_initialized(notification: InitializedNotification) -> None:
+        # After the handshake, so warming the cache never delays it
+        default_warmup().start()
+
+    server.notification_handlers[InitializedNotification] = on_initialized
 
     @server.list_tools()
     async def list_tools() -> list[Tool]:
-        return TOOLS
+        return get_tools()
+
+    @server.list_resources()
+    async def list_resources() -> list[Resource]:
+        # Scouts come from the local index (see index.py), so listing costs no API call
+        scouts, _ = default_scout_index().find(limit=1000)
+        return [
+            Resource(
+                uri=metrics.METRICS_URI,
+                name="metrics",
+                description="Per-tool call counts, latencies and payload sizes in Prometheus text format",
+                mimeType="text/plain",
+            )
+        ] + [
+            Resource(
+                uri=SCOUT_URI.format(scout_id=scout["id"]),
+                name=scout.get("display_name") or scout.get("query") or scout["id"],
+                description=f"Scout ({scout.get('status', 'unknown')}); subscribe to its /updates for new runs",
+                mimeType="text/plain",
+            )
+            for scout in scouts
+        ]
+
+    @server.list_resource_templates()
+    async def list_resource_templates() -> list[ResourceTemplate]:
+        return [
+            ResourceTemplate(
+                uriTemplate=SCOUT_URI,
+                name="scout",
+                description="A scout's details; subscribe to be notified when they change",
+                mimeType="text/plain",
+            ),
+            ResourceTemplate(
+                uriTemplate=UPDATES_URI,
+                name="scout_updates",
+                description="A scout's latest updates; subscribe to be notified of each new run",
+                mimeType="text/plain",
+            ),
+        ]
+
+    @server.read_resource()
+    async def read_resource(uri: Any) -> list[ReadResourceContents]:
+        if str(uri) == metrics.METRICS_URI:
+            return [ReadResourceContents(content=metrics.render(), mime_type="text/plain")]
+        parsed = parse_scout_uri(str(uri))
+        if parsed is None:
+            raise ValueError(f"Unknown resource: {uri}")
+        scout_id, is_updates = parsed
+        tool = "get_scout_updates" if is_updates else "get_scout_detail"
+        # A failed read is a JSON-RPC error, so it is never mistaken for the resource's content
+        text = await run_tool(tool, {"scout_id": scout_id}, raise_errors=True)
+        return [ReadResourceContents(content=text or "", mime_type="text/plain")]
+
+    @server.subscribe_resource()
+    async def subscribe_resource(uri: Any) -> None:
+        session = server.request_context.session
+        if not subscribers.add(str(uri), session, asyncio.get_running_loop()):
+            raise ValueError(f"Resource does not support subscriptions: {uri}")
+
+    @server.unsubscribe_resource()
+    async def unsubscribe_resource(uri: Any) -> None:
+        subscribers.remove(str(uri), server.request_context.session)
 
     @server.call_tool()
     async def call_tool(name: str, arguments: dict) -> list[TextContent]:
+        text = await run_tool(name, arguments)
+        return [TextContent(type="text", text=text or "")]
+
+    async def run_tool(name: str, arguments: dict, raise_errors: bool = False) -> str | None:
+        """Run a tool within its deadline, for a tool call or a resource read.
+
+        The SDK is synchronous; each call runs in a worker thread so concurrent
+        calls (and rate-limiter waits) don't block the event loop. A failure is
+        returned as the error text, or raised as ToolError with raise_errors.
+        """
+        deadline = _tool_deadline(name)
+        call = _ToolCall(trace_carrier=_request_trace_carrier(server))
+        start = time.perf_counter()
         try:
-            with MCPClientAdapter() as client:
-                result, context = _handle_tool(client, name, arguments)
-                formatted = format_response(name, result, **context)
-                return [TextContent(type="text", text=formatted)]
-        except YutoriAPIError as e:
-            return [
-                TextContent(
-                    type="text", text=f"API Error ({e.status_code}): {e.message}"
+            with anyio.fail_after(deadline):
+                text = await anyio.to_thread.run_sync(
+                    _run_tool, name, arguments, call, deadline, abandon_on_cancel=True
                 )
-            ]
-        except Exception as e:
-            logger.exception(f"Error handling tool {name}")
-            return [TextContent(type="text", text=f"Error: {e!s}")]
+        except TimeoutError:
+            call.cancel()
+            metrics.observe_tool(name, "timeout", time.perf_counter() - start)
+            call.outcome = "timeout"
+            text = f"Error: {name} timed out after {deadline:g}s"
+        except anyio.get_cancelled_exc_class():
+            # Client cancelled the request: abort the HTTP call and free the worker
+            call.cancel()
+            metrics.observe_tool(name, "cancelled", time.perf_counter() - start)
+            raise
+        if raise_errors and call.outcome not in (None, "ok"):
+            raise ToolError(text or f"{name} failed")
+        return text
 
     return server
 
 
+def _request_trace_carrier(server: Server) -> dict[str, Any] | None:
+    """W3C trace context (traceparent/tracestate) from the current request's _meta, if any."""
+    try:
+        meta = server.request_context.meta
+    except LookupError:
+        return None
+    if meta is None:
+        return None
+    return {k: v for k, v in meta.model_dump(exclude_none=True).items() if k in ("traceparent", "tracestate")} or None
+
+
+class _ResourceSubscribers:
+    """Routes the watcher's change notifications to the sessions subscribed to each resource.
+
+    The watcher is shared by every session; each session's notifications are
+    sent on the event loop it runs on. A session whose notification cannot
+    be sent is dropped.
+    """
+
+    def __init__(self, watcher: ScoutWatcher) -> None:
+        self.watcher = watcher
+        self._lock = threading.Lock()
+        # uri -> {session: its event loop}
+        self._sessions: dict[str, dict[Any, Any]] = {}
+        watcher.notify = self.notify
+
+    def add(self, uri: str, session: Any, loop: Any) -> bool:
+        """Subscribe a session to a resource; False if it cannot be watched."""
+        if not self.watcher.subscribe(uri):
+            return False
+        with self._lock:
+            self._sessions.setdefault(uri, {})[session] = loop
+        return True
+
+    def remove(self, uri: str, session: Any) -> None:
+        with self._lock:
+            sessions = self._sessions.get(uri, {})
+            sessions.pop(session, None)
+            if sessions:
+                return
+            self._sessions.pop(uri, None)
+        self.watcher.unsubscribe(uri)
+
+    def notify(self, uri: str) -> None:
+        """Send resources/updated to the resource's subscribers (called from the watcher thread)."""
+        import asyncio
+
+        from pydantic import AnyUrl
+
+        with self._lock:
+            sessions = list(self._sessions.get(uri, {}).items())
+        for session, loop in sessions:
+            try:
+                future = asyncio.run_coroutine_threadsafe(session.send_resource_updated(AnyUrl(uri)), loop)
+            except RuntimeError as e:
+                # The session's loop is closed
+                self._failed(uri, session, e)
+                continue
+            future.add_done_callback(lambda f, session=session: self._sent(uri, session, f))
+
+    def _sent(self, uri: str, session: Any, future: Future[Any]) -> None:
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self._failed(uri, session, error)
+
+    def _failed(self, uri: str, session: Any, error: BaseException) -> None:
+        logger.warning("Cannot send update notification for %s: %s", uri, error)
+        with self._lock:
+            subscribed = [u for u, sessions in self._sessions.items() if session in sessions]
+        for u in subscribed:
+            self.remove(u, session)
+
+
+class ToolError(Exception):
+    """A tool run for a resource read failed; the message is the error text."""
+
+
+class _ToolCall:
+    """Handle for cancelling a tool call running in a worker thread.
+
+    Also carries the caller's trace context into the worker thread, and
+    the call's outcome ("ok", "api_error", ...) back from it.
+    """
+
+    def __init__(self, trace_carrier: dict[str, Any] | None = None) -> None:
+        self._lock = threading.Lock()
+        self._client: MCPClientAdapter | None = None
+        self.cancelled = False
+        self.trace_carrier = trace_carrier
+        self.outcome: str | None = None
+
+    def attach(self, client: MCPClientAdapter) -> None:
+        with self._lock:
+            self._client = client
+            if self.cancelled:
+                client.cancel()
+
+    def cancel(self) -> None:
+        with self._lock:
+            self.cancelled = True
+            if self._client is not None:
+                self._client.cancel()
+
+
+def _tool_deadline(name: str) -> float:
+    """Seconds a tool call may run: YUTORI_MCP_TOOL_DEADLINES, else CALL_DEADLINE."""
+    from .retry import RetryPolicy
+
+    return env_float_map("TOOL_DEADLINES").get(name) or env_float("CALL_DEADLINE", RetryPolicy.deadline)
+
+
+def _run_tool(
+    name: str,
+    arguments: dict,
+    call: _ToolCall | None = None,
+    deadline: float | None = None,
+) -> str | None:
+    """Execute a tool call and return the text shown to the model.
+
+    Returns None if the call was cancelled; no response is formatted then.
+    Completed calls are recorded in metrics, with time split into phases,
+    and profiled when selected by YUTORI_MCP_PROFILE.
+    """
+    # Deferred: the SDK and formatters are only needed once a tool is called
+    from . import metrics, profiling
+    from .adapter import CallCancelled, MCPClientAdapter, YutoriAPIError
+    from .formatters import (
+        format_memo_notice,
+        format_response,
+        format_reused_task_notice,
+        format_schedule_notice,
+        format_stale_notice,
+    )
+
+    start = time.perf_counter()
+    phases: dict[str, float] = {}
+    attributes = {
+        "yutori.tool": name,
+        "yutori.scout_id": arguments.get("scout_id"),
+        "yutori.task_id": arguments.get("task_id"),
+    }
+    carrier = call.trace_carrier if call is not None else None
+    with profiling.profile(name), tracing.span(f"tool {name}", attributes, carrier=carrier) as span:
+        try:
+            with MCPClientAdapter(deadline=deadline) as client:
+                if call is not None:
+                    call.attach(client)
+                try:
+                    with tracing.span("handle_tool", {"yutori.tool": name}):
+                        result, context = _handle_tool(client, name, arguments)
+                finally:
+                    phases["upstream"] = client.upstream_seconds
+                    phases["validate"] = max(0.0, time.perf_counter() - start - client.upstream_seconds)
+                if client.cancelled:
+                    return None
+                format_start = time.perf_counter()
+                with tracing.span(f"format {name}") as format_span:
+                    if client.memo_age is not None:
+                        # A completed result was returned in place of a new task
+                        text = format_response("get_research_task_result", result, **context)
+                        text += "\n\n" + format_memo_notice(client.memo_age)
+                    else:
+                        text = format_response(name, result, **context)
+                    if client.stale_age is not None:
+                        text += "\n\n" + format_stale_notice(client.stale_age, client.stale_reason)
+                    if client.schedule_hold is not None:
+                        text += "\n\n" + format_schedule_notice(*client.schedule_hold)
+                    if client.reused_task_age is not None:
+                        text += "\n\n" + format_reused_task_notice(client.reused_task_age)
+                    format_span.set_attribute("yutori.response_bytes", len(text.encode()))
+                phases["format"] = time.perf_counter() - format_start
+                outcome = "ok"
+        except CallCancelled:
+            return None
+        except YutoriAPIError as e:
+            text, outcome = f"API Error ({e.status_code}): {e.message}", "api_error"
+        except Exception as e:
+            if call is not None and call.cancelled:
+                return None
+            logger.exception(f"Error handling tool {name}")
+            text, outcome = f"Error: {e!s}", "error"
+        response_bytes = len(text.encode())
+        if call is not None:
+            call.outcome = outcome
+        span.set_attribute("yutori.outcome", outcome)
+        span.set_attribute("yutori.response_bytes", response_bytes)
+    metrics.observe_tool(
+        name,
+        outcome,
+        time.perf_counter() - start,
+        phases=phases,
+        response_bytes=response_bytes,
+    )
+    return text
+
+
 def _handle_tool(client: MCPClientAdapter, name: str, arguments: dict) -> tuple[dict, dict]:
     """Route tool calls to the appropriate client method.
 
     Returns:
         Tuple of (result, context) where context contains extra info for formatting.
     """
+    from .schemas import (
+        BrowsingTaskInput,
+        CreateScoutInput,
+        EditScoutInput,
+        FindScoutsInput,
+        GetUpdatesInput,
+        ListScoutsInput,
+        ResearchTaskInput,
+        ScoutIdInput,
+        TaskIdInput,
+    )
+
     match name:
         # Read operations
         case "list_scouts":
             params = ListScoutsInput(**arguments)
             result = client.list_scouts(limit=params.limit, status=params.status)
             return result, {}
+        case "find_scouts":
+            params = FindScoutsInput(**arguments)
+            result = client.find_scouts(
+                text=params.text,
+                status=params.status,
+                has_webhook=params.has_webhook,
+                output_interval=params.output_interval,
+                sort=params.sort,
+                limit=params.limit,
+            )
+            return result, {}
         case "get_scout_detail":
             params = ScoutIdInput(**arguments)
             return client.get_scout_detail(params.scout_id), {}
@@ -232,7 +592,7 @@ def _handle_tool(client: MCPClientAdapter, name: str, arguments: dict) -> tuple[
                 cursor=params.cursor,
                 limit=params.limit,
             )
-            return result, {}
+            return result, {"delta": bool(params.delta), "limit": params.limit}
 
         # Scout lifecycle
         case "create_scout":
@@ -303,6 +663,7 @@ def _handle_tool(client: MCPClientAdapter, name: str, arguments: dict) -> tuple[
                 output_schema=_output_fields_to_output_schema(params.output_fields),
                 webhook_url=params.webhook_url,
                 webhook_format=params.webhook_format,
+                idempotency_key=params.idempotency_key,
             )
             return result, {"task_type": "Browsing"}
         case "get_browsing_task_result":
@@ -319,6 +680,8 @@ def _handle_tool(client: MCPClientAdapter, name: str, arguments: dict) -> tuple[
                 output_schema=_output_fields_to_output_schema(params.output_fields),
                 webhook_url=params.webhook_url,
                 webhook_format=params.webhook_format,
+                idempotency_key=params.idempotency_key,
+                max_age=params.max_age,
             )
             return result, {"task_type": "Research"}
         case "get_research_task_result":
@@ -329,13 +692,44 @@ def _handle_tool(client: MCPClientAdapter, name: str, arguments: dict) -> tuple[
             raise ValueError(f"Unknown tool: {name}")
 
 
+def initialization_options(server: Server) -> Any:
+    """The server's initialization options, advertising resource subscriptions.
+
+    The low-level SDK server always reports subscribe=False, even with a
+    subscribe handler registered.
+    """
+    options = server.create_initialization_options()
+    if options.capabilities.resources is not None:
+        options.capabilities.resources.subscribe = True
+    return options
+
+
 async def run_server() -> None:
     """Run the MCP server using stdio transport."""
+    from mcp.server.stdio import stdio_server
+
+    tracing.configure_tracing()
+    metrics_port = env_int("METRICS_PORT", 0)
+    if metrics_port:
+        from .metrics import start_http_server
+
+        start_http_server(metrics_port)
     server = create_server()
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream, write_stream, server.create_initialization_options()
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, initialization_options(server))
+    finally:
+        from .warmup import default_warmup
+
+        default_warmup().save()
+
+
+def _apply_env_overrides(args: Any, mapping: dict[str, str]) -> None:
+    """Export CLI flags as YUTORI_MCP_* variables so settings have one source."""
+    for attr, env_name in mapping.items():
+        value = getattr(args, attr, None)
+        if value is not None:
+            os.environ[ENV_PREFIX + env_name] = str(value)
 
 
 def main() -> None:
@@ -350,13 +744,62 @@ def main() -> None:
         version=f"%(prog)s {__version__}",
         help="Show version and exit",
     )
+    parser.add_argument(
+        "--read-rate",
+        type=float,
+        help="Max read requests per second to the Yutori API (0 = unlimited). Default: 10",
+    )
+    parser.add_argument(
+        "--task-rate",
+        type=float,
+        help="Max browsing/research task launches per second (0 = unlimited). Default: 1",
+    )
+    parser.add_argument(
+        "--scout-write-rate",
+        type=float,
+        help="Max scout create/edit/delete requests per second (0 = unlimited). Default: 2",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="TOOLS",
+        help="Profile calls to these tools (comma-separated, or '*') into --profile-dir",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        help="Directory for per-call profiles. Default: <tmp>/yutori-mcp-profiles",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        help="Serve Prometheus metrics on http://127.0.0.1:PORT/metrics. Default: disabled",
+    )
     subparsers = parser.add_subparsers(dest="command")
 
     subparsers.add_parser("login", help="Log in and save API key")
     subparsers.add_parser("logout", help="Remove saved API key")
     subparsers.add_parser("status", help="Show authentication status")
+    ingest = subparsers.add_parser(
+        "ingest", help="Receive scout webhooks and store their updates for get_scout_updates"
+    )
+    ingest.add_argument("--host", default="127.0.0.1", help="Address to listen on. Default: 127.0.0.1")
+    ingest.add_argument("--port", type=int, default=8765, help="Port to listen on. Default: 8765")
+    ingest.add_argument(
+        "--store",
+        help="SQLite file to write updates to. Default: YUTORI_MCP_UPDATE_STORE or ~/.yutori/updates.db",
+    )
 
     args = parser.parse_args()
+    _apply_env_overrides(
+        args,
+        {
+            "read_rate": "READ_RATE",
+            "task_rate": "TASK_RATE",
+            "scout_write_rate": "SCOUT_WRITE_RATE",
+            "metrics_port": "METRICS_PORT",
+            "profile": "PROFILE",
+            "profile_dir": "PROFILE_DIR",
+        },
+    )
 
     if args.command in {"login", "logout", "status"}:
         from yutori.auth import clear_config, get_auth_status, run_login_flow
@@ -387,6 +830,13 @@ def main() -> None:
                 raise SystemExit(1)
             raise SystemExit(0)
 
+    if args.command == "ingest":
+        from .ingest import run_ingest
+
+        store = args.store or os.environ.get(ENV_PREFIX + "UPDATE_STORE") or "~/.yutori/updates.db"
+        run_ingest(args.host, args.port, Path(store).expanduser())
+        raise SystemExit(0)
+
     asyncio.run(run_server())
 
 
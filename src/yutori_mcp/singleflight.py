@@ -0,0 +1,121 @@
+"""Coalescing of identical concurrent read requests.
+
+When several tool calls ask for the same scout, scout list page or task
+result at the same moment, only the first (the leader) calls the API; the
+others wait for and share its result. Keys are normalized adapter calls, so
+equivalent tool arguments map to the same in-flight request.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar
+
+from .config import env_bool
+
+T = TypeVar("T")
+
+# How often a waiting follower re-checks whether it was itself cancelled
+_FOLLOWER_POLL_SECONDS = 0.05
+
+
+class _Flight(Generic[T]):
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Thread-safe request coalescer.
+
+    Args:
+        enabled: When False, do() simply calls fn.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._flights: dict[str, _Flight[Any]] = {}
+        self.leaders: Counter[str] = Counter()
+        self.shared: Counter[str] = Counter()
+
+    @classmethod
+    def from_env(cls) -> SingleFlight:
+        return cls(enabled=env_bool("COALESCE_READS", True))
+
+    def in_flight(self) -> int:
+        """Number of distinct requests currently being executed."""
+        return len(self._flights)
+
+    def do(
+        self,
+        key: str,
+        fn: Callable[[], T],
+        *,
+        label: str = "",
+        cancelled: Callable[[], bool] | None = None,
+    ) -> T:
+        """Return fn()'s result, sharing one execution among concurrent callers.
+
+        Followers receive the leader's result or re-raise its exception.
+
+        Args:
+            key: Normalized request identity.
+            fn: The call to execute if no identical call is in flight.
+            label: Name used for the leader/shared counters (e.g. operation).
+            cancelled: Polled while waiting; when it returns True the
+                follower stops waiting and calls fn itself, which is expected
+                to raise promptly for a cancelled caller.
+        """
+        if not self.enabled:
+            return fn()
+
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.leaders[label] += 1
+            else:
+                self.shared[label] += 1
+
+        if leader:
+            try:
+                flight.result = fn()
+            except BaseException as e:
+                flight.error = e
+                raise
+            finally:
+                with self._lock:
+                    del self._flights[key]
+                flight.done.set()
+            return flight.result
+
+        while not flight.done.wait(_FOLLOWER_POLL_SECONDS):
+            if cancelled is not None and cancelled():
+                return fn()
+        if flight.error is not None:
+            raise flight.error
+        return flight.result  # type: ignore[return-value]
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "leaders": dict(self.leaders),
+                "shared": dict(self.shared),
+                "in_flight": len(self._flights),
+            }
+
+
+_default_singleflight: SingleFlight | None = None
+
+
+def default_singleflight() -> SingleFlight:
+    """Return the process-wide coalescer, configured from the environment on first use."""
+    global _default_singleflight
+    if _default_singleflight is None:
+        _default_singleflight = SingleFlight.from_env()
+    return _default_singleflight
@@ -0,0 +1,238 @@
+"""Local store of scout updates pushed by webhooks.
+
+`yutori-mcp ingest` (see ingest.py) writes the updates that scouts push to
+their webhook_url into a SQLite file. With YUTORI_MCP_UPDATE_STORE set to
+that file, the server answers get_scout_updates for any scout with stored
+updates from the file instead of the API (newest first, paged with local
+cursors), and find_scouts indexes the scouts named in pushed payloads.
+Local cursors name the last update served (its created_at and id), so
+updates stored meanwhile do not shift the pages. Once the stored updates
+run out, paging continues with the older updates from the API. Scouts with
+nothing stored are still read from the API.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .config import env_str
+from .subscriptions import parse_timestamp
+
+logger = logging.getLogger(__name__)
+
+# Cursor prefix of pages served from the store
+LOCAL_CURSOR = "local:"
+
+# Page size when get_scout_updates gives no limit
+DEFAULT_PAGE_SIZE = 10
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS updates (
+    scout_id TEXT NOT NULL,
+    update_id TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    received_at REAL NOT NULL,
+    body TEXT NOT NULL,
+    PRIMARY KEY (scout_id, update_id)
+);
+CREATE INDEX IF NOT EXISTS updates_by_time ON updates (scout_id, created_at DESC);
+CREATE TABLE IF NOT EXISTS scouts (
+    scout_id TEXT PRIMARY KEY,
+    fields TEXT NOT NULL,
+    received_at REAL NOT NULL
+);
+"""
+
+
+@dataclass(frozen=True)
+class StoredUpdate:
+    """One update to store, as parsed from a webhook payload."""
+
+    scout_id: str
+    update_id: str
+    created_at: float
+    received_at: float
+    update: dict[str, Any]
+    # Scout fields the payload carried (name, query, ...), if any
+    scout: dict[str, Any] | None = None
+
+
+class UpdateStore:
+    """SQLite-backed updates, shared by the ingest listener and the server.
+
+    Args:
+        path: Database file; None disables the store.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        # Newest scout record already handed to the index
+        self._scouts_seen = 0.0
+
+    @classmethod
+    def from_env(cls) -> UpdateStore:
+        path = env_str("UPDATE_STORE")
+        return cls(Path(path).expanduser() if path else None)
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def add(self, records: Iterable[StoredUpdate]) -> int:
+        """Store a batch in one transaction; return how many updates were new."""
+        records = list(records)
+        if not records:
+            return 0
+        scouts: dict[str, tuple[str, str, float]] = {}
+        for record in records:
+            if record.scout:
+                scouts[record.scout_id] = (
+                    record.scout_id,
+                    json.dumps(record.scout, default=str),
+                    record.received_at,
+                )
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                before = conn.total_changes
+                conn.executemany(
+                    "INSERT OR IGNORE INTO updates VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (r.scout_id, r.update_id, r.created_at, r.received_at, json.dumps(r.update, default=str))
+                        for r in records
+                    ],
+                )
+                added = conn.total_changes - before
+                conn.executemany(
+                    "INSERT INTO scouts VALUES (?, ?, ?) ON CONFLICT (scout_id) DO UPDATE SET "
+                    "fields = json_patch(fields, excluded.fields), received_at = excluded.received_at",
+                    list(scouts.values()),
+                )
+        return added
+
+    def page(self, scout_id: str, limit: int | None = None, cursor: str | None = None) -> dict[str, Any] | None:
+        """A get_scout_updates page from the store.
+
+        Returns None if the store has no updates for the scout after cursor,
+        so the page is read from the API. Stored pages always report more,
+        since the API may have older updates than the store.
+        """
+        if self.path is None:
+            return None
+        limit = limit or DEFAULT_PAGE_SIZE
+        position = local_cursor_position(cursor)
+        with self._lock:
+            conn = self._connect()
+            if position is None:
+                rows = conn.execute(
+                    "SELECT created_at, update_id, body FROM updates WHERE scout_id = ? "
+                    "ORDER BY created_at DESC, update_id LIMIT ?",
+                    (scout_id, limit),
+                ).fetchall()
+            else:
+                created_at, update_id = position
+                rows = conn.execute(
+                    "SELECT created_at, update_id, body FROM updates WHERE scout_id = ? "
+                    "AND (created_at < ? OR (created_at = ? AND update_id > ?)) "
+                    "ORDER BY created_at DESC, update_id LIMIT ?",
+                    (scout_id, created_at, created_at, update_id, limit),
+                ).fetchall()
+        if not rows:
+            return None
+        created_at, update_id, _ = rows[-1]
+        return {
+            "updates": [json.loads(body) for _, _, body in rows],
+            "has_more": True,
+            "next_cursor": f"{LOCAL_CURSOR}{created_at!r}:{update_id}",
+        }
+
+    def new_scouts(self) -> list[dict[str, Any]]:
+        """Scout records pushed since the previous call, for the scout index."""
+        if self.path is None:
+            return []
+        with self._lock:
+            conn = self._connect()
+            rows = conn.execute(
+                "SELECT scout_id, fields, received_at FROM scouts WHERE received_at > ? ORDER BY received_at",
+                (self._scouts_seen,),
+            ).fetchall()
+            if rows:
+                self._scouts_seen = rows[-1][2]
+        return [{**json.loads(fields), "id": scout_id} for scout_id, fields, _ in rows]
+
+    def count(self) -> int:
+        if self.path is None:
+            return 0
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM updates").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use; called with the lock held."""
+        if self._conn is None:
+            assert self.path is not None
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # One connection guarded by the lock, used from whichever thread holds it
+            conn = sqlite3.connect(self.path, timeout=10.0, check_same_thread=False)
+            # Readers in the server do not block the listener's writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+
+def is_local_cursor(cursor: str | None) -> bool:
+    return cursor is not None and cursor.startswith(LOCAL_CURSOR)
+
+
+def local_cursor_position(cursor: str | None) -> tuple[float, str] | None:
+    """The (created_at, update_id) a local cursor continues after, or None for the first page."""
+    if not is_local_cursor(cursor):
+        return None
+    assert cursor is not None
+    created_at, _, update_id = cursor[len(LOCAL_CURSOR) :].partition(":")
+    try:
+        return float(created_at), update_id
+    except ValueError:
+        return None
+
+
+def updates_after(cursor: str, updates: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """The API updates that come after a local cursor's position (older than the stored ones)."""
+    position = local_cursor_position(cursor)
+    if position is None:
+        return updates
+    created_at, update_id = position
+    kept = []
+    for update in updates:
+        when = parse_timestamp(update.get("created_at") or update.get("timestamp"))
+        # Same order as the store: newest first, ties by id
+        if when is None or when < created_at or (when == created_at and str(update.get("id")) > update_id):
+            kept.append(update)
+    return kept
+
+
+_default_store: UpdateStore | None = None
+
+
+def default_update_store() -> UpdateStore:
+    """Return the process-wide update store, configured from the environment on first use."""
+    global _default_store
+    if _default_store is None:
+        _default_store = UpdateStore.from_env()
+    return _default_store
@@ -0,0 +1,264 @@
+"""Scout resources and subscriptions with schedule-aligned polling.
+
+Each scout is exposed as the MCP resource yutori://scouts/{id}, and its
+updates as yutori://scouts/{id}/updates. A client that subscribes to one is
+sent notifications/resources/updated when it changes, so it need not poll
+get_scout_updates.
+
+One background thread watches every subscribed scout. Instead of polling on
+a fixed period, it checks a scout YUTORI_MCP_WATCH_GRACE seconds after its
+next_output_timestamp, when the run's update can first appear, and retries
+with doubling delays until the update arrives. Scouts that are not active,
+or have no next run, are checked every YUTORI_MCP_WATCH_MAX_INTERVAL seconds,
+which also bounds every other delay.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import json
+import logging
+import re
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from .config import env_float
+
+if TYPE_CHECKING:
+    from .adapter import MCPClientAdapter
+
+logger = logging.getLogger(__name__)
+
+SCOUT_URI = "yutori://scouts/{scout_id}"
+UPDATES_URI = "yutori://scouts/{scout_id}/updates"
+
+_URI = re.compile(r"^yutori://scouts/([^/]+)(/updates)?$")
+
+# Seconds a background read may take
+_FETCH_DEADLINE = 10.0
+
+
+def parse_scout_uri(uri: str) -> tuple[str, bool] | None:
+    """Return (scout_id, is_updates) for a scout resource URI, else None."""
+    match = _URI.match(uri)
+    if match is None:
+        return None
+    return match.group(1), match.group(2) is not None
+
+
+def parse_timestamp(value: Any) -> float | None:
+    """Epoch seconds from an ISO 8601 string or a Unix timestamp in seconds or milliseconds."""
+    if isinstance(value, bool) or value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return value / 1000 if value > 1e11 else float(value)
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def latest_update_marker(page: dict[str, Any]) -> str | None:
+    """Identity of the newest update in a get_scout_updates page."""
+    updates = page.get("updates") or []
+    if not updates or not isinstance(updates[0], dict):
+        return None
+    newest = updates[0]
+    marker = newest.get("id") or newest.get("created_at") or newest.get("timestamp")
+    return None if marker is None else str(marker)
+
+
+def _default_adapter_factory() -> MCPClientAdapter:
+    from .adapter import MCPClientAdapter
+    from .prefetch import Prefetcher
+    from .revalidate import Revalidator
+
+    # A disabled revalidator, so background reads go to the API
+    return MCPClientAdapter(deadline=_FETCH_DEADLINE, prefetcher=Prefetcher(), revalidator=Revalidator())
+
+
+@dataclass
+class _Watch:
+    uris: set[str] = field(default_factory=set)
+    detail: str | None = None
+    update: str | None = None
+    checked: bool = False
+    # Next run the retries are waiting on, and failed/empty checks since
+    run_at: float | None = None
+    attempts: int = 0
+    due: float = 0.0
+
+
+class ScoutWatcher:
+    """Polls subscribed scouts around their schedules and reports changes.
+
+    Args:
+        notify: Called with the URI of each changed resource (from the watcher thread).
+        grace: Seconds after a scheduled run before its update is looked for.
+        max_interval: Longest delay between checks of a scout.
+        adapter_factory: Creates the adapter used for background reads.
+    """
+
+    def __init__(
+        self,
+        notify: Callable[[str], None] | None = None,
+        *,
+        grace: float = 60.0,
+        max_interval: float = 3600.0,
+        adapter_factory: Callable[[], MCPClientAdapter] = _default_adapter_factory,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.notify = notify
+        self.grace = grace
+        self.max_interval = max_interval
+        self._adapter_factory = adapter_factory
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._watches: dict[str, _Watch] = {}
+        self._queue: list[tuple[float, int, str]] = []
+        self._seq = itertools.count()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self.checks = 0
+
+    @classmethod
+    def from_env(cls, notify: Callable[[str], None] | None = None) -> ScoutWatcher:
+        return cls(
+            notify,
+            grace=env_float("WATCH_GRACE", 60.0),
+            max_interval=env_float("WATCH_MAX_INTERVAL", 3600.0),
+        )
+
+    def subscribe(self, uri: str) -> bool:
+        """Start watching a scout resource; False if uri is not one."""
+        parsed = parse_scout_uri(uri)
+        if parsed is None:
+            return False
+        scout_id = parsed[0]
+        with self._cond:
+            watch = self._watches.get(scout_id)
+            if watch is None:
+                watch = self._watches[scout_id] = _Watch()
+                # The first check records the current state without notifying
+                self._schedule(scout_id, watch, self._clock())
+            watch.uris.add(uri)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="yutori-watch", daemon=True)
+                self._thread.start()
+        return True
+
+    def unsubscribe(self, uri: str) -> None:
+        parsed = parse_scout_uri(uri)
+        if parsed is None:
+            return
+        with self._cond:
+            watch = self._watches.get(parsed[0])
+            if watch is not None:
+                watch.uris.discard(uri)
+                if not watch.uris:
+                    del self._watches[parsed[0]]
+
+    def subscriptions(self) -> list[str]:
+        with self._cond:
+            return sorted(uri for watch in self._watches.values() for uri in watch.uris)
+
+    def check(self, scout_id: str) -> float | None:
+        """Check one scout now, notify subscribers of changes, and return when to check next."""
+        with self._cond:
+            watch = self._watches.get(scout_id)
+            if watch is None:
+                return None
+            want_updates = UPDATES_URI.format(scout_id=scout_id) in watch.uris
+        self.checks += 1
+        try:
+            with self._adapter_factory() as adapter:
+                detail = adapter.get_scout_detail(scout_id)
+                page = adapter.get_scout_updates(scout_id, limit=1) if want_updates else None
+        except Exception as e:
+            logger.debug("Watch check of scout %s failed: %s", scout_id, e)
+            with self._cond:
+                watch.attempts += 1
+                return self._backoff(watch, self._clock())
+
+        digest = json.dumps(detail, sort_keys=True, default=str)
+        marker = latest_update_marker(page) if page is not None else watch.update
+        changed: list[str] = []
+        with self._cond:
+            if watch.checked:
+                if digest != watch.detail:
+                    changed.append(SCOUT_URI.format(scout_id=scout_id))
+                if want_updates and marker != watch.update:
+                    changed.append(UPDATES_URI.format(scout_id=scout_id))
+            new_update = watch.checked and want_updates and marker != watch.update
+            watch.detail, watch.update, watch.checked = digest, marker, True
+            changed = [uri for uri in changed if uri in watch.uris]
+            next_check = self._next_check(watch, detail, new_update)
+        if self.notify is not None:
+            for uri in changed:
+                try:
+                    self.notify(uri)
+                except Exception:
+                    logger.exception("Cannot send update notification for %s", uri)
+        return next_check
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    # -------------------------------------------------------------------------
+    # Internal
+    # -------------------------------------------------------------------------
+
+    def _next_check(self, watch: _Watch, detail: dict[str, Any], new_update: bool) -> float:
+        """When to look again, from the scout's schedule; called with the lock held."""
+        now = self._clock()
+        run_at = parse_timestamp(detail.get("next_output_timestamp"))
+        if detail.get("status", "active") != "active" or run_at is None:
+            watch.run_at, watch.attempts = None, 0
+            return now + self.max_interval
+        if run_at != watch.run_at or new_update:
+            watch.run_at, watch.attempts = run_at, 0
+        if run_at + self.grace > now:
+            return min(run_at + self.grace, now + self.max_interval)
+        # The run is due or overdue and its update has not been seen yet
+        watch.attempts += 1
+        return self._backoff(watch, now)
+
+    def _backoff(self, watch: _Watch, now: float) -> float:
+        return now + min(self.grace * 2 ** max(0, watch.attempts - 1), self.max_interval)
+
+    def _schedule(self, scout_id: str, watch: _Watch, due: float) -> None:
+        """Queue the scout's next check; called with the lock held."""
+        watch.due = due
+        heapq.heappush(self._queue, (due, next(self._seq), scout_id))
+        self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        return
+                    if not self._queue:
+                        self._cond.wait()
+                        continue
+                    due, _, scout_id = self._queue[0]
+                    delay = due - self._clock()
+                    if delay > 0:
+                        self._cond.wait(delay)
+                        continue
+                    heapq.heappop(self._queue)
+                    watch = self._watches.get(scout_id)
+                    # Skip unsubscribed scouts and superseded queue entries
+                    if watch is not None and watch.due == due:
+                        break
+            next_check = self.check(scout_id)
+            with self._cond:
+                if next_check is not None and self._watches.get(scout_id) is watch:
+                    self._schedule(scout_id, watch, next_check)
@@ -0,0 +1,129 @@
+"""Optional OpenTelemetry tracing.
+
+Tracing is off unless YUTORI_MCP_TRACING selects an exporter:
+
+- ``otlp``: export over OTLP/HTTP, configured by the standard
+  OTEL_EXPORTER_OTLP_* variables.
+- ``file``: append one JSON object per span to YUTORI_MCP_TRACE_FILE
+  (default ``yutori-mcp-traces.jsonl``), for offline testing.
+
+Both need the ``tracing`` extra (``pip install 'yutori-mcp[tracing]'``).
+When tracing is off or OpenTelemetry is not installed, span() is a no-op
+and nothing from opentelemetry is imported.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from typing import Any
+
+from .config import env_str
+
+logger = logging.getLogger(__name__)
+
+TRACER_NAME = "yutori_mcp"
+DEFAULT_TRACE_FILE = "yutori-mcp-traces.jsonl"
+
+_tracer: Any = None
+
+
+class _NoopSpan:
+    """Stands in for an OpenTelemetry span when tracing is off."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def is_recording(self) -> bool:
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def enabled() -> bool:
+    return _tracer is not None
+
+
+def configure_tracing() -> bool:
+    """Install a tracer provider according to YUTORI_MCP_TRACING.
+
+    Returns True if tracing was enabled. Missing packages or an unknown
+    exporter are logged and leave tracing off.
+    """
+    global _tracer
+    mode = env_str("TRACING", "").strip().lower()
+    if not mode or mode in {"0", "off", "false", "none"}:
+        return False
+
+    try:
+        from opentelemetry import trace
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import (
+            BatchSpanProcessor,
+            ConsoleSpanExporter,
+            SimpleSpanProcessor,
+        )
+    except ImportError:
+        logger.warning(
+            "YUTORI_MCP_TRACING=%s requires OpenTelemetry: pip install 'yutori-mcp[tracing]'", mode
+        )
+        return False
+
+    from . import __version__
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": "yutori-mcp", "service.version": __version__})
+    )
+    if mode == "otlp":
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        except ImportError:
+            logger.warning(
+                "YUTORI_MCP_TRACING=otlp requires the OTLP exporter: pip install 'yutori-mcp[tracing]'"
+            )
+            return False
+        provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+    elif mode == "file":
+        path = env_str("TRACE_FILE", DEFAULT_TRACE_FILE)
+        out = open(path, "a", encoding="utf-8")  # noqa: SIM115 - lives as long as the provider
+        exporter = ConsoleSpanExporter(out=out, formatter=lambda span: span.to_json(indent=None) + "\n")
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+    else:
+        logger.warning("Unknown YUTORI_MCP_TRACING exporter %r (expected 'otlp' or 'file')", mode)
+        return False
+
+    trace.set_tracer_provider(provider)
+    _tracer = trace.get_tracer(TRACER_NAME, __version__)
+    logger.info("OpenTelemetry tracing enabled (%s exporter)", mode)
+    return True
+
+
+@contextmanager
+def span(
+    name: str,
+    attributes: Mapping[str, Any] | None = None,
+    *,
+    carrier: Mapping[str, Any] | None = None,
+) -> Iterator[Any]:
+    """Run the block inside a span; yields the span (a no-op when tracing is off).
+
+    Args:
+        attributes: Span attributes; None values are dropped.
+        carrier: W3C trace context (traceparent/tracestate) from the caller,
+            e.g. MCP request metadata. When present the span joins that trace.
+    """
+    if _tracer is None:
+        yield _NOOP_SPAN
+        return
+
+    context = None
+    if carrier:
+        from opentelemetry import propagate
+
+        context = propagate.extract({k: str(v) for k, v in carrier.items()})
+    clean = {k: v for k, v in (attributes or {}).items() if v is not None}
+    with _tracer.start_as_current_span(name, context=context, attributes=clean) as current:
+        yield current
@@ -0,0 +1,145 @@
+"""Optional cache warm-up when the server starts.
+
+Every session spawns a fresh server, so its first list_scouts and detail
+calls would each wait on the API. With YUTORI_MCP_WARMUP=<N>, once the
+client has completed the MCP handshake the server reads, in the background,
+the scout list (as list_scouts with default arguments returns it) and the
+details of N recently active scouts: those the previous session read first,
+then the listed active ones. The responses are held by the prefetcher (see
+prefetch.py), so the session's first matching calls are answered from
+memory.
+
+With YUTORI_MCP_CACHE_SNAPSHOT=<path>, the response cache is saved to that
+file when the server exits and loaded when it starts, so last known values
+are available before the first call (and while the API is down), and
+warm-up knows which scouts the previous session used.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+
+from .cache import ResponseCache, default_cache
+from .config import env_int, env_str
+from .prefetch import Prefetcher, default_prefetcher
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for the scout list before warming only the previous session's scouts
+_LIST_TIMEOUT = 15.0
+
+_SCOUT_READS = ("get_scout_detail", "get_scout_updates")
+
+
+class WarmUp:
+    """Loads the reads a session usually starts with, off the request path.
+
+    Args:
+        scouts: Scout details to warm; 0 disables the warm-up reads.
+        snapshot_path: Cache snapshot file to load at start and save at exit.
+    """
+
+    def __init__(
+        self,
+        scouts: int = 0,
+        snapshot_path: Path | None = None,
+        *,
+        cache: ResponseCache | None = None,
+        prefetcher: Prefetcher | None = None,
+    ) -> None:
+        self.scouts = scouts
+        self.snapshot_path = snapshot_path
+        self._cache = cache if cache is not None else default_cache()
+        self._prefetcher = prefetcher if prefetcher is not None else default_prefetcher()
+        self._started = False
+        self._snapshot_loaded = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> WarmUp:
+        path = env_str("CACHE_SNAPSHOT")
+        return cls(
+            scouts=max(0, env_int("WARMUP", 0)),
+            snapshot_path=Path(path).expanduser() if path else None,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.scouts > 0 or self.snapshot_path is not None
+
+    def start(self) -> threading.Thread | None:
+        """Run the warm-up in a background thread, once per process."""
+        with self._lock:
+            if not self.enabled or self._started:
+                return None
+            self._started = True
+        thread = threading.Thread(target=self.run, name="yutori-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def load_snapshot(self) -> None:
+        """Load the cache snapshot, if configured; only the first call reads it."""
+        with self._lock:
+            if self._snapshot_loaded or self.snapshot_path is None:
+                return
+            self._snapshot_loaded = True
+            loaded = self._cache.load(self.snapshot_path)
+        logger.debug("Loaded %d cached responses from %s", loaded, self.snapshot_path)
+
+    def run(self) -> None:
+        self.load_snapshot()
+        if self.scouts <= 0:
+            return
+        from .schemas import ListScoutsInput
+
+        # Schedule the list and the previous session's scouts together
+        listing = self._prefetcher.prefetch("list_scouts", **ListScoutsInput().model_dump(exclude_none=True))
+        wanted = self._recent_scouts()[: self.scouts]
+        for scout_id in wanted:
+            self._prefetcher.prefetch("get_scout_detail", scout_id)
+        if listing is None or len(wanted) >= self.scouts:
+            return
+        try:
+            scouts = (listing.result(timeout=_LIST_TIMEOUT) or {}).get("scouts") or []
+        except Exception as e:
+            logger.debug("Warm-up list_scouts failed: %s", e)
+            return
+        for scout in scouts:
+            if len(wanted) >= self.scouts:
+                break
+            scout_id = str(scout.get("id") or "") if isinstance(scout, dict) else ""
+            if scout_id and scout.get("status") == "active" and scout_id not in wanted:
+                wanted.append(scout_id)
+                self._prefetcher.prefetch("get_scout_detail", scout_id)
+
+    def save(self) -> None:
+        """Write the cache snapshot, if configured."""
+        if self.snapshot_path is not None:
+            saved = self._cache.save(self.snapshot_path)
+            logger.debug("Saved %d cached responses to %s", saved, self.snapshot_path)
+
+    def _recent_scouts(self) -> list[str]:
+        """Scouts with cached detail or updates, most recently fetched first."""
+        entries = sorted(
+            (entry for _, entry in self._cache.entries() if entry.operation in _SCOUT_READS),
+            key=lambda entry: entry.stored_at,
+            reverse=True,
+        )
+        ids: list[str] = []
+        for entry in entries:
+            if entry.resource_id and entry.resource_id not in ids:
+                ids.append(entry.resource_id)
+        return ids
+
+
+_default_warmup: WarmUp | None = None
+
+
+def default_warmup() -> WarmUp:
+    """Return the process-wide warm-up, configured from the environment on first use."""
+    global _default_warmup
+    if _default_warmup is None:
+        _default_warmup = WarmUp.from_env()
+    return _default_warmup
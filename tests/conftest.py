@@ -7,6 +7,29 @@ which contains fixtures for the full Yutori project (e.g., PostgresContainer).
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add src to path for imports
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
+
+
+class FakeClock:
+    """Manual clock for components that take a clock; sleep() advances it instantly."""
+
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture()
+def clock() -> FakeClock:
+    """A FakeClock at 0; suites starting elsewhere set clock.now or override this fixture."""
+    return FakeClock()
@@ -0,0 +1,389 @@
+"""A local stand-in for the Yutori REST API, for end-to-end and load tests.
+
+Implements the endpoints the SDK calls (scouts, paginated updates, browsing
+and research tasks) on a stdlib HTTP server, with state kept in memory:
+
+- Scouts are seeded from tests/payloads.py and support create, edit,
+  pause/resume/done and delete.
+- Updates are paginated with opaque cursors.
+- Browsing and research tasks progress queued -> running -> succeeded
+  over FakeAPIConfig.task_seconds.
+
+Faults are injected per request: a latency distribution (log-normal
+around a median), a random error rate and periodic 429 bursts with
+Retry-After. Point the server at it with
+YUTORI_MCP_API_BASE_URL=http://127.0.0.1:<port>/v1 and any YUTORI_API_KEY.
+
+Run standalone: python -m tests.fake_api --port 8765 --latency-ms 80 --error-rate 0.01
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from tests import payloads
+
+API_PREFIX = "/v1"
+
+
+@dataclass
+class FakeAPIConfig:
+    """Behaviour of the fake API.
+
+    Attributes:
+        latency_ms: Median response latency; 0 answers immediately.
+        latency_sigma: Log-normal shape; 0 makes latency fixed, 1 gives a heavy tail.
+        error_rate: Probability that a request fails with error_status.
+        error_status: Status returned for injected errors.
+        burst_every: Seconds between 429 bursts; 0 disables bursts.
+        burst_seconds: Length of each burst; every request in it gets 429.
+        task_seconds: Time for a browsing/research task to go from queued to succeeded.
+        scouts: Number of seeded scouts.
+        updates_per_scout: Number of updates each scout has.
+        seed: Seed for data generation and fault injection.
+    """
+
+    latency_ms: float = 0.0
+    latency_sigma: float = 0.5
+    error_rate: float = 0.0
+    error_status: int = 503
+    burst_every: float = 0.0
+    burst_seconds: float = 1.0
+    task_seconds: float = 2.0
+    scouts: int = 50
+    updates_per_scout: int = 30
+    seed: int = 0
+
+
+@dataclass
+class _Task:
+    kind: str
+    request: dict[str, Any]
+    created: float
+
+
+@dataclass
+class FakeAPIState:
+    """In-memory data plus request accounting."""
+
+    config: FakeAPIConfig
+    scouts: dict[str, dict[str, Any]] = field(default_factory=dict)
+    updates: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    tasks: dict[str, _Task] = field(default_factory=dict)
+    requests: Counter[str] = field(default_factory=Counter)
+    statuses: Counter[int] = field(default_factory=Counter)
+
+    def __post_init__(self) -> None:
+        self.lock = threading.Lock()
+        self.rng = random.Random(self.config.seed)
+        self.started = time.monotonic()
+        for scout in payloads.scout_list(self.config.scouts, seed=self.config.seed)["scouts"]:
+            self.scouts[scout["id"]] = scout
+        page = payloads.scout_updates(self.config.updates_per_scout, seed=self.config.seed)["updates"]
+        for scout_id in self.scouts:
+            self.updates[scout_id] = page
+
+    # -------------------------------------------------------------------------
+    # Fault injection
+    # -------------------------------------------------------------------------
+
+    def latency(self) -> float:
+        cfg = self.config
+        if cfg.latency_ms <= 0:
+            return 0.0
+        with self.lock:
+            z = self.rng.gauss(0.0, 1.0)
+        return cfg.latency_ms / 1000 * math.exp(cfg.latency_sigma * z)
+
+    def fault(self) -> tuple[int, dict[str, str]] | None:
+        """Return (status, headers) for an injected failure, or None."""
+        cfg = self.config
+        if cfg.burst_every > 0:
+            phase = (time.monotonic() - self.started) % cfg.burst_every
+            remaining = cfg.burst_seconds - phase
+            if remaining > 0:
+                return 429, {"Retry-After": str(max(1, math.ceil(remaining)))}
+        if cfg.error_rate > 0:
+            with self.lock:
+                roll = self.rng.random()
+            if roll < cfg.error_rate:
+                return cfg.error_status, {}
+        return None
+
+    # -------------------------------------------------------------------------
+    # Task progression
+    # -------------------------------------------------------------------------
+
+    def task_view(self, task_id: str, task: _Task) -> dict[str, Any]:
+        elapsed = time.monotonic() - task.created
+        total = self.config.task_seconds
+        view: dict[str, Any] = {"task_id": task_id, "status": "queued"}
+        if elapsed >= total:
+            view["status"] = "succeeded"
+            view["result"] = _task_result(task)
+            view["sources"] = [f"https://example.com/source/{i}" for i in range(5)]
+        elif elapsed >= total * 0.2:
+            view["status"] = "running"
+            view["progress"] = f"{int(100 * elapsed / total)}%"
+        return view
+
+
+def _task_result(task: _Task) -> Any:
+    if task.request.get("output_schema"):
+        fields = list(task.request["output_schema"]["items"]["properties"])
+        return [{f: f"{f} value {i}" for f in fields} for i in range(20)]
+    subject = task.request.get("query") or task.request.get("task", "")
+    return f"Findings for: {subject}\n\n" + "\n\n".join(f"Point {i}: details." for i in range(10))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: FakeYutoriAPI
+    protocol_version = "HTTP/1.1"
+    # headers and body are separate writes; without TCP_NODELAY each response waits on a delayed ACK
+    disable_nagle_algorithm = True
+
+    ROUTES: list[tuple[str, re.Pattern[str], str]] = [
+        ("GET", re.compile(r"/scouting/tasks"), "list_scouts"),
+        ("POST", re.compile(r"/scouting/tasks"), "create_scout"),
+        ("GET", re.compile(r"/scouting/tasks/(?P<id>[^/]+)/updates"), "get_updates"),
+        ("POST", re.compile(r"/scouting/tasks/(?P<id>[^/]+)/(?P<action>pause|resume|done)"), "set_status"),
+        ("GET", re.compile(r"/scouting/tasks/(?P<id>[^/]+)"), "get_scout"),
+        ("PATCH", re.compile(r"/scouting/tasks/(?P<id>[^/]+)"), "update_scout"),
+        ("DELETE", re.compile(r"/scouting/tasks/(?P<id>[^/]+)"), "delete_scout"),
+        ("POST", re.compile(r"/(?P<kind>browsing|research)/tasks"), "create_task"),
+        ("GET", re.compile(r"/(?P<kind>browsing|research)/tasks/(?P<id>[^/]+)"), "get_task"),
+    ]
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:  # noqa: N802
+        self._dispatch("POST")
+
+    def do_PATCH(self) -> None:  # noqa: N802
+        self._dispatch("PATCH")
+
+    def do_DELETE(self) -> None:  # noqa: N802
+        self._dispatch("DELETE")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _dispatch(self, method: str) -> None:
+        state = self.server.state
+        url = urlsplit(self.path)
+        path = url.path[len(API_PREFIX) :] if url.path.startswith(API_PREFIX) else url.path
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else {}
+
+        for route_method, pattern, name in self.ROUTES:
+            match = pattern.fullmatch(path)
+            if route_method == method and match:
+                break
+        else:
+            self._respond(404, {"detail": "Not found"})
+            return
+
+        with state.lock:
+            state.requests[name] += 1
+        delay = state.latency()
+        if delay:
+            time.sleep(delay)
+        if not self.headers.get("x-api-key"):
+            self._respond(401, {"detail": "Missing API key"})
+            return
+        fault = state.fault()
+        if fault is not None:
+            status, headers = fault
+            self._respond(status, {"detail": "Injected failure"}, headers)
+            return
+
+        with state.lock:
+            status, payload = getattr(self, "_" + name)(state, query, body, **match.groupdict())
+        self._respond(status, payload)
+
+    def _respond(self, status: int, payload: Any, headers: dict[str, str] | None = None) -> None:
+        state = self.server.state
+        with state.lock:
+            state.statuses[status] += 1
+        data = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    # -------------------------------------------------------------------------
+    # Endpoints (called with state.lock held)
+    # -------------------------------------------------------------------------
+
+    def _list_scouts(self, state: FakeAPIState, query: dict[str, str], body: Any) -> tuple[int, Any]:
+        scouts = list(state.scouts.values())
+        if "status" in query:
+            scouts = [s for s in scouts if s["status"] == query["status"]]
+        limit = int(query.get("page_size") or query.get("limit") or 10)
+        summary = Counter(s["status"] for s in state.scouts.values())
+        return 200, {
+            "scouts": scouts[:limit],
+            "total": len(scouts),
+            "summary": {k: summary.get(k, 0) for k in ("active", "paused", "done")},
+            "has_more": len(scouts) > limit,
+        }
+
+    def _create_scout(self, state: FakeAPIState, query: dict[str, str], body: Any) -> tuple[int, Any]:
+        scout_id = str(uuid.UUID(int=state.rng.getrandbits(128)))
+        scout = {
+            "id": scout_id,
+            "query": body.get("query", ""),
+            "display_name": body.get("query", "")[:40],
+            "status": "active",
+            "output_interval": body.get("output_interval", 86400),
+            "created_at": "2025-01-01T00:00:00Z",
+            "next_output_timestamp": "2025-01-02T00:00:00Z",
+        }
+        state.scouts[scout_id] = scout
+        state.updates[scout_id] = []
+        return 200, scout
+
+    def _get_scout(self, state: FakeAPIState, query: dict[str, str], body: Any, id: str) -> tuple[int, Any]:
+        scout = state.scouts.get(id)
+        return (200, scout) if scout else (404, {"detail": "Scout not found"})
+
+    def _update_scout(self, state: FakeAPIState, query: dict[str, str], body: Any, id: str) -> tuple[int, Any]:
+        scout = state.scouts.get(id)
+        if scout is None:
+            return 404, {"detail": "Scout not found"}
+        scout.update({k: v for k, v in body.items() if k != "output_schema"})
+        return 200, scout
+
+    def _set_status(
+        self, state: FakeAPIState, query: dict[str, str], body: Any, id: str, action: str
+    ) -> tuple[int, Any]:
+        scout = state.scouts.get(id)
+        if scout is None:
+            return 404, {"detail": "Scout not found"}
+        scout["status"] = {"pause": "paused", "resume": "active", "done": "done"}[action]
+        return 200, scout
+
+    def _delete_scout(self, state: FakeAPIState, query: dict[str, str], body: Any, id: str) -> tuple[int, Any]:
+        if state.scouts.pop(id, None) is None:
+            return 404, {"detail": "Scout not found"}
+        state.updates.pop(id, None)
+        return 204, None
+
+    def _get_updates(self, state: FakeAPIState, query: dict[str, str], body: Any, id: str) -> tuple[int, Any]:
+        if id not in state.scouts:
+            return 404, {"detail": "Scout not found"}
+        updates = state.updates.get(id, [])
+        limit = int(query.get("limit") or 10)
+        offset = int(query["cursor"]) if query.get("cursor", "").isdigit() else 0
+        page = updates[offset : offset + limit]
+        has_more = offset + limit < len(updates)
+        return 200, {
+            "updates": page,
+            "has_more": has_more,
+            "next_cursor": str(offset + limit) if has_more else None,
+        }
+
+    def _create_task(self, state: FakeAPIState, query: dict[str, str], body: Any, kind: str) -> tuple[int, Any]:
+        task_id = str(uuid.UUID(int=state.rng.getrandbits(128)))
+        state.tasks[task_id] = _Task(kind, body, time.monotonic())
+        return 200, {"task_id": task_id, "status": "queued", "view_url": f"https://example.com/{kind}/{task_id}"}
+
+    def _get_task(self, state: FakeAPIState, query: dict[str, str], body: Any, kind: str, id: str) -> tuple[int, Any]:
+        task = state.tasks.get(id)
+        if task is None or task.kind != kind:
+            return 404, {"detail": "Task not found"}
+        return 200, state.task_view(id, task)
+
+
+class FakeYutoriAPI(ThreadingHTTPServer):
+    """The fake API server. Use as a context manager to run it in a background thread."""
+
+    daemon_threads = True
+
+    def __init__(self, config: FakeAPIConfig | None = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        super().__init__((host, port), _Handler)
+        self.state = FakeAPIState(config or FakeAPIConfig())
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def start(self) -> FakeYutoriAPI:
+        self._thread = threading.Thread(target=self.serve_forever, name="fake-yutori-api", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self) -> FakeYutoriAPI:
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+def add_config_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add FakeAPIConfig options to an argument parser (shared with the load driver)."""
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Median upstream latency")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="Log-normal latency spread")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests that fail")
+    parser.add_argument("--error-status", type=int, default=503, help="Status of injected failures")
+    parser.add_argument("--burst-every", type=float, default=0.0, help="Seconds between 429 bursts")
+    parser.add_argument("--burst-seconds", type=float, default=1.0, help="Length of each 429 burst")
+    parser.add_argument("--task-seconds", type=float, default=2.0, help="Time for tasks to succeed")
+    parser.add_argument("--scouts", type=int, default=50, help="Number of seeded scouts")
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def config_from_args(args: argparse.Namespace) -> FakeAPIConfig:
+    return FakeAPIConfig(
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        burst_every=args.burst_every,
+        burst_seconds=args.burst_seconds,
+        task_seconds=args.task_seconds,
+        scouts=args.scouts,
+        seed=args.seed,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a fake Yutori API")
+    parser.add_argument("--port", type=int, default=8765)
+    add_config_arguments(parser)
+    args = parser.parse_args()
+    server = FakeYutoriAPI(config_from_args(args), port=args.port)
+    print(f"Fake Yutori API on {server.base_url}  (YUTORI_MCP_API_BASE_URL={server.base_url})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
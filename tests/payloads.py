@@ -0,0 +1,119 @@
+"""Deterministic synthetic API payloads at production sizes.
+
+Shapes follow the Yutori API responses the formatters consume; sizes are
+chosen to match the largest responses seen in practice. Every generator
+takes a seed so benchmark inputs (and output sizes) are reproducible.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+_WORDS = (
+    "funding announcement series seed startup pricing gpu cluster hourly rate launch product "
+    "release update partnership acquisition report analyst market share model benchmark "
+    "latency region availability contract customer enterprise revenue quarter guidance"
+).split()
+
+_STATUSES = ("active", "paused", "done")
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _paragraph(rng: random.Random, sentences: int = 5) -> str:
+    return " ".join(_sentence(rng, rng.randint(8, 20)) for _ in range(sentences))
+
+
+def _uuid(rng: random.Random) -> str:
+    h = f"{rng.getrandbits(128):032x}"
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def scout_list(count: int = 1000, seed: int = 0) -> dict[str, Any]:
+    """A list_scouts response with count scouts."""
+    rng = random.Random(seed)
+    scouts = []
+    for i in range(count):
+        status = rng.choice(_STATUSES)
+        scouts.append(
+            {
+                "id": _uuid(rng),
+                "display_name": f"Scout {i}: {_sentence(rng, 4)}",
+                "query": _sentence(rng, rng.randint(10, 40)),
+                "status": status,
+                "output_interval": rng.choice((1800, 3600, 86400, 604800)),
+                "next_output_timestamp": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T08:00:00Z",
+                "created_at": "2024-06-01T12:00:00Z",
+            }
+        )
+    summary = {s: sum(1 for scout in scouts if scout["status"] == s) for s in _STATUSES}
+    return {"scouts": scouts, "total": count, "summary": summary, "has_more": False}
+
+
+def scout_updates(
+    count: int = 100,
+    paragraphs: int = 12,
+    findings: int = 20,
+    sources: int = 40,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """A get_scout_updates page with long content and many sources per update.
+
+    Consecutive updates share most paragraphs, findings and sources, as
+    successive runs of a real scout do, so delta mode has work to do.
+    """
+    rng = random.Random(seed)
+    pool_paragraphs = [_paragraph(rng) for _ in range(paragraphs * 3)]
+    pool_sources = [f"https://news.example.com/{rng.choice(_WORDS)}/{i}" for i in range(sources * 3)]
+    updates = []
+    for i in range(count):
+        offset = i % (paragraphs * 2)
+        body = pool_paragraphs[offset : offset + paragraphs]
+        updates.append(
+            {
+                "id": _uuid(rng),
+                "created_at": f"2025-03-{1 + i % 28:02d}T{i % 24:02d}:00:00Z",
+                "content": "\n\n".join(body),
+                "findings": [
+                    {"title": _sentence(rng, 8), "url": pool_sources[(offset + j) % len(pool_sources)]}
+                    for j in range(findings)
+                ],
+                "sources": pool_sources[offset : offset + sources],
+            }
+        )
+    return {"updates": updates, "has_more": True, "next_cursor": "cursor-" + _uuid(rng)}
+
+
+def task_result(rows: int = 10_000, fields: int = 6, seed: int = 0) -> dict[str, Any]:
+    """A succeeded task whose structured result is a list of rows."""
+    rng = random.Random(seed)
+    names = [f"field_{f}" for f in range(fields)]
+    result = [{name: _sentence(rng, rng.randint(2, 10)) for name in names} for _ in range(rows)]
+    return {
+        "task_id": _uuid(rng),
+        "status": "succeeded",
+        "result": result,
+        "sources": [f"https://example.com/source/{i}" for i in range(25)],
+    }
+
+
+def nested_result(sections: int = 50, records: int = 40, depth: int = 4, seed: int = 0) -> dict[str, Any]:
+    """A structured result of nested sections, exercising dict_to_markdown."""
+    rng = random.Random(seed)
+
+    def record(level: int) -> dict[str, Any]:
+        node: dict[str, Any] = {
+            "title": _sentence(rng, 5),
+            "url": f"https://example.com/{rng.getrandbits(32):08x}",
+            "tags": [rng.choice(_WORDS) for _ in range(3)],
+        }
+        if level < depth:
+            node["details"] = record(level + 1)
+        return node
+
+    return {
+        f"section_{s}": {f"record_{r}": record(1) for r in range(records)} for s in range(sections)
+    }
@@ -1,18 +1,37 @@
 """Tests for the MCP adapter error mapping and argument forwarding."""
 
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from yutori.exceptions import APIError, AuthenticationError
-from yutori_mcp.adapter import MCPClientAdapter, YutoriAPIError, _strip_none
+from yutori_mcp import metrics
+from yutori_mcp.adapter import CallCancelled, MCPClientAdapter, YutoriAPIError, _strip_none
+from yutori_mcp.breaker import CircuitBreaker
+from yutori_mcp.cache import ResponseCache
+from yutori_mcp.idempotency import TaskDeduplicator
+from yutori_mcp.ratelimit import RateLimiter
+from yutori_mcp.retry import RetryPolicy
+from yutori_mcp.singleflight import SingleFlight
+
+# Retries run without sleeping so error-path tests stay fast
+FAST_RETRIES = RetryPolicy(base_delay=0, max_delay=0)
 
 
 @pytest.fixture()
 def adapter():
     with patch("yutori_mcp.adapter.resolve_api_key", return_value="yt-test-key"), \
          patch("yutori_mcp.adapter.YutoriClient"):
-        return MCPClientAdapter()
+        return MCPClientAdapter(
+            retry_policy=FAST_RETRIES,
+            rate_limiter=RateLimiter.unlimited(),
+            breaker=CircuitBreaker(failure_rate=0),
+            cache=ResponseCache(),
+            singleflight=SingleFlight(),
+            task_deduplicator=TaskDeduplicator(),
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -102,6 +121,13 @@ class TestAdapterInit:
             with pytest.raises(ValueError, match="API key required"):
                 MCPClientAdapter()
 
+    def test_deadline_caps_http_timeout_and_retry_deadline(self):
+        with patch("yutori_mcp.adapter.resolve_api_key", return_value="yt-key"), \
+             patch("yutori_mcp.adapter.YutoriClient") as mock_client_cls:
+            adapter = MCPClientAdapter(retry_policy=RetryPolicy(deadline=30), deadline=5)
+        mock_client_cls.assert_called_once_with(api_key="yt-key", timeout=5)
+        assert adapter._retry_policy.deadline == 5
+
     def test_creates_client_with_resolved_key(self):
         with patch("yutori_mcp.adapter.resolve_api_key", return_value="yt-key"), \
              patch("yutori_mcp.adapter.YutoriClient") as mock_client_cls:
@@ -173,3 +199,312 @@ class TestEditScoutForwarding:
         _, kwargs = adapter._client.scouts.update.call_args
         assert kwargs["query"] == "updated query"
         assert kwargs["skip_email"] is True
+
+
+# ---------------------------------------------------------------------------
+# Retries
+# ---------------------------------------------------------------------------
+
+
+class TestRetries:
+    """Transient failures are absorbed by the adapter instead of the model."""
+
+    def test_read_retried_until_success(self, adapter):
+        adapter._client.scouts.get = MagicMock(
+            side_effect=[APIError(message="busy", status_code=503), {"id": "s1"}]
+        )
+        assert adapter.get_scout_detail("s1") == {"id": "s1"}
+        assert adapter._client.scouts.get.call_count == 2
+
+    def test_attempts_recorded_in_metrics(self, adapter):
+        failed = metrics.upstream_requests.value("get_scout_detail", "503")
+        succeeded = metrics.upstream_requests.value("get_scout_detail", "2xx")
+        adapter._client.scouts.get = MagicMock(
+            side_effect=[APIError(message="busy", status_code=503), {"id": "s1"}]
+        )
+        adapter.get_scout_detail("s1")
+        assert metrics.upstream_requests.value("get_scout_detail", "503") == failed + 1
+        assert metrics.upstream_requests.value("get_scout_detail", "2xx") == succeeded + 1
+        assert adapter.upstream_seconds > 0
+
+    def test_read_gives_up_after_attempts(self, adapter):
+        adapter._client.scouts.list = MagicMock(side_effect=APIError(message="down", status_code=502))
+        with pytest.raises(YutoriAPIError) as exc_info:
+            adapter.list_scouts()
+        assert exc_info.value.status_code == 502
+        assert adapter._client.scouts.list.call_count == FAST_RETRIES.read_attempts
+
+    def test_client_errors_not_retried(self, adapter):
+        adapter._client.scouts.get = MagicMock(side_effect=APIError(message="missing", status_code=404))
+        with pytest.raises(YutoriAPIError):
+            adapter.get_scout_detail("nope")
+        assert adapter._client.scouts.get.call_count == 1
+
+    def test_write_not_retried_on_server_error(self, adapter):
+        adapter._client.research.create = MagicMock(side_effect=APIError(message="oops", status_code=500))
+        with pytest.raises(YutoriAPIError):
+            adapter.run_research_task("query")
+        assert adapter._client.research.create.call_count == 1
+
+    def test_write_retried_on_rate_limit(self, adapter):
+        adapter._client.research.create = MagicMock(
+            side_effect=[APIError(message="slow down", status_code=429), {"task_id": "t1"}]
+        )
+        assert adapter.run_research_task("query") == {"task_id": "t1"}
+        assert adapter._client.research.create.call_count == 2
+
+    def test_retry_after_header_captured(self, adapter):
+        response = MagicMock(headers={"Retry-After": "0"})
+        adapter._client.scouts.get = MagicMock(
+            side_effect=APIError(message="slow down", status_code=400, response=response)
+        )
+        with pytest.raises(YutoriAPIError) as exc_info:
+            adapter.get_scout_detail("s1")
+        assert exc_info.value.retry_after == 0.0
+
+
+class TestRateLimiting:
+    """Every HTTP attempt draws a token from the operation's bucket."""
+
+    def test_each_attempt_acquires_token(self, adapter):
+        limiter = MagicMock()
+        adapter._rate_limiter = limiter
+        adapter._client.scouts.get = MagicMock(
+            side_effect=[APIError(message="busy", status_code=503), {"id": "s1"}]
+        )
+        adapter.get_scout_detail("s1")
+        assert limiter.acquire.call_count == 2
+        assert limiter.acquire.call_args.args == ("get_scout_detail",)
+
+    def test_retry_waits_only_for_the_time_left(self, adapter):
+        limiter = MagicMock()
+        adapter._rate_limiter = limiter
+
+        responses = iter([APIError(message="busy", status_code=503), {"id": "s1"}])
+
+        def get(scout_id):
+            response = next(responses)
+            if isinstance(response, Exception):
+                time.sleep(0.2)
+                raise response
+            return response
+
+        adapter._client.scouts.get = MagicMock(side_effect=get)
+        adapter.get_scout_detail("s1")
+        first, second = (c.kwargs["timeout"] for c in limiter.acquire.call_args_list)
+        assert first <= adapter._retry_policy.deadline
+        assert second <= first - 0.2
+
+    def test_token_is_taken_outside_the_breaker(self, adapter):
+        order = MagicMock()
+        adapter._rate_limiter = order.limiter
+        adapter._breaker = order.breaker
+        adapter._client.scouts.get = MagicMock(return_value={"id": "s1"})
+        adapter.get_scout_detail("s1")
+        calls = [name for name, _, _ in order.mock_calls]
+        assert calls.index("limiter.acquire") < calls.index("breaker.guard")
+
+    def test_write_uses_operation_name(self, adapter):
+        limiter = MagicMock()
+        adapter._rate_limiter = limiter
+        adapter._client.browsing.create = MagicMock(return_value={"task_id": "t1"})
+        adapter.run_browsing_task("task", "https://example.com")
+        assert limiter.acquire.call_args.args == ("run_browsing_task",)
+
+
+class TestCircuitBreakerFallback:
+    """An open circuit fails fast and serves cached reads where possible."""
+
+    @pytest.fixture()
+    def open_adapter(self, adapter):
+        adapter._breaker = CircuitBreaker(failure_rate=0.5, min_calls=1, cooldown=60)
+        return adapter
+
+    def test_serves_stale_read_when_open(self, open_adapter):
+        open_adapter._client.scouts.get = MagicMock(
+            side_effect=[{"id": "s1", "status": "active"}] + [APIError(message="down", status_code=503)] * 10
+        )
+        assert open_adapter.get_scout_detail("s1")["status"] == "active"
+        assert open_adapter.stale_age is None
+
+        # First failure trips the breaker; the retry is rejected and the cache serves
+        assert open_adapter.get_scout_detail("s1") == {"id": "s1", "status": "active"}
+        assert open_adapter.stale_age is not None
+        assert open_adapter._client.scouts.get.call_count == 2
+
+    def test_fails_fast_without_cache(self, open_adapter):
+        open_adapter._client.scouts.list = MagicMock(side_effect=APIError(message="down", status_code=503))
+        with pytest.raises(YutoriAPIError):
+            open_adapter.list_scouts()
+        with pytest.raises(YutoriAPIError) as exc_info:
+            open_adapter.list_scouts()
+        assert exc_info.value.status_code == 503
+        assert "circuit open" in exc_info.value.message
+        assert open_adapter._client.scouts.list.call_count == 1
+
+    def test_client_errors_do_not_trip(self, open_adapter):
+        open_adapter._client.scouts.get = MagicMock(side_effect=APIError(message="missing", status_code=404))
+        for _ in range(3):
+            with pytest.raises(YutoriAPIError) as exc_info:
+                open_adapter.get_scout_detail("nope")
+            assert exc_info.value.status_code == 404
+        assert open_adapter._breaker.state == "closed"
+
+
+class TestCacheInvalidation:
+    def test_scout_write_invalidates_cached_reads(self, adapter):
+        adapter._client.scouts.get = MagicMock(return_value={"id": "s1"})
+        adapter._client.scouts.list = MagicMock(return_value={"scouts": []})
+        adapter._client.scouts.update = MagicMock(return_value={"id": "s1"})
+        adapter.get_scout_detail("s1")
+        adapter.get_scout_detail("s2")
+        adapter.list_scouts()
+        assert len(adapter._cache) == 3
+
+        adapter.edit_scout("s1", status="paused")
+        assert len(adapter._cache) == 1
+
+
+class TestCancellation:
+    """cancel() aborts in-flight work instead of letting it run to completion."""
+
+    def test_cancelled_adapter_makes_no_requests(self, adapter):
+        adapter._client.scouts.list = MagicMock(return_value={})
+        adapter.cancel()
+        with pytest.raises(CallCancelled):
+            adapter.list_scouts()
+        adapter._client.scouts.list.assert_not_called()
+
+    def test_aborted_request_raises_cancelled_not_api_error(self, adapter):
+        def aborted(**kwargs):
+            adapter.cancel()
+            raise RuntimeError("client has been closed")
+
+        adapter._breaker = CircuitBreaker(failure_rate=0.5, min_calls=1)
+        adapter._client.scouts.list = MagicMock(side_effect=aborted)
+        with pytest.raises(CallCancelled):
+            adapter.list_scouts()
+        assert adapter._breaker.state == "closed"
+
+    def test_cancel_interrupts_backoff(self, adapter):
+        adapter._retry_policy = RetryPolicy(deadline=30)
+        adapter._client.scouts.get = MagicMock(
+            side_effect=APIError(message="slow down", status_code=429, response=MagicMock(headers={"Retry-After": "20"}))
+        )
+        threading.Timer(0.1, adapter.cancel).start()
+        start = time.monotonic()
+        with pytest.raises(CallCancelled):
+            adapter.get_scout_detail("s1")
+        assert time.monotonic() - start < 5
+
+
+class TestCoalescing:
+    """Concurrent identical reads from separate adapters share one upstream call."""
+
+    @pytest.fixture()
+    def pair(self):
+        flights = SingleFlight()
+        with patch("yutori_mcp.adapter.resolve_api_key", return_value="yt-test-key"), \
+             patch("yutori_mcp.adapter.YutoriClient", side_effect=lambda **kw: MagicMock()):
+            return [
+                MCPClientAdapter(
+                    retry_policy=FAST_RETRIES,
+                    rate_limiter=RateLimiter.unlimited(),
+                    breaker=CircuitBreaker(failure_rate=0),
+                    cache=ResponseCache(),
+                    singleflight=flights,
+                )
+                for _ in range(2)
+            ]
+
+    def _run_concurrently(self, pair, call):
+        started, release = threading.Event(), threading.Event()
+
+        def slow(*args, **kwargs):
+            started.set()
+            release.wait(5)
+            return {"id": "s1"}
+
+        for a in pair:
+            a._client.scouts.get = MagicMock(side_effect=slow)
+        results = [None, None]
+        leader = threading.Thread(target=lambda: results.__setitem__(0, call(pair[0])))
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(target=lambda: results.__setitem__(1, call(pair[1])))
+        follower.start()
+        while pair[0]._flights.shared["get_scout_detail"] < 1:
+            time.sleep(0.01)
+        release.set()
+        leader.join(5)
+        follower.join(5)
+        return results
+
+    def test_identical_reads_share_one_call(self, pair):
+        results = self._run_concurrently(pair, lambda a: a.get_scout_detail("s1"))
+        assert results == [{"id": "s1"}, {"id": "s1"}]
+        assert pair[0]._client.scouts.get.call_count == 1
+        assert pair[1]._client.scouts.get.call_count == 0
+
+    def test_writes_are_not_coalesced(self, adapter):
+        adapter._client.scouts.delete = MagicMock(return_value={})
+        adapter.delete_scout("s1")
+        adapter.delete_scout("s1")
+        assert adapter._client.scouts.delete.call_count == 2
+        assert adapter._flights.snapshot()["leaders"] == {}
+
+    def test_follower_retries_when_leader_is_cancelled(self, pair):
+        started = threading.Event()
+
+        def aborted(*args, **kwargs):
+            started.set()
+            while not pair[0].cancelled:
+                time.sleep(0.01)
+            raise RuntimeError("client has been closed")
+
+        pair[0]._client.scouts.get = MagicMock(side_effect=aborted)
+        pair[1]._client.scouts.get = MagicMock(return_value={"id": "s1"})
+        errors = []
+
+        def lead():
+            try:
+                pair[0].get_scout_detail("s1")
+            except CallCancelled as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=lead)
+        leader.start()
+        started.wait(5)
+        threading.Timer(0.1, pair[0].cancel).start()
+        assert pair[1].get_scout_detail("s1") == {"id": "s1"}
+        leader.join(5)
+        assert len(errors) == 1
+        pair[1]._client.scouts.get.assert_called_once()
+
+
+class TestTaskDeduplication:
+    """Repeated identical task launches return the original task."""
+
+    def test_identical_launch_returns_original_task(self, adapter):
+        adapter._client.research.create = MagicMock(side_effect=[{"task_id": "t1"}, {"task_id": "t2"}])
+
+        assert adapter.run_research_task("GPU prices", user_timezone="UTC") == {"task_id": "t1"}
+        assert adapter.reused_task_age is None
+        assert adapter.run_research_task(" GPU prices ", user_timezone="UTC") == {"task_id": "t1"}
+
+        assert adapter.reused_task_age is not None
+        adapter._client.research.create.assert_called_once_with("GPU prices", user_timezone="UTC")
+
+    def test_idempotency_key_not_forwarded_and_distinguishes_launches(self, adapter):
+        adapter._client.browsing.create = MagicMock(side_effect=[{"task_id": "t1"}, {"task_id": "t2"}])
+
+        first = adapter.run_browsing_task("task", "https://example.com", idempotency_key="a")
+        second = adapter.run_browsing_task("task", "https://example.com", idempotency_key="b")
+
+        assert (first, second) == ({"task_id": "t1"}, {"task_id": "t2"})
+        assert "idempotency_key" not in adapter._client.browsing.create.call_args.kwargs
+
+    def test_different_arguments_launch_new_task(self, adapter):
+        adapter._client.research.create = MagicMock(side_effect=[{"task_id": "t1"}, {"task_id": "t2"}])
+        adapter.run_research_task("GPU prices")
+        assert adapter.run_research_task("GPU prices", user_location="Paris, FR") == {"task_id": "t2"}
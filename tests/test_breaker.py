@@ -0,0 +1,114 @@
+"""Tests for the Yutori API circuit breaker."""
+
+import httpx
+import pytest
+
+from yutori_mcp.adapter import YutoriAPIError
+from yutori_mcp.breaker import CircuitBreaker, CircuitOpenError, counts_as_failure
+from yutori_mcp.ratelimit import RateLimitTimeout
+
+
+@pytest.fixture()
+def make_breaker(clock):
+    def make(**kwargs):
+        params = {"failure_rate": 0.5, "min_calls": 4, "window": 10, "cooldown": 5}
+        params.update(kwargs)
+        return CircuitBreaker(**params, clock=clock)
+
+    return make
+
+
+def _fail(breaker, status=503):
+    with pytest.raises(YutoriAPIError):
+        with breaker.guard():
+            raise YutoriAPIError("down", status)
+
+
+def _succeed(breaker):
+    with breaker.guard():
+        pass
+
+
+class TestCountsAsFailure:
+    def test_classification(self):
+        assert counts_as_failure(YutoriAPIError("x", 503)) is True
+        assert counts_as_failure(YutoriAPIError("x", 408)) is True
+        assert counts_as_failure(YutoriAPIError("x", 404)) is False
+        assert counts_as_failure(httpx.ConnectTimeout("slow")) is True
+        assert counts_as_failure(RateLimitTimeout("local")) is None
+
+
+class TestCircuitBreaker:
+    def test_trips_at_failure_rate(self, make_breaker):
+        breaker = make_breaker()
+        _succeed(breaker)
+        _succeed(breaker)
+        _fail(breaker)
+        assert breaker.state == "closed"
+        _fail(breaker)
+        assert breaker.state == "open"
+
+    def test_needs_min_calls(self, make_breaker):
+        breaker = make_breaker(min_calls=10)
+        for _ in range(5):
+            _fail(breaker)
+        assert breaker.state == "closed"
+
+    def test_old_outcomes_leave_window(self, make_breaker, clock):
+        breaker = make_breaker(min_calls=2)
+        _fail(breaker)
+        clock.now = 20
+        _succeed(breaker)
+        _succeed(breaker)
+        assert breaker.state == "closed"
+
+    def test_open_fails_fast(self, make_breaker, clock):
+        breaker = make_breaker(min_calls=1)
+        _fail(breaker)
+        clock.now = 2
+        with pytest.raises(CircuitOpenError) as exc_info:
+            with breaker.guard():
+                pytest.fail("call should not run while open")
+        assert exc_info.value.retry_in == pytest.approx(3)
+        assert breaker.snapshot()["rejected"] == 1
+
+    def test_half_open_allows_single_probe(self, make_breaker, clock):
+        breaker = make_breaker(min_calls=1)
+        _fail(breaker)
+        clock.now = 5
+        assert breaker.state == "half_open"
+        with breaker.guard():
+            # A concurrent call while the probe is in flight is rejected
+            with pytest.raises(CircuitOpenError):
+                with breaker.guard():
+                    pass
+        assert breaker.state == "closed"
+
+    def test_failed_probe_reopens(self, make_breaker, clock):
+        breaker = make_breaker(min_calls=1)
+        _fail(breaker)
+        clock.now = 5
+        _fail(breaker)
+        assert breaker.state == "open"
+        assert breaker.snapshot()["transitions"] == {
+            "closed->open": 1,
+            "open->half_open": 1,
+            "half_open->open": 1,
+        }
+
+    def test_inconclusive_probe_releases_slot(self, make_breaker, clock):
+        breaker = make_breaker(min_calls=1)
+        _fail(breaker)
+        clock.now = 5
+        with pytest.raises(RateLimitTimeout):
+            with breaker.guard():
+                raise RateLimitTimeout("local")
+        assert breaker.state == "half_open"
+        _succeed(breaker)
+        assert breaker.state == "closed"
+
+    def test_zero_rate_disables(self, make_breaker):
+        breaker = make_breaker(failure_rate=0, min_calls=1)
+        for _ in range(5):
+            _fail(breaker)
+        assert breaker.state == "closed"
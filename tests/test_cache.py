@@ -0,0 +1,67 @@
+"""Tests for the in-process response cache."""
+
+from yutori_mcp.cache import ResponseCache, cache_key
+
+
+class TestCacheKey:
+    def test_kwargs_order_independent(self):
+        assert cache_key("op", ("a",), {"x": 1, "y": 2}) == cache_key("op", ("a",), {"y": 2, "x": 1})
+
+    def test_distinguishes_arguments(self):
+        assert cache_key("op", ("a",), {}) != cache_key("op", ("b",), {})
+        assert cache_key("op1", (), {}) != cache_key("op2", (), {})
+
+
+class TestResponseCache:
+    def test_put_get_with_age(self, clock):
+        cache = ResponseCache(clock=clock)
+        cache.put("k", {"v": 1}, operation="op")
+        clock.now += 30
+        entry = cache.get("k")
+        assert entry.value == {"v": 1}
+        assert entry.age(clock.now) == 30.0
+
+    def test_evicts_least_recently_used(self):
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", {}, operation="op")
+        cache.put("b", {}, operation="op")
+        cache.get("a")
+        cache.put("c", {}, operation="op")
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+
+    def test_invalidate_by_operation_and_resource(self):
+        cache = ResponseCache()
+        cache.put("list", {}, operation="list_scouts")
+        cache.put("s1", {}, operation="get_scout_detail", resource_id="s1")
+        cache.put("s1u", {}, operation="get_scout_updates", resource_id="s1")
+        cache.put("s2", {}, operation="get_scout_detail", resource_id="s2")
+        assert cache.invalidate(resource_id="s1") == 2
+        assert cache.invalidate(operation="list_scouts") == 1
+        assert len(cache) == 1
+
+    def test_zero_size_disables(self):
+        cache = ResponseCache(max_entries=0)
+        cache.put("k", {}, operation="op")
+        assert cache.get("k") is None
+
+    def test_snapshot_round_trip_keeps_age_and_order(self, tmp_path):
+        path = tmp_path / "cache.jsonl"
+        cache = ResponseCache(clock=lambda: 100.0)
+        cache.put("a", {"v": 1}, operation="list_scouts")
+        cache.put("b", {"v": 2}, operation="get_scout_detail", resource_id="s1")
+        assert cache.save(path) == 2
+
+        restored = ResponseCache(max_entries=2)
+        restored.put("live", {}, operation="op")
+        assert restored.load(path) == 2
+        assert restored.get("a") is None  # least recently used in the snapshot
+        entry = restored.get("b")
+        assert (entry.value, entry.stored_at, entry.resource_id) == ({"v": 2}, 100.0, "s1")
+        assert restored.get("live") is not None
+
+    def test_load_missing_or_corrupt_snapshot(self, tmp_path):
+        cache = ResponseCache()
+        assert cache.load(tmp_path / "missing.jsonl") == 0
+        (tmp_path / "bad.jsonl").write_text("not json\n{}\n")
+        assert cache.load(tmp_path / "bad.jsonl") == 0
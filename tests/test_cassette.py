@@ -0,0 +1,186 @@
+"""Tests for recording and replaying adapter traffic."""
+
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from yutori.exceptions import APIError
+from yutori_mcp.adapter import MCPClientAdapter, YutoriAPIError
+from yutori_mcp.breaker import CircuitBreaker
+from yutori_mcp.cache import ResponseCache
+from yutori_mcp.cassette import RECORD, REDACTED, REPLAY, Cassette, scrub
+from yutori_mcp.ratelimit import RateLimiter
+from yutori_mcp.retry import RetryPolicy
+from yutori_mcp.singleflight import SingleFlight
+
+API_KEY = "yt-secret-key-123"
+
+
+def make_adapter(cassette, api_key=API_KEY):
+    with patch("yutori_mcp.adapter.resolve_api_key", return_value=api_key), \
+         patch("yutori_mcp.adapter.YutoriClient"):
+        return MCPClientAdapter(
+            retry_policy=RetryPolicy(base_delay=0, max_delay=0),
+            rate_limiter=RateLimiter.unlimited(),
+            breaker=CircuitBreaker(failure_rate=0),
+            cache=ResponseCache(max_entries=0),
+            singleflight=SingleFlight(enabled=False),
+            cassette=cassette,
+        )
+
+
+def read_lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestRecord:
+    def test_writes_one_compact_line_per_attempt(self, tmp_path):
+        path = tmp_path / "session.jsonl"
+        adapter = make_adapter(Cassette(path, RECORD))
+        adapter._client.scouts.list = MagicMock(return_value={"scouts": [{"id": "s1"}]})
+        adapter._client.scouts.get = MagicMock(side_effect=APIError(message="Scout not found", status_code=404))
+
+        adapter.list_scouts(limit=5)
+        with pytest.raises(YutoriAPIError):
+            adapter.get_scout_detail("missing")
+
+        ok, failed = read_lines(path)
+        assert ok["op"] == "list_scouts" and ok["kwargs"] == {"limit": 5}
+        assert ok["body"] == {"scouts": [{"id": "s1"}]}
+        assert ok["ms"] >= 0
+        assert (failed["op"], failed["args"], failed["status"]) == ("get_scout_detail", ["missing"], 404)
+        assert failed["error"] == "Scout not found" and "body" not in failed
+        assert ", " not in path.read_text()
+
+    def test_appends_across_cassettes(self, tmp_path):
+        path = tmp_path / "session.jsonl"
+        for _ in range(2):
+            cassette = Cassette(path, RECORD)
+            adapter = make_adapter(cassette)
+            adapter._client.scouts.list = MagicMock(return_value={"scouts": []})
+            adapter.list_scouts()
+            cassette.close()
+        assert len(read_lines(path)) == 2
+
+    def test_api_key_is_scrubbed(self, tmp_path):
+        path = tmp_path / "session.jsonl"
+        adapter = make_adapter(Cassette(path, RECORD))
+        adapter._client.scouts.create = MagicMock(
+            return_value={"id": "s1", "webhook_url": f"https://hooks.example.com/?key={API_KEY}", "api_key": "x"}
+        )
+
+        adapter.create_scout("GPU prices", webhook_url=f"https://hooks.example.com/?key={API_KEY}")
+
+        text = path.read_text()
+        assert API_KEY not in text
+        (line,) = read_lines(path)
+        assert line["body"]["api_key"] == REDACTED
+        assert line["kwargs"]["webhook_url"] == f"https://hooks.example.com/?key={REDACTED}"
+
+    def test_network_errors_recorded_with_type(self, tmp_path):
+        path = tmp_path / "session.jsonl"
+        adapter = make_adapter(Cassette(path, RECORD))
+        adapter._client.scouts.list = MagicMock(side_effect=[httpx.ConnectError("refused"), {"scouts": []}])
+
+        adapter.list_scouts()
+
+        failed, ok = read_lines(path)
+        assert failed["error_type"] == "ConnectError" and failed["status"] is None
+        assert ok["body"] == {"scouts": []}
+
+
+class TestReplay:
+    @pytest.fixture()
+    def recorded(self, tmp_path):
+        path = tmp_path / "session.jsonl"
+        cassette = Cassette(path, RECORD)
+        adapter = make_adapter(cassette)
+        adapter._client.scouts.list = MagicMock(side_effect=[{"scouts": [], "page": 1}, {"scouts": [], "page": 2}])
+        adapter._client.scouts.get = MagicMock(
+            side_effect=[APIError(message="Unavailable", status_code=503), {"id": "s1"}]
+        )
+        adapter.list_scouts(limit=5)
+        adapter.list_scouts(limit=5)
+        adapter.get_scout_detail("s1")
+        cassette.close()
+        return path
+
+    def test_serves_recorded_responses_in_order_without_network(self, recorded):
+        adapter = make_adapter(Cassette(recorded, REPLAY, timing=0))
+
+        assert adapter.list_scouts(limit=5)["page"] == 1
+        assert adapter.list_scouts(limit=5)["page"] == 2
+        assert adapter.list_scouts(limit=5)["page"] == 2
+        adapter._client.scouts.list.assert_not_called()
+
+    def test_recorded_errors_are_replayed_and_retried(self, recorded):
+        adapter = make_adapter(Cassette(recorded, REPLAY, timing=0))
+        assert adapter.get_scout_detail("s1") == {"id": "s1"}
+
+    def test_unrecorded_request_is_404(self, recorded):
+        adapter = make_adapter(Cassette(recorded, REPLAY, timing=0))
+        with pytest.raises(YutoriAPIError) as exc_info:
+            adapter.list_scouts(limit=50)
+        assert exc_info.value.status_code == 404
+
+    def test_network_errors_replayed_as_httpx_errors(self, tmp_path):
+        path = tmp_path / "session.jsonl"
+        path.write_text(json.dumps({"op": "list_scouts", "args": [], "kwargs": {}, "ms": 1,
+                                    "status": None, "error": "refused", "error_type": "ConnectError"}) + "\n")
+        adapter = make_adapter(Cassette(path, REPLAY, timing=0))
+        adapter._retry_policy = RetryPolicy(read_attempts=1)
+        with pytest.raises(httpx.ConnectError):
+            adapter.list_scouts()
+
+    def test_timings_are_scaled(self, tmp_path):
+        path = tmp_path / "session.jsonl"
+        path.write_text(json.dumps({"op": "list_scouts", "args": [], "kwargs": {}, "ms": 200, "body": {}}) + "\n")
+
+        for timing, low, high in ((0.5, 0.09, 0.19), (0, 0, 0.05)):
+            adapter = make_adapter(Cassette(path, REPLAY, timing=timing))
+            start = time.perf_counter()
+            adapter.list_scouts()
+            assert low <= time.perf_counter() - start < high
+
+    def test_no_api_key_needed(self, recorded):
+        adapter = make_adapter(Cassette(recorded, REPLAY, timing=0), api_key=None)
+        assert adapter.list_scouts(limit=5)["page"] == 1
+
+    def test_malformed_lines_are_skipped(self, tmp_path):
+        path = tmp_path / "session.jsonl"
+        path.write_text('not json\n{"args": []}\n' + json.dumps({"op": "list_scouts", "body": {"ok": 1}}) + "\n")
+        adapter = make_adapter(Cassette(path, REPLAY, timing=0))
+        assert adapter.list_scouts() == {"ok": 1}
+
+
+class TestFromEnv:
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("YUTORI_MCP_CASSETTE", raising=False)
+        assert Cassette.from_env().mode == "off"
+
+    def test_record_is_default_mode(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("YUTORI_MCP_CASSETTE", str(tmp_path / "c.jsonl"))
+        monkeypatch.delenv("YUTORI_MCP_CASSETTE_MODE", raising=False)
+        assert Cassette.from_env().recording
+
+    def test_replay_with_timing(self, monkeypatch, tmp_path):
+        path = tmp_path / "c.jsonl"
+        path.write_text("")
+        monkeypatch.setenv("YUTORI_MCP_CASSETTE", str(path))
+        monkeypatch.setenv("YUTORI_MCP_CASSETTE_MODE", "replay")
+        monkeypatch.setenv("YUTORI_MCP_CASSETTE_TIMING", "0.25")
+        cassette = Cassette.from_env()
+        assert cassette.replaying and cassette.timing == 0.25
+
+    def test_missing_replay_file_disables(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("YUTORI_MCP_CASSETTE", str(tmp_path / "missing.jsonl"))
+        monkeypatch.setenv("YUTORI_MCP_CASSETTE_MODE", "replay")
+        assert Cassette.from_env().mode == "off"
+
+
+def test_scrub_redacts_nested_fields():
+    value = {"headers": {"Authorization": "Bearer x"}, "items": [{"token": "t", "name": "ok"}]}
+    assert scrub(value) == {"headers": {"Authorization": REDACTED}, "items": [{"token": REDACTED, "name": "ok"}]}
@@ -0,0 +1,88 @@
+"""Tests for the cached API key resolution."""
+
+import json
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from yutori_mcp.credentials import CredentialCache
+
+
+@pytest.fixture()
+def config_file(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text('{"api_key": "yt-one"}')
+    return path
+
+
+@pytest.fixture()
+def make_cache(config_file, monkeypatch, clock):
+    monkeypatch.delenv("YUTORI_API_KEY", raising=False)
+
+    def make(check_interval=1.0, resolve=None):
+        resolve = resolve or MagicMock(side_effect=lambda: json.loads(config_file.read_text())["api_key"])
+        cache = CredentialCache(
+            check_interval, resolve=resolve, config_path=lambda: config_file, clock=clock
+        )
+        return cache, resolve, clock
+
+    return make
+
+
+def _rewrite(path, key):
+    st = path.stat()
+    path.write_text(f'{{"api_key": "{key}"}}')
+    # Make sure the mtime moves even on coarse-grained filesystems
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestCredentialCache:
+    def test_resolves_once(self, make_cache):
+        cache, resolve, clock = make_cache()
+        assert cache.get() == "yt-one"
+        clock.now += 5
+        assert cache.get() == "yt-one"
+        assert resolve.call_count == 1
+
+    def test_picks_up_new_login(self, make_cache, config_file):
+        cache, resolve, clock = make_cache()
+        assert cache.get() == "yt-one"
+        _rewrite(config_file, "yt-two")
+        # Not checked again within the interval
+        assert cache.get() == "yt-one"
+        clock.now += 1
+        assert cache.get() == "yt-two"
+        assert resolve.call_count == 2
+
+    def test_picks_up_logout(self, make_cache, config_file):
+        resolve = MagicMock(side_effect=lambda: json.loads(config_file.read_text())["api_key"] if config_file.exists() else None)
+        cache, _, clock = make_cache(resolve=resolve)
+        assert cache.get() == "yt-one"
+        config_file.unlink()
+        clock.now += 1
+        assert cache.get() is None
+
+    def test_env_var_change_resolves_immediately(self, make_cache, monkeypatch):
+        cache, resolve, _ = make_cache()
+        cache.get()
+        monkeypatch.setenv("YUTORI_API_KEY", "yt-env")
+        cache.get()
+        assert resolve.call_count == 2
+
+    def test_invalidate(self, make_cache):
+        cache, resolve, _ = make_cache()
+        cache.get()
+        cache.invalidate()
+        cache.get()
+        assert resolve.call_count == 2
+
+    def test_zero_interval_checks_every_time(self, make_cache, config_file):
+        cache, _, _ = make_cache(check_interval=0)
+        assert cache.get() == "yt-one"
+        _rewrite(config_file, "yt-two")
+        assert cache.get() == "yt-two"
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("YUTORI_MCP_CREDENTIAL_CHECK_INTERVAL", "5")
+        assert CredentialCache.from_env().check_interval == 5.0
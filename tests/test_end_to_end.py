@@ -0,0 +1,182 @@
+"""End-to-end tests: the real adapter and SDK against the fake Yutori API."""
+
+import threading
+import time
+
+import pytest
+
+from tests.fake_api import FakeAPIConfig, FakeYutoriAPI
+from yutori_mcp.adapter import CallCancelled, MCPClientAdapter, YutoriAPIError
+from yutori_mcp.breaker import CircuitBreaker
+from yutori_mcp.cache import ResponseCache
+from yutori_mcp.idempotency import TaskDeduplicator
+from yutori_mcp.ratelimit import RateLimiter
+from yutori_mcp.retry import RetryPolicy
+from yutori_mcp.singleflight import SingleFlight
+
+
+@pytest.fixture()
+def fake_api():
+    servers = []
+
+    def start(**config):
+        server = FakeYutoriAPI(FakeAPIConfig(scouts=5, updates_per_scout=25, **config)).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+@pytest.fixture()
+def make_adapter(monkeypatch):
+    monkeypatch.setenv("YUTORI_API_KEY", "yt-test-key")
+
+    def make(server, **overrides):
+        monkeypatch.setenv("YUTORI_MCP_API_BASE_URL", server.base_url)
+        kwargs = dict(
+            retry_policy=RetryPolicy(base_delay=0, max_delay=0),
+            rate_limiter=RateLimiter.unlimited(),
+            breaker=CircuitBreaker(failure_rate=0),
+            cache=ResponseCache(),
+            singleflight=SingleFlight(),
+            task_deduplicator=TaskDeduplicator(),
+        )
+        return MCPClientAdapter(**{**kwargs, **overrides})
+
+    return make
+
+
+def test_list_and_detail(fake_api, make_adapter):
+    server = fake_api()
+    adapter = make_adapter(server)
+
+    listing = adapter.list_scouts(limit=3)
+    assert len(listing["scouts"]) == 3
+    assert listing["total"] == 5
+    scout_id = listing["scouts"][0]["id"]
+    assert adapter.get_scout_detail(scout_id)["id"] == scout_id
+
+
+def test_updates_paginate_with_cursor(fake_api, make_adapter):
+    server = fake_api()
+    adapter = make_adapter(server)
+    scout_id = next(iter(server.state.scouts))
+
+    first = adapter.get_scout_updates(scout_id, limit=10)
+    second = adapter.get_scout_updates(scout_id, limit=10, cursor=first["next_cursor"])
+    third = adapter.get_scout_updates(scout_id, limit=10, cursor=second["next_cursor"])
+
+    assert [len(p["updates"]) for p in (first, second, third)] == [10, 10, 5]
+    assert third["has_more"] is False
+    assert first["updates"][0]["id"] != second["updates"][0]["id"]
+
+
+def test_scout_writes(fake_api, make_adapter):
+    server = fake_api()
+    adapter = make_adapter(server)
+
+    created = adapter.create_scout("GPU prices")
+    assert adapter.edit_scout(created["id"], status="paused")["status"] == "paused"
+    adapter.delete_scout(created["id"])
+    with pytest.raises(YutoriAPIError) as exc_info:
+        adapter.get_scout_detail(created["id"])
+    assert exc_info.value.status_code == 404
+
+
+def test_research_task_progresses_to_succeeded(fake_api, make_adapter):
+    server = fake_api(task_seconds=0.2)
+    adapter = make_adapter(server)
+
+    task_id = adapter.run_research_task("state of GPU pricing")["task_id"]
+    assert adapter.get_research_task(task_id)["status"] == "queued"
+    time.sleep(0.25)
+    done = adapter.get_research_task(task_id)
+    assert done["status"] == "succeeded"
+    assert "GPU pricing" in done["result"]
+
+
+def test_injected_errors_are_retried(fake_api, make_adapter):
+    server = fake_api(error_rate=0.5, seed=3)
+    adapter = make_adapter(server)
+
+    for _ in range(5):
+        adapter.list_scouts(limit=1)
+
+    assert server.state.statuses[503] > 0
+    assert server.state.requests["list_scouts"] == 5 + server.state.statuses[503]
+
+
+def test_persistent_errors_surface(fake_api, make_adapter):
+    server = fake_api(error_rate=1.0, error_status=500)
+    adapter = make_adapter(server)
+
+    with pytest.raises(YutoriAPIError) as exc_info:
+        adapter.list_scouts()
+    assert exc_info.value.status_code == 500
+    assert server.state.requests["list_scouts"] == RetryPolicy().read_attempts
+
+
+def test_rate_limit_burst_returns_retry_after(fake_api, make_adapter):
+    server = fake_api(burst_every=60, burst_seconds=30)
+    adapter = make_adapter(server)
+    adapter._retry_policy = RetryPolicy(read_attempts=1)
+
+    with pytest.raises(YutoriAPIError) as exc_info:
+        adapter.list_scouts()
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.retry_after is not None
+
+
+def test_cancel_aborts_request_waiting_on_the_server(fake_api, make_adapter):
+    server = fake_api(latency_ms=5000, latency_sigma=0)
+    adapter = make_adapter(server, deadline=2.0)
+
+    threading.Timer(0.3, adapter.cancel).start()
+    start = time.monotonic()
+    with pytest.raises(CallCancelled):
+        adapter.list_scouts()
+    # The blocked read is interrupted, not left to the server's reply or the deadline
+    assert time.monotonic() - start < 1.0
+    assert server.state.requests["list_scouts"] == 1
+
+
+def test_cancelled_launch_is_remembered_for_the_retry(fake_api, make_adapter):
+    server = fake_api(latency_ms=1000, latency_sigma=0)
+    launches = TaskDeduplicator()
+    first = make_adapter(server, task_deduplicator=launches)
+
+    thread = threading.Thread(target=first.run_research_task, args=("GPU prices",))
+    thread.start()
+    time.sleep(0.3)
+    # The client times out and retries; the abandoned launch still completes
+    first.cancel()
+    retry = make_adapter(server, task_deduplicator=launches)
+    result = retry.run_research_task("GPU prices")
+    thread.join(5)
+
+    assert result["task_id"] in server.state.tasks
+    assert retry.reused_task_age is not None
+    assert server.state.requests["create_task"] == 1
+    assert len(server.state.tasks) == 1
+
+
+def test_launch_failing_after_send_is_not_repeated(fake_api, make_adapter):
+    server = fake_api(error_rate=1.0, error_status=500)
+    launches = TaskDeduplicator()
+
+    with pytest.raises(YutoriAPIError) as exc_info:
+        make_adapter(server, task_deduplicator=launches).run_research_task("GPU prices")
+    assert exc_info.value.status_code == 500
+    with pytest.raises(YutoriAPIError) as exc_info:
+        make_adapter(server, task_deduplicator=launches).run_research_task("GPU prices")
+    assert exc_info.value.status_code == 409
+    assert server.state.requests["create_task"] == 1
+
+    # A rejected launch (4xx) started nothing and may be tried again
+    server.state.config.error_status = 422
+    for _ in range(2):
+        with pytest.raises(YutoriAPIError):
+            make_adapter(server, task_deduplicator=launches).run_research_task("GPU prices", idempotency_key="k")
+    assert server.state.requests["create_task"] == 3
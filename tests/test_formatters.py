@@ -2,6 +2,7 @@
 
 from yutori_mcp.formatters import (
     dict_to_markdown,
+    format_find_scouts,
     format_list_scouts,
     format_response,
     format_scout_created,
@@ -40,6 +41,59 @@ class TestDictToMarkdown:
         assert "email" not in result
         assert "phone" not in result
 
+    def test_deeply_nested_does_not_recurse(self):
+        """Very deep payloads render without hitting the recursion limit."""
+        obj: dict = {"leaf": "bottom"}
+        for _ in range(5000):
+            obj = {"child": obj}
+        result = dict_to_markdown(obj, max_depth=None, max_bytes=None)
+        assert result.endswith("leaf: bottom")
+        assert result.count("child:") == 5000
+
+    def test_max_depth_elides_nested_content(self):
+        """Containers below max_depth are replaced with a marker."""
+        result = dict_to_markdown({"a": {"b": {"c": "deep"}}}, max_depth=1)
+        assert "b:" in result
+        assert "... (max depth reached)" in result
+        assert "deep" not in result
+
+    def test_max_items_per_level(self):
+        """Only max_items entries are rendered per container."""
+        result = dict_to_markdown({"items": list(range(10))}, max_items=3)
+        assert "- 2" in result
+        assert "- 3" not in result
+        assert "... and 7 more" in result
+
+    def test_wide_containers_render_in_full_by_default(self):
+        """Without max_items, every entry of a wide container is rendered."""
+        result = dict_to_markdown({"items": list(range(2000))})
+        assert result.endswith("  - 1999")
+        assert "more" not in result
+
+    def test_max_bytes_truncates_output(self):
+        """Output stops at max_bytes with a truncation marker."""
+        result = dict_to_markdown({f"key{i}": "x" * 50 for i in range(100)}, max_bytes=200)
+        assert result.endswith("... (truncated)")
+        assert len(result.encode("utf-8")) <= 200 + len("\n... (truncated)")
+
+    def test_matches_nested_layout(self):
+        """Nested dicts and lists keep the indented bullet layout."""
+        result = dict_to_markdown(
+            {"name": "Acme", "people": [{"name": "Ann", "role": "CEO"}, "Bob"], "meta": {"tags": ["a"]}}
+        )
+        assert result == "\n".join(
+            [
+                "name: Acme",
+                "people:",
+                "  - name: Ann",
+                "    role: CEO",
+                "  - Bob",
+                "meta:",
+                "  tags:",
+                "    - a",
+            ]
+        )
+
 
 class TestFormatListScouts:
     def test_empty_list(self):
@@ -193,6 +247,87 @@ class TestFormatScoutUpdates:
         assert "Found 1 update(s)" in result
         assert "2026-02-02 02:04 UTC" in result
 
+    def test_more_hint_repeats_limit(self):
+        """The next-page hint carries the cursor and the page's limit."""
+        response = {"updates": [{"content": "x"}], "has_more": True, "next_cursor": "c2"}
+        assert 'cursor="c2", limit=5)' in format_scout_updates(response, limit=5)
+        assert 'cursor="c2")' in format_scout_updates(response)
+
+    def test_delta_shows_only_changed_paragraphs(self):
+        """Delta mode lists added and removed paragraphs against the previous run."""
+        response = {
+            "updates": [
+                {"created_at": "2026-01-20T05:00:00Z", "content": "Shared intro\n\nNew funding round"},
+                {"created_at": "2026-01-19T05:00:00Z", "content": "Shared intro\n\nOld pricing note"},
+            ],
+        }
+        result = format_scout_updates(response, delta=True)
+        update_1 = result.split("Update #2")[0]
+        assert "+ New funding round" in update_1
+        assert "- Old pricing note" in update_1
+        assert "Shared intro" not in update_1
+        # Oldest update is the baseline and is shown in full
+        assert "  Shared intro" in result.split("Update #2")[1]
+
+    def test_delta_diffs_findings_by_url(self):
+        """Findings are matched by URL, so retitled findings are not repeated."""
+        response = {
+            "updates": [
+                {
+                    "content": "same",
+                    "findings": [
+                        {"title": "Retitled", "url": "https://a.example"},
+                        {"title": "Brand new", "url": "https://b.example"},
+                    ],
+                },
+                {"content": "same", "findings": [{"title": "Original", "url": "https://a.example"}]},
+            ],
+        }
+        result = format_scout_updates(response, delta=True)
+        update_1 = result.split("Update #2")[0]
+        assert "+ Brand new" in update_1
+        assert "Retitled" not in update_1
+        assert "+0/-0 paragraphs, +1/-0 findings" in update_1
+
+    def test_delta_lists_removed_sources(self):
+        """Sources dropped since the previous run are listed, not silently hidden."""
+        response = {
+            "updates": [
+                {"content": "same", "sources": [{"title": "B", "url": "https://b.example"}]},
+                {"content": "same", "sources": [{"title": "A", "url": "https://a.example"}]},
+            ],
+        }
+        update_1 = format_scout_updates(response, delta=True).split("Update #2")[0]
+        assert "+ B: https://b.example" in update_1
+        assert "- removed: A: https://a.example" in update_1
+        assert "+1/-1 sources" in update_1
+
+    def test_delta_compares_dict_content_per_field(self):
+        """A changed field of structured content is shown alone, with its path."""
+        response = {
+            "updates": [
+                {"content": {"summary": "GPU prices", "prices": {"H100": "$2.00", "A100": "$1.20"}}},
+                {"content": {"summary": "GPU prices", "prices": {"H100": "$2.10", "A100": "$1.20"}}},
+            ],
+        }
+        update_1 = format_scout_updates(response, delta=True).split("Update #2")[0]
+        assert "+ prices > H100: $2.00" in update_1
+        assert "- prices > H100: $2.10" in update_1
+        assert "summary" not in update_1
+        assert "A100" not in update_1
+
+    def test_delta_unchanged_update(self):
+        """Identical consecutive runs collapse to a one-line note."""
+        response = {"updates": [{"content": "Same text"}, {"content": "same   text"}]}
+        result = format_scout_updates(response, delta=True)
+        assert "No changes since previous update." in result
+
+    def test_delta_via_format_response(self):
+        """format_response forwards the delta flag to the updates formatter."""
+        response = {"updates": [{"content": "A"}, {"content": "A"}]}
+        assert "No changes" in format_response("get_scout_updates", response, delta=True)
+        assert "No changes" not in format_response("get_scout_updates", response, delta=False)
+
 
 class TestFormatTaskStarted:
     def test_research_task(self):
@@ -252,3 +387,20 @@ class TestFormatResponse:
         result = format_response("unknown_tool", response)
         assert "some: data" in result
         assert "key: value" in result
+
+
+class TestFormatFindScouts:
+    def test_matches_and_truncation(self):
+        response = {
+            "scouts": [{"id": "s1", "display_name": "H100 pricing", "query": "H100", "status": "active"}],
+            "total": 3,
+            "indexed": 87,
+            "index_age": 600,
+        }
+        result = format_find_scouts(response)
+        assert "Found 3 matching scouts (of 87); showing 1:" in result
+        assert "1. H100 pricing (active)" in result
+        assert "last reloaded 10 min ago" in result
+
+    def test_no_matches(self):
+        assert format_find_scouts({"scouts": [], "total": 0, "indexed": 5}) == "No matching scouts among 5 indexed."
@@ -0,0 +1,143 @@
+"""Tests for local deduplication of task launches."""
+
+import threading
+import time
+
+import pytest
+
+from yutori_mcp.idempotency import TaskDeduplicator, UncertainLaunchError, launch_fingerprint
+
+
+class TestLaunchFingerprint:
+    def test_whitespace_is_normalized(self):
+        a = launch_fingerprint("run_research_task", ("GPU  prices\n",), {"user_timezone": "UTC"})
+        b = launch_fingerprint("run_research_task", ("GPU prices",), {"user_timezone": "UTC"})
+        assert a == b
+
+    def test_arguments_and_key_distinguish_launches(self):
+        base = launch_fingerprint("run_research_task", ("GPU prices",), {})
+        assert base != launch_fingerprint("run_research_task", ("GPU prices",), {"user_location": "Paris"})
+        assert base != launch_fingerprint("run_browsing_task", ("GPU prices",), {})
+        assert base != launch_fingerprint("run_research_task", ("GPU prices",), {}, "retry-1")
+
+
+class TestTaskDeduplicator:
+    def test_identical_launch_within_window_is_reused(self, clock):
+        launches = TaskDeduplicator(window=60, clock=clock)
+        calls = []
+
+        first, age = launches.launch("k", lambda: calls.append(1) or {"task_id": "t1"}, label="run_research_task")
+        assert (first, age) == ({"task_id": "t1"}, None)
+        clock.now += 10
+        second, age = launches.launch("k", lambda: calls.append(1) or {"task_id": "t2"}, label="run_research_task")
+
+        assert second == {"task_id": "t1"}
+        assert age == 10
+        assert calls == [1]
+        assert launches.snapshot()["deduplicated"] == {"run_research_task": 1}
+
+    def test_launch_after_window_starts_new_task(self, clock):
+        launches = TaskDeduplicator(window=60, clock=clock)
+        launches.launch("k", lambda: {"task_id": "t1"})
+        clock.now += 61
+        assert launches.launch("k", lambda: {"task_id": "t2"}) == ({"task_id": "t2"}, None)
+        assert launches.snapshot()["remembered"] == 1
+
+    def test_failed_launch_is_not_remembered(self):
+        launches = TaskDeduplicator(window=60)
+
+        def fail():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            launches.launch("k", fail)
+        assert launches.launch("k", lambda: {"task_id": "t1"}) == ({"task_id": "t1"}, None)
+
+    def test_uncertain_failure_blocks_identical_launches(self, clock):
+        launches = TaskDeduplicator(window=60, clock=clock)
+
+        def timed_out():
+            raise TimeoutError("no response")
+
+        with pytest.raises(TimeoutError):
+            launches.launch("k", timed_out, label="run_research_task", uncertain=lambda e: True)
+        clock.now += 5
+        with pytest.raises(UncertainLaunchError, match="5s ago failed"):
+            launches.launch("k", lambda: {"task_id": "t2"}, label="run_research_task")
+        clock.now += 60
+        assert launches.launch("k", lambda: {"task_id": "t2"}) == ({"task_id": "t2"}, None)
+
+    def test_zero_window_disables(self):
+        launches = TaskDeduplicator(window=0)
+        launches.launch("k", lambda: {"task_id": "t1"})
+        assert launches.launch("k", lambda: {"task_id": "t2"}) == ({"task_id": "t2"}, None)
+
+    def test_concurrent_duplicate_waits_for_in_flight_launch(self):
+        launches = TaskDeduplicator(window=60)
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def slow_launch():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return {"task_id": "t1"}
+
+        results = []
+        first = threading.Thread(target=lambda: results.append(launches.launch("k", slow_launch)))
+        first.start()
+        started.wait(5)
+        second = threading.Thread(target=lambda: results.append(launches.launch("k", slow_launch)))
+        second.start()
+        time.sleep(0.1)
+        release.set()
+        first.join(5)
+        second.join(5)
+
+        assert calls == [1]
+        assert sorted(r[0]["task_id"] for r in results) == ["t1", "t1"]
+        assert sorted(r[1] is None for r in results) == [False, True]
+
+    def test_waiter_launches_itself_when_in_flight_launch_fails(self):
+        launches = TaskDeduplicator(window=60)
+        started, release = threading.Event(), threading.Event()
+
+        def failing_launch():
+            started.set()
+            release.wait(5)
+            raise RuntimeError("boom")
+
+        errors = []
+
+        def first():
+            try:
+                launches.launch("k", failing_launch)
+            except RuntimeError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=first)
+        thread.start()
+        started.wait(5)
+        threading.Timer(0.1, release.set).start()
+        result = launches.launch("k", lambda: {"task_id": "t2"})
+        thread.join(5)
+
+        assert result == ({"task_id": "t2"}, None)
+        assert len(errors) == 1
+
+    def test_cancelled_waiter_stops_waiting(self):
+        launches = TaskDeduplicator(window=60)
+        started, release = threading.Event(), threading.Event()
+        thread = threading.Thread(
+            target=launches.launch, args=("k", lambda: started.set() or release.wait(5) or {"task_id": "t1"})
+        )
+        thread.start()
+        started.wait(5)
+
+        def cancelled_launch():
+            raise RuntimeError("cancelled")
+
+        with pytest.raises(RuntimeError, match="cancelled"):
+            launches.launch("k", cancelled_launch, cancelled=lambda: True)
+        release.set()
+        thread.join(5)
@@ -0,0 +1,166 @@
+"""Tests for the local scout index and find_scouts."""
+
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tests.payloads import scout_list
+from yutori_mcp.adapter import MCPClientAdapter
+from yutori_mcp.breaker import CircuitBreaker
+from yutori_mcp.cache import ResponseCache
+from yutori_mcp.index import ScoutIndex
+from yutori_mcp.prefetch import Prefetcher
+from yutori_mcp.ratelimit import RateLimiter
+from yutori_mcp.retry import RetryPolicy
+from yutori_mcp.singleflight import SingleFlight
+
+SCOUTS = [
+    {
+        "id": "s1",
+        "display_name": "H100 pricing",
+        "query": "when H100 pricing per hour drops below $1.50",
+        "status": "active",
+        "output_interval": 3600,
+        "next_output_timestamp": "2026-01-02T00:00:00Z",
+    },
+    {
+        "id": "s2",
+        "display_name": "Yutori news",
+        "query": "latest news about Yutori",
+        "status": "paused",
+        "output_interval": 86400,
+        "next_output_timestamp": "2026-01-01T00:00:00Z",
+    },
+    {"id": "s3", "display_name": "GPU rentals", "query": "GPU rental prices", "status": "active"},
+]
+
+
+def ids(result):
+    return [s["id"] for s in result[0]]
+
+
+@pytest.fixture()
+def index():
+    index = ScoutIndex()
+    index.observe_list({"scouts": SCOUTS}, complete=True)
+    return index
+
+
+class TestScoutIndex:
+    def test_word_prefix_and_substring_search(self, index):
+        assert ids(index.find("h100")) == ["s1"]
+        assert ids(index.find("pric")) == ["s1", "s3"]
+        assert ids(index.find("gpu PRICES")) == ["s3"]
+        assert ids(index.find("$1.50")) == ["s1"]
+        assert ids(index.find("utori")) == ["s2"]
+        assert ids(index.find("s2")) == ["s2"]
+        assert index.find("nothing like this") == ([], 0)
+
+    def test_filters_and_sorting(self, index):
+        assert ids(index.find()) == ["s2", "s1", "s3"]  # next run first, unknown last
+        assert ids(index.find(sort="name")) == ["s3", "s1", "s2"]
+        assert ids(index.find(status="active")) == ["s1", "s3"]
+        assert ids(index.find(output_interval=86400)) == ["s2"]
+        scouts, total = index.find(limit=1)
+        assert (len(scouts), total) == (1, 3)
+
+    def test_detail_fields_survive_listing(self, index):
+        index.upsert({**SCOUTS[0], "webhook_url": "https://example.com/hook"})
+        index.observe_list({"scouts": SCOUTS}, complete=True)
+        assert ids(index.find(has_webhook=True)) == ["s1"]
+        assert ids(index.find(has_webhook=False)) == ["s2", "s3"]
+
+    def test_writes_update_index(self, index):
+        index.observe_write("edit_scout", "s2", {}, {"query": "Anthropic funding", "status": "active"})
+        assert ids(index.find("anthropic", status="active")) == ["s2"]
+        assert ids(index.find("yutori news")) == ["s2"]  # display name unchanged
+
+        index.observe_write("delete_scout", "s1", {}, {})
+        index.observe_write("create_scout", "", {"id": "s4", "query": "new H100 deals"}, {"query": "new H100 deals"})
+        assert ids(index.find("h100")) == ["s4"]
+
+    def test_complete_listing_drops_deleted_scouts(self, index):
+        index.observe_list({"scouts": SCOUTS[:1]}, complete=False)
+        assert len(index) == 3
+        index.observe_list({"scouts": SCOUTS[:1]}, complete=True)
+        assert len(index) == 1
+        assert index.find("gpu") == ([], 0)
+
+    def test_staleness(self, clock):
+        index = ScoutIndex(ttl=60, clock=clock)
+        assert index.stale
+        index.observe_list({"scouts": SCOUTS}, complete=True)
+        assert not index.stale
+        clock.now += 61
+        assert index.stale
+
+    def test_persisted_between_processes(self, tmp_path):
+        path = tmp_path / "index.json"
+        ScoutIndex(path=path).observe_list({"scouts": SCOUTS}, complete=True)
+
+        loaded = ScoutIndex(path=path)
+        assert not loaded.stale
+        assert ids(loaded.find("h100")) == ["s1"]
+        assert json.loads(path.read_text())["refreshed_at"] is not None
+
+    def test_lookup_is_sub_millisecond(self):
+        index = ScoutIndex()
+        listing = scout_list(1000)
+        index.observe_list(listing, complete=True)
+        word = listing["scouts"][0]["query"].split()[0].lower()
+
+        start = time.perf_counter()
+        for _ in range(100):
+            index.find(word, status="active", limit=20)
+        assert (time.perf_counter() - start) / 100 < 0.001
+
+
+class TestAdapterFindScouts:
+    @pytest.fixture()
+    def client(self):
+        client = MagicMock()
+        client.scouts.list.return_value = {"scouts": SCOUTS, "has_more": False}
+        return client
+
+    @pytest.fixture()
+    def make_adapter(self, client):
+        def make(index):
+            with patch("yutori_mcp.adapter.resolve_api_key", return_value="yt-test-key"), \
+                 patch("yutori_mcp.adapter.YutoriClient", return_value=client):
+                return MCPClientAdapter(
+                    retry_policy=RetryPolicy(base_delay=0, max_delay=0),
+                    rate_limiter=RateLimiter.unlimited(),
+                    breaker=CircuitBreaker(failure_rate=0),
+                    cache=ResponseCache(),
+                    singleflight=SingleFlight(),
+                    prefetcher=Prefetcher(),
+                    scout_index=index,
+                )
+
+        return make
+
+    def test_loads_index_once_then_answers_locally(self, client, make_adapter):
+        adapter = make_adapter(ScoutIndex())
+        assert [s["id"] for s in adapter.find_scouts("h100")["scouts"]] == ["s1"]
+        result = adapter.find_scouts(status="active", sort="name")
+
+        assert [s["id"] for s in result["scouts"]] == ["s3", "s1"]
+        assert result["indexed"] == 3
+        client.scouts.list.assert_called_once()
+
+    def test_filtered_listing_does_not_refresh(self, client, make_adapter):
+        index = ScoutIndex()
+        make_adapter(index).list_scouts(status="active")
+        assert index.stale
+        assert len(index) == 3
+
+    def test_failed_reload_searches_existing_index(self, client, make_adapter):
+        index = ScoutIndex(ttl=0)
+        index.observe_list({"scouts": SCOUTS}, complete=True)
+        client.scouts.list.side_effect = RuntimeError("down")
+
+        assert make_adapter(index).find_scouts("yutori")["total"] == 1
+        with pytest.raises(RuntimeError):
+            make_adapter(ScoutIndex()).find_scouts("yutori")
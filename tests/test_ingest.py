@@ -0,0 +1,239 @@
+"""Tests for webhook ingestion and the local update store."""
+
+import http.client
+import json
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from yutori_mcp.adapter import MCPClientAdapter
+from yutori_mcp.breaker import CircuitBreaker
+from yutori_mcp.cache import ResponseCache
+from yutori_mcp.index import ScoutIndex
+from yutori_mcp.ingest import IngestServer, PayloadError, parse_payload
+from yutori_mcp.prefetch import Prefetcher
+from yutori_mcp.ratelimit import RateLimiter
+from yutori_mcp.retry import RetryPolicy
+from yutori_mcp.revalidate import Revalidator
+from yutori_mcp.schedule import UpdateSchedule
+from yutori_mcp.singleflight import SingleFlight
+from yutori_mcp.store import UpdateStore
+
+RECEIVED = 1_767_225_600.0  # 2026-01-01T00:00:00Z
+
+
+def update(n, **fields):
+    return {"id": f"u{n}", "created_at": f"2026-01-0{n}T00:00:00Z", "content": f"Update {n}", **fields}
+
+
+@pytest.fixture()
+def store(tmp_path):
+    store = UpdateStore(tmp_path / "updates.db")
+    yield store
+    store.close()
+
+
+def post(url, payload, headers=None):
+    body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+    request = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json", **(headers or {})})
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+class TestParsePayload:
+    def test_payload_shapes(self):
+        (nested,) = parse_payload({"scout_id": "s1", "update": update(1)}, RECEIVED)
+        assert (nested.scout_id, nested.update_id, nested.scout) == ("s1", "u1", None)
+
+        (flat,) = parse_payload({"scout_id": "s1", "display_name": "GPUs", **update(2)}, RECEIVED)
+        assert flat.update == update(2)
+        assert flat.scout == {"display_name": "GPUs"}
+
+        records = parse_payload({"scout": {"id": "s2", "query": "H100"}, "updates": [update(1), update(2)]})
+        assert [(r.scout_id, r.update_id) for r in records] == [("s2", "u1"), ("s2", "u2")]
+
+    def test_missing_id_and_time_are_filled_stably(self):
+        payload = {"scout_id": "s1", "update": {"content": "News"}}
+        first, second = parse_payload(payload, RECEIVED)[0], parse_payload(payload, RECEIVED + 5)[0]
+        assert first.update_id == second.update_id
+        assert first.update["created_at"] == "2026-01-01T00:00:00Z"
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            [],
+            {"update": update(1)},
+            {"scout_id": "s1", "update": {"id": "u1"}},
+            {"scout_id": "s1", "updates": []},
+            {"scout_id": "s1", "update": update(1, findings="none")},
+            {"scout_id": "s1", "update": update(1, created_at="yesterday")},
+        ],
+    )
+    def test_invalid_payloads(self, payload):
+        with pytest.raises(PayloadError):
+            parse_payload(payload)
+
+
+class TestUpdateStore:
+    def test_pages_newest_first_with_local_cursors(self, store):
+        store.add(parse_payload({"scout_id": "s1", "updates": [update(n) for n in range(1, 6)]}, RECEIVED))
+
+        page = store.page("s1", limit=2)
+        assert [u["id"] for u in page["updates"]] == ["u5", "u4"]
+        assert page["next_cursor"] == "local:1767484800.0:u4"
+        # An update stored meanwhile does not shift the following pages
+        store.add(parse_payload({"scout_id": "s1", "update": update(6)}, RECEIVED))
+        page = store.page("s1", limit=2, cursor=page["next_cursor"])
+        assert [u["id"] for u in page["updates"]] == ["u3", "u2"]
+        last = store.page("s1", limit=2, cursor=page["next_cursor"])
+        assert [u["id"] for u in last["updates"]] == ["u1"]
+        # The API may have older updates
+        assert last["has_more"] is True
+        assert store.page("s1", limit=2, cursor=last["next_cursor"]) is None
+        assert store.page("s2") is None
+
+    def test_redelivery_is_stored_once(self, store):
+        records = parse_payload({"scout_id": "s1", "update": update(1)}, RECEIVED)
+        assert store.add(records) == 1
+        assert store.add(records) == 0
+        assert store.count() == 1
+
+    def test_scout_fields_are_merged_and_reported_once(self, store):
+        store.add(parse_payload({"scout_id": "s1", "display_name": "GPUs", "update": update(1)}, RECEIVED))
+        store.add(parse_payload({"scout_id": "s1", "query": "H100 prices", "update": update(2)}, RECEIVED + 1))
+        assert store.new_scouts() == [{"id": "s1", "display_name": "GPUs", "query": "H100 prices"}]
+        assert store.new_scouts() == []
+
+    def test_shared_between_processes(self, store):
+        store.add(parse_payload({"scout_id": "s1", "update": update(1)}, RECEIVED))
+        reader = UpdateStore(store.path)
+        assert reader.page("s1")["updates"] == [update(1)]
+        reader.close()
+
+
+class TestIngestServer:
+    def test_accepts_and_stores_payloads(self, store):
+        with IngestServer(store) as server:
+            assert post(server.url + "/webhook", {"scout_id": "s1", "update": update(1)}) == (202, {"accepted": 1})
+            assert post(server.url, b"not json")[0] == 400
+            status, body = post(server.url, {"scout_id": "s1", "update": {}})
+            assert (status, body["error"]) == (400, "update has no content, result, findings, sources or output")
+            assert server.queue.flush()
+            with urllib.request.urlopen(server.url + "/health", timeout=5) as response:
+                health = json.loads(response.read())
+        assert health["stored"] == 1
+        assert store.page("s1")["updates"] == [update(1)]
+
+    def test_token_required_when_configured(self, store):
+        payload = {"scout_id": "s1", "update": update(1)}
+        with IngestServer(store, token="secret") as server:
+            assert post(server.url, payload)[0] == 401
+            assert post(server.url + "?token=secret", payload)[0] == 202
+            assert post(server.url, payload, {"Authorization": "Bearer secret"})[0] == 202
+
+    @pytest.mark.parametrize(
+        ("length", "status"),
+        [(None, 411), ("twelve", 400), ("-1", 400), (str(2**40), 413)],
+    )
+    def test_bad_content_length_is_rejected(self, store, length, status):
+        with IngestServer(store) as server:
+            connection = http.client.HTTPConnection(server.server_address[0], server.server_address[1], timeout=5)
+            connection.putrequest("POST", "/")
+            if length is not None:
+                connection.putheader("Content-Length", length)
+            connection.endheaders()
+            response = connection.getresponse()
+            assert response.status == status
+            assert "error" in json.loads(response.read())
+            connection.close()
+            # The listener keeps serving
+            assert post(server.url, {"scout_id": "s1", "update": update(1)})[0] == 202
+
+    def test_burst_is_written_in_batches(self, store):
+        with IngestServer(store, flush_interval=0.2) as server:
+            payloads = [{"scout_id": f"s{i % 10}", "update": update(1, id=f"u{i}")} for i in range(200)]
+            with ThreadPoolExecutor(16) as pool:
+                statuses = list(pool.map(lambda p: post(server.url, p)[0], payloads))
+            assert server.queue.flush()
+            stats = server.queue.stats()
+        assert statuses == [202] * 200
+        assert stats["stored"] == 200
+        assert stats["batches"] < 50
+        assert store.count() == 200
+
+
+class TestAdapterReadsStore:
+    @pytest.fixture()
+    def client(self):
+        client = MagicMock()
+        client.scouts.get_updates.return_value = {"updates": [update(9)]}
+        client.scouts.list.return_value = {"scouts": [{"id": "s1", "status": "active"}], "has_more": False}
+        return client
+
+    @pytest.fixture()
+    def make_adapter(self, client, store):
+        def make(index=None):
+            with patch("yutori_mcp.adapter.resolve_api_key", return_value="yt-test-key"), \
+                 patch("yutori_mcp.adapter.YutoriClient", return_value=client):
+                return MCPClientAdapter(
+                    retry_policy=RetryPolicy(base_delay=0, max_delay=0),
+                    rate_limiter=RateLimiter.unlimited(),
+                    breaker=CircuitBreaker(failure_rate=0),
+                    cache=ResponseCache(),
+                    singleflight=SingleFlight(),
+                    prefetcher=Prefetcher(),
+                    scout_index=index if index is not None else ScoutIndex(),
+                    update_schedule=UpdateSchedule(),
+                    revalidator=Revalidator(),
+                    update_store=store,
+                )
+
+        return make
+
+    def test_pushed_updates_answer_without_polling(self, client, store, make_adapter):
+        store.add(parse_payload({"scout_id": "s1", "updates": [update(1), update(2)]}, RECEIVED))
+        adapter = make_adapter()
+
+        page = adapter.get_scout_updates("s1", limit=1)
+        assert [u["id"] for u in page["updates"]] == ["u2"]
+        page = adapter.get_scout_updates("s1", cursor=page["next_cursor"])
+        assert [u["id"] for u in page["updates"]] == ["u1"]
+        client.scouts.get_updates.assert_not_called()
+
+        # Scouts with nothing pushed, and API cursors, still go to the API
+        assert adapter.get_scout_updates("s2")["updates"] == [update(9)]
+        adapter.get_scout_updates("s1", cursor="api-cursor")
+        assert client.scouts.get_updates.call_count == 2
+
+    def test_paging_continues_from_the_api_after_stored_updates(self, client, store, make_adapter):
+        # The store has u5..u3; the API pages u5..u1 two at a time
+        store.add(parse_payload({"scout_id": "s1", "updates": [update(n) for n in (3, 4, 5)]}, RECEIVED))
+        api_pages = {None: ([5, 4], "c2"), "c2": ([3, 2], "c3"), "c3": ([1], None)}
+
+        def get_updates(scout_id, cursor=None, limit=None):
+            ids, next_cursor = api_pages[cursor]
+            return {"updates": [update(n) for n in ids], "has_more": next_cursor is not None, "next_cursor": next_cursor}
+
+        client.scouts.get_updates.side_effect = get_updates
+        adapter = make_adapter()
+
+        seen, cursor = [], None
+        while True:
+            page = adapter.get_scout_updates("s1", limit=2, cursor=cursor)
+            seen += [u["id"] for u in page["updates"]]
+            if not page["has_more"]:
+                break
+            cursor = page["next_cursor"]
+        assert seen == ["u5", "u4", "u3", "u2", "u1"]
+        assert [c.kwargs.get("cursor") for c in client.scouts.get_updates.call_args_list] == [None, "c2", "c3"]
+
+    def test_pushed_scouts_are_searchable(self, store, make_adapter):
+        store.add(parse_payload({"scout_id": "s1", "query": "H100 prices", "update": update(1)}, RECEIVED))
+        result = make_adapter(ScoutIndex()).find_scouts("h100")
+        assert [s["id"] for s in result["scouts"]] == ["s1"]
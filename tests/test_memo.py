@@ -0,0 +1,206 @@
+"""Tests for memoization of completed research results."""
+
+import json
+import os
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from yutori_mcp.adapter import MCPClientAdapter
+from yutori_mcp.breaker import CircuitBreaker
+from yutori_mcp.cache import ResponseCache
+from yutori_mcp.idempotency import TaskDeduplicator
+from yutori_mcp.memo import ResearchMemo, research_memo_key
+from yutori_mcp.ratelimit import RateLimiter
+from yutori_mcp.retry import RetryPolicy
+from yutori_mcp.singleflight import SingleFlight
+
+DONE = {"task_id": "t1", "status": "succeeded", "result": "Findings"}
+
+
+class TestResearchMemoKey:
+    def test_case_whitespace_and_trailing_punctuation_ignored(self):
+        assert research_memo_key("Latest AI  startup funding?", {}) == research_memo_key(
+            "latest ai startup funding", {}
+        )
+
+    def test_context_fields_distinguish(self):
+        base = research_memo_key("q", {})
+        assert base != research_memo_key("q", {"user_location": "Paris, FR"})
+        assert base != research_memo_key("q", {"output_schema": {"type": "array"}})
+
+    def test_webhooks_ignored(self):
+        assert research_memo_key("q", {}) == research_memo_key("q", {"webhook_url": "https://example.com"})
+
+
+class TestResearchMemo:
+    def test_stores_only_tracked_successful_tasks(self):
+        memo = ResearchMemo()
+        memo.track("t1", "k")
+        memo.complete("t1", {**DONE, "status": "running"})
+        memo.complete("t2", DONE)
+        assert memo.lookup("k", max_age=60) is None
+
+        memo.complete("t1", DONE)
+        assert memo.lookup("k", max_age=60).result == DONE
+
+    def test_respects_max_age_and_ttl(self, clock):
+        memo = ResearchMemo(ttl=600, clock=clock)
+        memo.track("t1", "k")
+        memo.complete("t1", DONE)
+        clock.now += 300
+
+        assert memo.lookup("k", max_age=100) is None
+        assert memo.lookup("k", max_age=3600).age(clock.now) == 300
+        clock.now += 400
+        assert memo.lookup("k", max_age=3600) is None
+        assert (memo.hits, memo.misses) == (1, 2)
+
+    def test_size_bounded(self):
+        memo = ResearchMemo(max_entries=2)
+        for i in range(3):
+            memo.track(f"t{i}", f"k{i}")
+            memo.complete(f"t{i}", DONE)
+        assert len(memo) == 2
+        assert memo.lookup("k0", max_age=60) is None
+
+    def test_disabled_does_nothing(self):
+        memo = ResearchMemo(enabled=False)
+        memo.track("t1", "k")
+        memo.complete("t1", DONE)
+        assert memo.lookup("k", max_age=60) is None
+
+    def test_shared_file_between_processes(self, tmp_path):
+        path = tmp_path / "memo.jsonl"
+        writer, reader = ResearchMemo(path=path), ResearchMemo(path=path)
+        writer.track("t1", "k")
+        writer.complete("t1", DONE)
+
+        assert reader.lookup("k", max_age=60).result == DONE
+
+    def test_partial_lines_are_read_once_complete(self, tmp_path):
+        path = tmp_path / "memo.jsonl"
+        reader = ResearchMemo(path=path)
+        line = json.dumps({"key": "k", "completed_at": 1e12, "result": DONE})
+        path.write_text(line[:10])
+        assert reader.lookup("k", max_age=1e13) is None
+        path.write_text(line + "\n")
+        assert reader.lookup("k", max_age=1e13) is not None
+
+    def test_compaction_drops_expired_and_superseded(self, clock, tmp_path):
+        path = tmp_path / "memo.jsonl"
+        records = [
+            {"key": "old", "completed_at": clock.now - 10_000, "result": DONE},
+            {"key": "k", "completed_at": clock.now - 20, "result": {**DONE, "result": "first"}},
+            {"key": "k", "completed_at": clock.now - 10, "result": {**DONE, "result": "second"}},
+        ]
+        path.write_text("".join(json.dumps(r) + "\n" for r in records) + "not json\n")
+
+        memo = ResearchMemo(path=path, ttl=3600, clock=clock)
+
+        (line,) = path.read_text().splitlines()
+        assert json.loads(line)["result"]["result"] == "second"
+        assert memo.lookup("k", max_age=60).result["result"] == "second"
+
+    def test_append_during_compaction_is_kept(self, tmp_path):
+        path = tmp_path / "memo.jsonl"
+        writer = ResearchMemo(path=path)
+        writer.track("t1", "k")
+        writer.complete("t1", DONE)
+        writer.track("t2", "k2")
+        replacing = threading.Event()
+        real_replace = os.replace
+
+        def slow_replace(src, dst):
+            replacing.set()
+            threading.Event().wait(0.2)
+            real_replace(src, dst)
+
+        with patch("yutori_mcp.memo.os.replace", side_effect=slow_replace):
+            compacting = threading.Thread(target=ResearchMemo, kwargs={"path": path})
+            compacting.start()
+            replacing.wait(5)
+            # Waits for the other process's rewrite instead of appending to the file it replaces
+            writer.complete("t2", {**DONE, "task_id": "t2"})
+            compacting.join(5)
+
+        assert ResearchMemo(path=path).lookup("k2", max_age=60) is not None
+
+    def test_rewrite_detected_when_file_does_not_shrink(self, tmp_path):
+        path = tmp_path / "memo.jsonl"
+        writer, reader = ResearchMemo(path=path), ResearchMemo(path=path)
+        writer.track("t1", "k")
+        writer.complete("t1", DONE)
+        assert reader.lookup("k", max_age=60) is not None
+
+        # Another process rewrites the file into a longer one
+        record = {"key": "k2", "completed_at": writer._entries["k"].completed_at, "result": {**DONE, "pad": "x" * 500}}
+        replacement = tmp_path / "new.jsonl"
+        replacement.write_text(json.dumps(record) + "\n")
+        os.replace(replacement, path)
+
+        assert reader.lookup("k2", max_age=60) is not None
+
+    @pytest.mark.parametrize(
+        ("value", "enabled", "has_path"),
+        [(None, False, False), ("off", False, False), ("1", True, False), ("~/memo.jsonl", True, True)],
+    )
+    def test_from_env(self, monkeypatch, tmp_path, value, enabled, has_path):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        if value is None:
+            monkeypatch.delenv("YUTORI_MCP_RESEARCH_MEMO", raising=False)
+        else:
+            monkeypatch.setenv("YUTORI_MCP_RESEARCH_MEMO", value)
+        memo = ResearchMemo.from_env()
+        assert memo.enabled is enabled
+        assert (memo.path is not None) is has_path
+
+
+class TestAdapterMemoization:
+    @pytest.fixture()
+    def make_adapter(self):
+        memo = ResearchMemo()
+
+        def make():
+            with patch("yutori_mcp.adapter.resolve_api_key", return_value="yt-test-key"), \
+                 patch("yutori_mcp.adapter.YutoriClient"):
+                return MCPClientAdapter(
+                    retry_policy=RetryPolicy(base_delay=0, max_delay=0),
+                    rate_limiter=RateLimiter.unlimited(),
+                    breaker=CircuitBreaker(failure_rate=0),
+                    cache=ResponseCache(),
+                    singleflight=SingleFlight(),
+                    task_deduplicator=TaskDeduplicator(window=0),
+                    research_memo=memo,
+                )
+
+        return make
+
+    def test_completed_research_is_reused_with_max_age(self, make_adapter):
+        first = make_adapter()
+        first._client.research.create = MagicMock(return_value={"task_id": "t1", "status": "queued"})
+        first._client.research.get = MagicMock(return_value=DONE)
+        first.run_research_task("Latest AI startup funding", user_timezone="UTC")
+        first.get_research_task("t1")
+
+        second = make_adapter()
+        second._client.research.create = MagicMock(return_value={"task_id": "t2", "status": "queued"})
+        result = second.run_research_task("latest AI startup funding?", user_timezone="UTC", max_age=3600)
+
+        assert result == DONE
+        assert second.memo_age is not None
+        second._client.research.create.assert_not_called()
+
+    def test_without_max_age_a_new_task_is_launched(self, make_adapter):
+        first = make_adapter()
+        first._client.research.create = MagicMock(return_value={"task_id": "t1"})
+        first._client.research.get = MagicMock(return_value=DONE)
+        first.run_research_task("q")
+        first.get_research_task("t1")
+
+        second = make_adapter()
+        second._client.research.create = MagicMock(return_value={"task_id": "t2"})
+        assert second.run_research_task("q") == {"task_id": "t2"}
+        assert second.memo_age is None
+        assert "max_age" not in second._client.research.create.call_args.kwargs
@@ -0,0 +1,115 @@
+"""Tests for the Prometheus metrics registry."""
+
+import sys
+import urllib.request
+from unittest.mock import patch
+
+import pytest
+
+from yutori_mcp import metrics
+from yutori_mcp.metrics import Registry
+from yutori_mcp.prefetch import Prefetcher
+
+
+@pytest.fixture()
+def registry():
+    return Registry()
+
+
+class TestCounter:
+    def test_renders_labelled_samples(self, registry):
+        calls = registry.counter("calls_total", "Calls.", ("tool", "outcome"))
+        calls.inc("list_scouts", "ok")
+        calls.inc("list_scouts", "ok")
+        calls.inc("get_scout_detail", "error")
+        text = registry.render()
+        assert "# HELP calls_total Calls.\n# TYPE calls_total counter\n" in text
+        assert 'calls_total{tool="list_scouts",outcome="ok"} 2\n' in text
+        assert 'calls_total{tool="get_scout_detail",outcome="error"} 1\n' in text
+
+    def test_escapes_label_values(self, registry):
+        calls = registry.counter("calls_total", "Calls.", ("tool",))
+        calls.inc('a"b\\c')
+        assert 'calls_total{tool="a\\"b\\\\c"} 1' in registry.render()
+
+
+class TestHistogram:
+    def test_cumulative_buckets(self, registry):
+        latency = registry.histogram("latency_seconds", "Latency.", ("tool",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            latency.observe(value, "t")
+        text = registry.render()
+        assert 'latency_seconds_bucket{tool="t",le="0.1"} 2\n' in text
+        assert 'latency_seconds_bucket{tool="t",le="1"} 3\n' in text
+        assert 'latency_seconds_bucket{tool="t",le="+Inf"} 4\n' in text
+        assert 'latency_seconds_sum{tool="t"} 3.65\n' in text
+        assert 'latency_seconds_count{tool="t"} 4\n' in text
+        assert latency.count("t") == 4
+
+
+class TestCollectors:
+    def test_collector_families_are_rendered(self, registry):
+        registry.add_collector(lambda: [("depth", "gauge", "Depth.", [({"bucket": "reads"}, 3)])])
+        assert 'depth{bucket="reads"} 3\n' in registry.render()
+
+    def test_failing_collector_is_skipped(self, registry):
+        def broken():
+            raise RuntimeError("boom")
+
+        registry.counter("calls_total", "Calls.").inc()
+        registry.add_collector(broken)
+        assert "calls_total 1" in registry.render()
+
+    def test_component_metrics(self):
+        text = metrics.render()
+        assert 'yutori_mcp_circuit_state{state="closed"}' in text
+        assert 'yutori_mcp_cache_lookups_total{result="hit"}' in text
+        assert 'yutori_mcp_rate_limit_queue_depth{bucket="reads"} 0' in text
+
+    def test_prefetch_metrics_without_list_prefetch(self):
+        # Only next-page prefetching is on, as with YUTORI_MCP_PREFETCH_NEXT_PAGE alone
+        prefetcher = Prefetcher(next_page=True)
+        prefetcher.issued["get_scout_updates"] = 4
+        prefetcher.used["get_scout_updates"] = 3
+        with patch("yutori_mcp.prefetch.default_prefetcher", return_value=prefetcher):
+            text = metrics.render()
+        assert 'yutori_mcp_prefetches_total{operation="get_scout_updates",result="used"} 3' in text
+        assert 'yutori_mcp_prefetch_hit_ratio{operation="get_scout_updates"} 0.75' in text
+
+        with patch("yutori_mcp.prefetch.default_prefetcher", return_value=Prefetcher()):
+            assert "yutori_mcp_prefetches_total" not in metrics.render()
+
+    def test_process_memory(self):
+        peak = next(
+            line for line in metrics.render().splitlines() if line.startswith("process_max_resident_memory_bytes ")
+        )
+        assert float(peak.split()[1]) > 1024 * 1024
+
+    def test_process_memory_without_resource_module(self):
+        # As on Windows, where the resource module does not exist
+        with patch.dict(sys.modules, {"resource": None}):
+            text = metrics.render()
+        assert "process_max_resident_memory_bytes" not in text
+        assert "yutori_mcp_circuit_state" in text
+
+
+class TestObserveTool:
+    def test_records_every_series(self):
+        before = metrics.tool_calls.value("bench_tool", "ok")
+        metrics.observe_tool("bench_tool", "ok", 0.3, phases={"upstream": 0.2, "format": 0.01}, response_bytes=512)
+        assert metrics.tool_calls.value("bench_tool", "ok") == before + 1
+        assert metrics.tool_phase_duration.count("bench_tool", "upstream") >= 1
+        assert metrics.tool_response_bytes.count("bench_tool") >= 1
+
+
+class TestHttpServer:
+    def test_serves_metrics(self):
+        server = metrics.start_http_server(0)
+        try:
+            port = server.server_address[1]
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+                assert response.headers["Content-Type"] == metrics.CONTENT_TYPE
+                assert b"yutori_mcp_tool_calls_total" in response.read()
+        finally:
+            server.shutdown()
+            server.server_close()
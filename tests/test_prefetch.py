@@ -0,0 +1,242 @@
+"""Tests for speculative prefetch after list_scouts and updates pages."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from yutori_mcp.adapter import MCPClientAdapter
+from yutori_mcp.breaker import CircuitBreaker
+from yutori_mcp.cache import ResponseCache, cache_key
+from yutori_mcp import prefetch, schedule, subscriptions
+from yutori_mcp.prefetch import Prefetcher
+from yutori_mcp.ratelimit import RateLimiter
+from yutori_mcp.retry import RetryPolicy
+from yutori_mcp.singleflight import SingleFlight
+
+LISTING = {"scouts": [{"id": "s1"}, {"id": "s2"}, {"id": "s3"}]}
+
+
+class FakeAdapter:
+    """Stands in for MCPClientAdapter in background reads."""
+
+    stale_age = None
+
+    def __init__(self, calls, gate=None):
+        self.calls = calls
+        self.gate = gate
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def get_scout_detail(self, scout_id):
+        self.calls.append(("get_scout_detail", scout_id))
+        if self.gate is not None:
+            self.gate.wait(5)
+        return {"id": scout_id}
+
+    def get_scout_updates(self, scout_id, **kwargs):
+        self.calls.append(("get_scout_updates", scout_id, *kwargs.values()))
+        return {"updates": [], "scout_id": scout_id, **kwargs}
+
+
+def detail_key(scout_id):
+    return cache_key("get_scout_detail", (scout_id,), {})
+
+
+@pytest.fixture()
+def calls():
+    return []
+
+
+class TestPrefetcher:
+    def test_prefetches_top_n_details(self, calls):
+        prefetcher = Prefetcher(top_n=2, adapter_factory=lambda: FakeAdapter(calls))
+        prefetcher.after_list(LISTING)
+        assert prefetcher.wait_idle()
+
+        assert sorted(calls) == [("get_scout_detail", "s1"), ("get_scout_detail", "s2")]
+        assert prefetcher.take(detail_key("s1")) == {"id": "s1"}
+        assert prefetcher.take(detail_key("s1")) is None  # served once
+        assert prefetcher.take(detail_key("s3")) is None
+
+    def test_updates_page_optional(self, calls):
+        prefetcher = Prefetcher(top_n=1, updates=True, adapter_factory=lambda: FakeAdapter(calls))
+        prefetcher.after_list(LISTING)
+        assert prefetcher.wait_idle()
+        assert prefetcher.take(cache_key("get_scout_updates", ("s1",), {})) == {"updates": [], "scout_id": "s1"}
+
+    def test_disabled_by_default(self, calls):
+        prefetcher = Prefetcher(adapter_factory=lambda: FakeAdapter(calls))
+        prefetcher.after_list(LISTING)
+        assert calls == []
+        assert not prefetcher.enabled
+
+    def test_hit_and_waste_accounting(self, clock, calls):
+        prefetcher = Prefetcher(top_n=3, ttl=30, adapter_factory=lambda: FakeAdapter(calls), clock=clock)
+        prefetcher.after_list(LISTING)
+        assert prefetcher.wait_idle()
+        prefetcher.take(detail_key("s1"))
+        clock.now += 31
+
+        assert prefetcher.take(detail_key("s2")) is None
+        snapshot = prefetcher.snapshot()
+        assert snapshot["issued"] == {"get_scout_detail": 3}
+        assert snapshot["used"] == {"get_scout_detail": 1}
+        assert snapshot["wasted"] == {"get_scout_detail": 2}
+
+    def test_repeated_listing_does_not_refetch(self, calls):
+        prefetcher = Prefetcher(top_n=2, adapter_factory=lambda: FakeAdapter(calls))
+        prefetcher.after_list(LISTING)
+        prefetcher.after_list(LISTING)
+        assert prefetcher.wait_idle()
+        assert len(calls) == 2
+
+    def test_read_during_prefetch_counts_as_used(self, calls):
+        gate = threading.Event()
+        prefetcher = Prefetcher(top_n=1, adapter_factory=lambda: FakeAdapter(calls, gate))
+        prefetcher.after_list(LISTING)
+
+        assert prefetcher.take(detail_key("s1")) is None
+        gate.set()
+        assert prefetcher.wait_idle()
+        assert prefetcher.snapshot()["used"] == {"get_scout_detail": 1}
+
+    def test_invalidate_drops_held_and_running_prefetches(self, calls):
+        gate = threading.Event()
+        prefetcher = Prefetcher(top_n=2, adapter_factory=lambda: FakeAdapter(calls, gate))
+        prefetcher.after_list(LISTING)
+        while len(calls) < 2:
+            time.sleep(0.01)
+        prefetcher.invalidate("s1")
+        gate.set()
+        assert prefetcher.wait_idle()
+
+        assert prefetcher.take(detail_key("s1")) is None
+        assert prefetcher.take(detail_key("s2")) == {"id": "s2"}
+
+    def test_failed_prefetch_is_not_held(self):
+        class Failing(FakeAdapter):
+            def get_scout_detail(self, scout_id):
+                raise RuntimeError("down")
+
+        prefetcher = Prefetcher(top_n=1, adapter_factory=lambda: Failing([]))
+        prefetcher.after_list(LISTING)
+        assert prefetcher.wait_idle()
+        assert prefetcher.snapshot()["held"] == 0
+
+    def test_stale_prefetch_is_not_held(self, calls):
+        class Stale(FakeAdapter):
+            stale_age = 600.0
+
+        prefetcher = Prefetcher(top_n=1, adapter_factory=lambda: Stale(calls))
+        prefetcher.after_list(LISTING)
+        assert prefetcher.wait_idle()
+        assert calls == [("get_scout_detail", "s1")]
+        assert prefetcher.snapshot()["held"] == 0
+
+    def test_next_page_prefetched_with_same_limit(self, calls):
+        prefetcher = Prefetcher(next_page=True, adapter_factory=lambda: FakeAdapter(calls))
+        prefetcher.after_updates("s1", {"limit": 5}, {"updates": [], "has_more": True, "next_cursor": "c2"})
+        assert prefetcher.wait_idle()
+
+        key = cache_key("get_scout_updates", ("s1",), {"cursor": "c2", "limit": 5})
+        assert prefetcher.take(key)["cursor"] == "c2"
+
+    @pytest.mark.parametrize(
+        "page",
+        [{"has_more": False, "next_cursor": "c2"}, {"has_more": True, "next_cursor": None}, {"has_more": True}],
+    )
+    def test_last_page_schedules_nothing(self, calls, page):
+        prefetcher = Prefetcher(next_page=True, adapter_factory=lambda: FakeAdapter(calls))
+        prefetcher.after_updates("s1", {}, page)
+        assert calls == []
+
+    def test_next_page_disabled_by_default(self, calls):
+        prefetcher = Prefetcher(adapter_factory=lambda: FakeAdapter(calls))
+        prefetcher.after_updates("s1", {}, {"has_more": True, "next_cursor": "c2"})
+        assert calls == []
+
+
+class TestAdapterPrefetch:
+    @pytest.fixture()
+    def client(self):
+        client = MagicMock()
+        client.scouts.list.return_value = LISTING
+        client.scouts.get.side_effect = lambda scout_id: {"id": scout_id}
+        client.scouts.get_updates.side_effect = lambda scout_id, cursor=None, limit=None: {
+            "updates": [{"id": f"u{cursor or 0}"}],
+            "has_more": cursor != "2",
+            "next_cursor": str(int(cursor or 0) + 1),
+        }
+        return client
+
+    @pytest.fixture()
+    def make_adapter(self, client):
+        def make(prefetcher):
+            with patch("yutori_mcp.adapter.resolve_api_key", return_value="yt-test-key"), \
+                 patch("yutori_mcp.adapter.YutoriClient", return_value=client):
+                return MCPClientAdapter(
+                    retry_policy=RetryPolicy(base_delay=0, max_delay=0),
+                    rate_limiter=RateLimiter.unlimited(),
+                    breaker=CircuitBreaker(failure_rate=0),
+                    cache=ResponseCache(),
+                    singleflight=SingleFlight(),
+                    prefetcher=prefetcher,
+                )
+
+        return make
+
+    def test_follow_up_detail_is_served_from_prefetch(self, client, make_adapter):
+        prefetcher = Prefetcher(top_n=2, adapter_factory=lambda: make_adapter(Prefetcher()))
+        adapter = make_adapter(prefetcher)
+
+        adapter.list_scouts(limit=10)
+        assert prefetcher.wait_idle()
+        assert client.scouts.get.call_count == 2
+
+        assert adapter.get_scout_detail("s1") == {"id": "s1"}
+        assert client.scouts.get.call_count == 2
+        assert prefetcher.snapshot()["used"] == {"get_scout_detail": 1}
+
+    def test_scout_write_invalidates_prefetch(self, client, make_adapter):
+        prefetcher = Prefetcher(top_n=1, adapter_factory=lambda: make_adapter(Prefetcher()))
+        adapter = make_adapter(prefetcher)
+        adapter.list_scouts()
+        assert prefetcher.wait_idle()
+
+        adapter.edit_scout("s1", query="new")
+        adapter.get_scout_detail("s1")
+        assert client.scouts.get.call_count == 2
+
+    def test_pages_through_updates_from_prefetch(self, client, make_adapter):
+        prefetcher = Prefetcher(next_page=True, adapter_factory=lambda: make_adapter(Prefetcher()))
+        adapter = make_adapter(prefetcher)
+
+        adapter.get_scout_updates("s1", limit=10)
+        assert prefetcher.wait_idle()
+        assert adapter.get_scout_updates("s1", cursor="1", limit=10)["updates"] == [{"id": "u1"}]
+        assert prefetcher.wait_idle()
+        page = adapter.get_scout_updates("s1", cursor="2", limit=10)
+
+        assert page["has_more"] is False
+        assert client.scouts.get_updates.call_count == 3
+        assert prefetcher.snapshot()["used"] == {"get_scout_updates": 2}
+
+
+@pytest.mark.parametrize("module", [prefetch, schedule, subscriptions])
+def test_background_adapters_bypass_prefetch_and_revalidation(module, monkeypatch):
+    monkeypatch.setenv("YUTORI_MCP_STALE_WHILE_REVALIDATE", "300")
+    monkeypatch.setenv("YUTORI_MCP_PREFETCH", "3")
+    monkeypatch.setattr("yutori_mcp.revalidate._default_revalidator", None)
+    monkeypatch.setattr("yutori_mcp.prefetch._default_prefetcher", None)
+    with patch("yutori_mcp.adapter.resolve_api_key", return_value="yt-test-key"), \
+         patch("yutori_mcp.adapter.YutoriClient"):
+        adapter = module._default_adapter_factory()
+    assert adapter._prefetcher.top_n == 0
+    assert adapter._revalidator.max_age == 0
+    assert not adapter._revalidator.offline
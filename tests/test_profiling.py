@@ -0,0 +1,111 @@
+"""Tests for opt-in per-call profiling."""
+
+import pstats
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from yutori_mcp import profiling
+from yutori_mcp.profiling import CPROFILE, CallProfiler
+
+
+def _busy():
+    return sum(i * i for i in range(2000))
+
+
+@pytest.fixture()
+def profiler(tmp_path):
+    return CallProfiler(tools=frozenset({"list_scouts"}), directory=tmp_path, keep=3, backend=CPROFILE)
+
+
+class TestCallProfiler:
+    def test_writes_profile_for_matching_tool(self, profiler, tmp_path):
+        with profiler.profile("list_scouts"):
+            _busy()
+        (path,) = tmp_path.iterdir()
+        assert path.suffix == ".prof"
+        assert "-list_scouts-" in path.name and path.stem.endswith("ms")
+        stats = pstats.Stats(str(path))
+        assert any(func[2] == "_busy" for func in stats.stats)
+
+    def test_other_tools_not_profiled(self, profiler, tmp_path):
+        with profiler.profile("get_scout_detail"):
+            _busy()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_keeps_newest_files(self, profiler, tmp_path):
+        for _ in range(5):
+            with profiler.profile("list_scouts"):
+                pass
+        assert len(list(tmp_path.iterdir())) == 3
+
+    def test_prune_leaves_other_files(self, profiler, tmp_path):
+        (tmp_path / "notes.html").write_text("mine")
+        (tmp_path / "old.prof").write_text("mine")
+        for _ in range(5):
+            with profiler.profile("list_scouts"):
+                pass
+        assert (tmp_path / "notes.html").exists() and (tmp_path / "old.prof").exists()
+        assert len(list(tmp_path.iterdir())) == 5
+
+    def test_profile_written_when_call_raises(self, profiler, tmp_path):
+        with pytest.raises(ValueError):
+            with profiler.profile("list_scouts"):
+                raise ValueError("boom")
+        assert len(list(tmp_path.iterdir())) == 1
+
+    def test_concurrent_call_runs_unprofiled(self, profiler, tmp_path):
+        entered, release = threading.Event(), threading.Event()
+
+        def first():
+            with profiler.profile("list_scouts"):
+                entered.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=first)
+        thread.start()
+        entered.wait(5)
+        with profiler.profile("list_scouts"):
+            pass
+        assert list(tmp_path.iterdir()) == []
+        release.set()
+        thread.join(5)
+        assert len(list(tmp_path.iterdir())) == 1
+
+
+class TestFromEnv:
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("YUTORI_MCP_PROFILE", raising=False)
+        assert not CallProfiler.from_env().wants("list_scouts")
+
+    def test_tool_list(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("YUTORI_MCP_PROFILE", "list_scouts, get_scout_updates")
+        monkeypatch.setenv("YUTORI_MCP_PROFILE_DIR", str(tmp_path))
+        monkeypatch.setenv("YUTORI_MCP_PROFILE_KEEP", "7")
+        monkeypatch.setenv("YUTORI_MCP_PROFILER", "cprofile")
+        p = CallProfiler.from_env()
+        assert p.wants("get_scout_updates") and not p.wants("delete_scout")
+        assert (p.directory, p.keep, p.backend) == (tmp_path, 7, CPROFILE)
+
+    def test_all_tools(self, monkeypatch):
+        monkeypatch.setenv("YUTORI_MCP_PROFILE", "*")
+        assert CallProfiler.from_env().wants("anything")
+
+
+class TestRunToolProfiling:
+    def test_tool_call_is_profiled(self, profiler, tmp_path):
+        from yutori_mcp.server import _run_tool
+
+        with patch.object(profiling, "_default_profiler", profiler), \
+             patch("yutori_mcp.adapter.MCPClientAdapter") as mock_adapter:
+            client = mock_adapter.return_value.__enter__.return_value
+            client.upstream_seconds = 0.0
+            client.stale_age = None
+            client.schedule_hold = None
+            client.cancelled = False
+            client.list_scouts.return_value = {"scouts": []}
+            _run_tool("list_scouts", {})
+        (path,) = tmp_path.iterdir()
+        stats = pstats.Stats(str(path))
+        assert any(func[2] == "format_response" for func in stats.stats)
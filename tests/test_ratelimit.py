@@ -0,0 +1,92 @@
+"""Tests for the client-side token-bucket rate limiter."""
+
+import threading
+
+import pytest
+
+from yutori_mcp.ratelimit import (
+    READS,
+    SCOUT_WRITES,
+    TASKS,
+    RateLimiter,
+    RateLimitTimeout,
+    TokenBucket,
+    bucket_for,
+)
+
+
+@pytest.fixture()
+def make_bucket(clock):
+    def make(rate: float, burst: float) -> TokenBucket:
+        return TokenBucket(rate, burst, clock=clock, sleep=clock.sleep)
+
+    return make
+
+
+class TestTokenBucket:
+    def test_burst_served_without_waiting(self, make_bucket, clock):
+        bucket = make_bucket(rate=1, burst=3)
+        assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert clock.sleeps == []
+
+    def test_empty_bucket_queues_instead_of_failing(self, make_bucket, clock):
+        bucket = make_bucket(rate=2, burst=1)
+        bucket.acquire()
+        assert bucket.acquire() == pytest.approx(0.5)
+        assert clock.sleeps == [pytest.approx(0.5)]
+
+    def test_refills_over_time(self, make_bucket, clock):
+        bucket = make_bucket(rate=1, burst=2)
+        bucket.acquire()
+        bucket.acquire()
+        clock.now += 2
+        assert bucket.acquire() == 0.0
+
+    def test_timeout_raises_without_consuming(self, make_bucket):
+        bucket = make_bucket(rate=1, burst=1)
+        bucket.acquire()
+        with pytest.raises(RateLimitTimeout):
+            bucket.acquire(timeout=0.1)
+        assert bucket.acquire(timeout=5) == pytest.approx(1.0)
+
+    def test_zero_rate_is_unlimited(self, make_bucket, clock):
+        bucket = make_bucket(rate=0, burst=1)
+        for _ in range(100):
+            bucket.acquire()
+        assert clock.sleeps == []
+
+    def test_queue_depth_counts_waiters(self):
+        release = threading.Event()
+        entered = threading.Event()
+
+        def blocking_sleep(_seconds: float) -> None:
+            entered.set()
+            release.wait(5)
+
+        bucket = TokenBucket(rate=1, burst=1, sleep=blocking_sleep)
+        bucket.acquire()
+        waiter = threading.Thread(target=bucket.acquire)
+        waiter.start()
+        entered.wait(5)
+        assert bucket.queue_depth == 1
+        release.set()
+        waiter.join(5)
+        assert bucket.queue_depth == 0
+
+
+class TestRateLimiter:
+    def test_operations_map_to_buckets(self):
+        assert bucket_for("list_scouts") == READS
+        assert bucket_for("get_research_task") == READS
+        assert bucket_for("run_research_task") == TASKS
+        assert bucket_for("edit_scout") == SCOUT_WRITES
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("YUTORI_MCP_TASK_RATE", "0.5")
+        monkeypatch.setenv("YUTORI_MCP_READ_BURST", "50")
+        limiter = RateLimiter.from_env()
+        assert limiter.buckets[TASKS].rate == 0.5
+        assert limiter.buckets[READS].burst == 50
+
+    def test_queue_depths_reported_per_bucket(self):
+        assert RateLimiter.unlimited().queue_depths() == {READS: 0, TASKS: 0, SCOUT_WRITES: 0}
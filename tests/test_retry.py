@@ -0,0 +1,114 @@
+"""Tests for the retry policy and backoff loop."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from yutori_mcp.adapter import YutoriAPIError
+from yutori_mcp.retry import (
+    RetryPolicy,
+    RetryStats,
+    call_with_retry,
+    is_retryable,
+    parse_retry_after,
+)
+
+
+def _run(fn, *, idempotent=True, policy=None, stats=None):
+    sleeps: list[float] = []
+    result = call_with_retry(
+        fn,
+        operation="op",
+        idempotent=idempotent,
+        policy=policy or RetryPolicy(),
+        stats=stats or RetryStats(),
+        sleep=sleeps.append,
+    )
+    return result, sleeps
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert parse_retry_after("3") == 3.0
+
+    def test_http_date(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        assert 25 < parse_retry_after(format_datetime(when, usegmt=True)) <= 30
+
+    def test_past_date_clamped_to_zero(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_missing_or_invalid(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestIsRetryable:
+    def test_reads_retry_server_errors(self):
+        assert is_retryable(YutoriAPIError("x", 503), idempotent=True)
+        assert not is_retryable(YutoriAPIError("x", 404), idempotent=True)
+
+    def test_writes_only_retry_rejected_requests(self):
+        assert is_retryable(YutoriAPIError("x", 429), idempotent=False)
+        assert not is_retryable(YutoriAPIError("x", 503), idempotent=False)
+        assert is_retryable(httpx.ConnectError("refused"), idempotent=False)
+        assert not is_retryable(httpx.ReadTimeout("slow"), idempotent=False)
+
+    def test_reads_retry_network_errors(self):
+        assert is_retryable(httpx.ReadTimeout("slow"), idempotent=True)
+
+
+class TestCallWithRetry:
+    def test_backoff_uses_full_jitter(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=4.0)
+        fn = MagicMock(side_effect=[YutoriAPIError("x", 503)] * 3 + ["ok"])
+        result, sleeps = _run(fn, policy=policy)
+        assert result == "ok"
+        assert len(sleeps) == 3
+        for attempt, delay in enumerate(sleeps):
+            assert 0 <= delay <= min(4.0, 2**attempt)
+
+    def test_retry_after_overrides_backoff(self):
+        fn = MagicMock(side_effect=[YutoriAPIError("x", 429, retry_after=1.5), "ok"])
+        _, sleeps = _run(fn)
+        assert sleeps == [1.5]
+
+    def test_deadline_stops_retries(self):
+        stats = RetryStats()
+        fn = MagicMock(side_effect=YutoriAPIError("x", 429, retry_after=60))
+        with pytest.raises(YutoriAPIError):
+            _run(fn, policy=RetryPolicy(deadline=5), stats=stats)
+        assert fn.call_count == 1
+        assert stats.snapshot()["exhausted"] == {"op": 1}
+
+    def test_stats_count_retries(self):
+        stats = RetryStats()
+        fn = MagicMock(side_effect=[YutoriAPIError("x", 500, retry_after=0.5), "ok"])
+        _run(fn, stats=stats)
+        snapshot = stats.snapshot()
+        assert snapshot["retries"] == {"op": 1}
+        assert snapshot["sleep_seconds"] == 0.5
+
+    def test_non_retryable_raised_immediately(self):
+        fn = MagicMock(side_effect=ValueError("bad"))
+        with pytest.raises(ValueError):
+            _run(fn)
+        assert fn.call_count == 1
+
+
+class TestRetryPolicyFromEnv:
+    def test_reads_environment(self, monkeypatch):
+        monkeypatch.setenv("YUTORI_MCP_RETRY_ATTEMPTS", "6")
+        monkeypatch.setenv("YUTORI_MCP_WRITE_RETRY_ATTEMPTS", "1")
+        monkeypatch.setenv("YUTORI_MCP_CALL_DEADLINE", "12.5")
+        policy = RetryPolicy.from_env()
+        assert policy.read_attempts == 6
+        assert policy.write_attempts == 1
+        assert policy.deadline == 12.5
+
+    def test_invalid_values_fall_back(self, monkeypatch):
+        monkeypatch.setenv("YUTORI_MCP_RETRY_ATTEMPTS", "many")
+        assert RetryPolicy.from_env().read_attempts == RetryPolicy.read_attempts
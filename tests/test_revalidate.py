@@ -0,0 +1,118 @@
+"""Tests for stale-while-revalidate and offline reads."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from yutori_mcp.adapter import MCPClientAdapter, YutoriAPIError
+from yutori_mcp.breaker import CircuitBreaker
+from yutori_mcp.cache import ResponseCache, cache_key
+from yutori_mcp.formatters import format_stale_notice
+from yutori_mcp.index import ScoutIndex
+from yutori_mcp.prefetch import Prefetcher
+from yutori_mcp.ratelimit import RateLimiter
+from yutori_mcp.retry import RetryPolicy
+from yutori_mcp.revalidate import Revalidator
+from yutori_mcp.schedule import UpdateSchedule
+from yutori_mcp.singleflight import SingleFlight
+from yutori_mcp.warmup import WarmUp
+
+
+@pytest.fixture()
+def client():
+    client = MagicMock()
+    client.scouts.get.side_effect = [{"id": "s1", "status": "active"}, {"id": "s1", "status": "paused"}]
+    return client
+
+
+@pytest.fixture()
+def cache():
+    return ResponseCache()
+
+
+def make_adapter(client, cache, revalidator):
+    with patch("yutori_mcp.adapter.resolve_api_key", return_value="yt-test-key"), \
+         patch("yutori_mcp.adapter.YutoriClient", return_value=client):
+        return MCPClientAdapter(
+            retry_policy=RetryPolicy(base_delay=0, max_delay=0),
+            rate_limiter=RateLimiter.unlimited(),
+            breaker=CircuitBreaker(failure_rate=0),
+            cache=cache,
+            singleflight=SingleFlight(),
+            prefetcher=Prefetcher(),
+            scout_index=ScoutIndex(),
+            update_schedule=UpdateSchedule(),
+            revalidator=revalidator,
+        )
+
+
+class TestStaleWhileRevalidate:
+    @pytest.fixture()
+    def revalidator(self, client, cache):
+        return Revalidator(60, adapter_factory=lambda: make_adapter(client, cache, Revalidator()))
+
+    def test_cached_read_served_then_refreshed(self, client, cache, revalidator):
+        first = make_adapter(client, cache, revalidator)
+        assert first.get_scout_detail("s1")["status"] == "active"
+        assert first.stale_age is None
+
+        second = make_adapter(client, cache, revalidator)
+        assert second.get_scout_detail("s1")["status"] == "active"
+        assert second.stale_reason == "revalidating"
+        assert revalidator.wait_idle()
+        assert client.scouts.get.call_count == 2
+
+        # The background read refreshed the cache for the next call
+        assert cache.get(cache_key("get_scout_detail", ("s1",), {})).value["status"] == "paused"
+        assert revalidator.snapshot() == {"served": 1, "revalidations": 1, "failures": 0}
+
+    def test_old_entries_and_task_reads_go_upstream(self, client, cache, revalidator):
+        cache.put(cache_key("get_scout_detail", ("s1",), {}), {"id": "s1"}, operation="get_scout_detail")
+        revalidator.max_age = 0.000001
+        assert make_adapter(client, cache, revalidator).get_scout_detail("s1")["status"] == "active"
+
+        client.browsing.get.return_value = {"task_id": "t1", "status": "running"}
+        revalidator.max_age = 60
+        make_adapter(client, cache, revalidator).get_browsing_task("t1")
+        adapter = make_adapter(client, cache, revalidator)
+        adapter.get_browsing_task("t1")
+        assert adapter.stale_age is None
+        assert client.browsing.get.call_count == 2
+
+
+class TestOffline:
+    @pytest.fixture()
+    def snapshot(self, tmp_path):
+        path = tmp_path / "cache.jsonl"
+        previous = ResponseCache(clock=lambda: 1000.0)
+        previous.put(
+            cache_key("list_scouts", (), {"limit": 10}), {"scouts": [{"id": "s1"}]}, operation="list_scouts"
+        )
+        previous.save(path)
+        return path
+
+    def test_reads_served_from_snapshot_without_requests(self, client, cache, snapshot):
+        warmup = WarmUp(snapshot_path=snapshot, cache=cache, prefetcher=Prefetcher())
+        revalidator = Revalidator(offline=True, load_store=warmup.load_snapshot)
+        adapter = make_adapter(client, cache, revalidator)
+
+        assert adapter.list_scouts(limit=10) == {"scouts": [{"id": "s1"}]}
+        assert adapter.stale_reason == "offline"
+        with pytest.raises(YutoriAPIError, match="no stored get_scout_detail"):
+            adapter.get_scout_detail("s1")
+        with pytest.raises(YutoriAPIError, match="create_scout needs the Yutori API") as exc_info:
+            adapter.create_scout("GPU prices")
+        assert exc_info.value.status_code == 503
+
+        client.scouts.list.assert_not_called()
+        client.scouts.get.assert_not_called()
+        client.scouts.create.assert_not_called()
+        # The snapshot is loaded once
+        warmup.run()
+        assert len(cache) == 1
+
+
+def test_stale_notices_name_the_reason():
+    assert "currently unavailable" in format_stale_notice(300)
+    assert "refreshed in the background" in format_stale_notice(300, "revalidating")
+    assert format_stale_notice(7200, "offline").startswith("Note: The server is in offline mode")
@@ -0,0 +1,247 @@
+"""Tests for schedule-aware holding and refreshing of scout updates."""
+
+import heapq
+import threading
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from yutori_mcp.adapter import MCPClientAdapter
+from yutori_mcp.breaker import CircuitBreaker
+from yutori_mcp.cache import ResponseCache
+from yutori_mcp.index import ScoutIndex
+from yutori_mcp.prefetch import Prefetcher
+from yutori_mcp.ratelimit import RateLimiter
+from yutori_mcp.retry import RetryPolicy
+from yutori_mcp.schedule import UpdateSchedule
+from yutori_mcp.singleflight import SingleFlight
+
+NOW = 1_767_225_600.0  # 2026-01-01T00:00:00Z
+DAY = 86400
+# Seconds a run takes to publish its update
+PUBLISH_DELAY = 60
+
+
+def iso(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+class FakeAPI:
+    """Daily scouts whose first runs are spread over the first day."""
+
+    def __init__(self, clock, count=1, spacing=900, publish_delay=PUBLISH_DELAY):
+        self.clock = clock
+        self.publish_delay = publish_delay
+        self.first_runs = {f"s{i}": NOW + 600 + i * spacing for i in range(count)}
+        self.detail_calls = 0
+        self.update_calls = 0
+
+    def runs(self, scout_id):
+        run = self.first_runs[scout_id] - DAY
+        while True:
+            yield run
+            run += DAY
+
+    def detail(self, scout_id):
+        self.detail_calls += 1
+        next_run = next(r for r in self.runs(scout_id) if r > self.clock.now)
+        return {
+            "id": scout_id,
+            "status": "active",
+            "output_interval": DAY,
+            "next_output_timestamp": iso(next_run),
+        }
+
+    def current_updates(self, scout_id, limit=None):
+        published = []
+        for run in self.runs(scout_id):
+            if run + self.publish_delay > self.clock.now:
+                break
+            published.insert(0, {"id": f"{scout_id}@{int(run)}", "created_at": iso(run + self.publish_delay)})
+        return {"updates": published[:limit]}
+
+    def updates(self, scout_id, **kwargs):
+        self.update_calls += 1
+        return self.current_updates(scout_id, kwargs.get("limit"))
+
+
+@pytest.fixture()
+def clock(clock):
+    clock.now = NOW
+    return clock
+
+
+@pytest.fixture()
+def api(clock):
+    return FakeAPI(clock)
+
+
+@pytest.fixture()
+def index():
+    return ScoutIndex()
+
+
+@pytest.fixture()
+def schedule(clock, index, api):
+    holder = {}
+    schedule = UpdateSchedule(True, grace=120, max_interval=3600, adapter_factory=lambda: holder["make"](), clock=clock)
+    holder["make"] = lambda: make_adapter(api, index, schedule)
+    # Refreshes are run by run_due() rather than the background thread
+    schedule._thread = threading.current_thread()
+    yield schedule
+    schedule.close()
+
+
+def make_adapter(api, index, schedule):
+    client = MagicMock()
+    client.scouts.get.side_effect = api.detail
+    client.scouts.get_updates.side_effect = api.updates
+    with patch("yutori_mcp.adapter.resolve_api_key", return_value="yt-test-key"), \
+         patch("yutori_mcp.adapter.YutoriClient", return_value=client):
+        return MCPClientAdapter(
+            retry_policy=RetryPolicy(base_delay=0, max_delay=0),
+            rate_limiter=RateLimiter.unlimited(),
+            breaker=CircuitBreaker(failure_rate=0),
+            cache=ResponseCache(),
+            singleflight=SingleFlight(),
+            prefetcher=Prefetcher(),
+            scout_index=index,
+            update_schedule=schedule,
+        )
+
+
+def run_due(schedule, clock):
+    """Run the refreshes that are due, as the background thread would."""
+    while schedule._queue and schedule._queue[0][0] <= clock.now:
+        due, _, scout_id = heapq.heappop(schedule._queue)
+        state = schedule._scouts.get(scout_id)
+        if state is None or state.due != due:
+            continue
+        next_refresh = schedule.refresh(scout_id)
+        with schedule._cond:
+            if next_refresh is not None and schedule._scouts.get(scout_id) is state:
+                schedule._schedule(scout_id, state, next_refresh)
+
+
+def read(api, index, schedule, scout_id="s0", **kwargs):
+    adapter = make_adapter(api, index, schedule)
+    return adapter.get_scout_updates(scout_id, **kwargs), adapter.schedule_hold
+
+
+class TestUpdateSchedule:
+    def test_page_held_until_next_run(self, api, index, schedule, clock):
+        index.upsert(api.detail("s0"))
+        first, hold = read(api, index, schedule)
+        assert hold is None
+
+        clock.now += 300
+        page, hold = read(api, index, schedule)
+        assert page == first
+        assert hold == (300, NOW + 600)
+        assert api.update_calls == 1
+
+        clock.now = NOW + 600  # the scheduled run
+        read(api, index, schedule)
+        assert api.update_calls == 2
+
+    def test_page_without_the_last_run_is_not_held(self, api, index, schedule, clock):
+        clock.now = NOW + 630  # the run has started but not published
+        index.upsert(api.detail("s0"))
+        read(api, index, schedule)
+        read(api, index, schedule)
+        assert api.update_calls == 2
+        # Retried after the grace period, then held once the update is in
+        assert schedule._scouts["s0"].due == clock.now + 120
+        clock.now += 120
+        run_due(schedule, clock)
+        page, hold = read(api, index, schedule)
+        assert page["updates"][0]["id"] == f"s0@{int(NOW + 600)}"
+        assert hold is not None
+        assert api.update_calls == 3
+
+    def test_run_publishing_after_the_grace_period_is_not_hidden(self, clock, index):
+        api = FakeAPI(clock, publish_delay=300)
+        holder = {}
+        schedule = UpdateSchedule(True, grace=120, adapter_factory=lambda: holder["make"](), clock=clock)
+        holder["make"] = lambda: make_adapter(api, index, schedule)
+        schedule._thread = threading.current_thread()
+        index.upsert(api.detail("s0"))
+        read(api, index, schedule)
+
+        # The refresh at run + grace finds yesterday's update and keeps retrying
+        clock.now = NOW + 600 + 120
+        run_due(schedule, clock)
+        page, hold = read(api, index, schedule)
+        assert hold is None
+        assert schedule._scouts["s0"].due == clock.now + 120
+
+        clock.now = NOW + 600 + 300
+        page, hold = read(api, index, schedule)
+        assert page["updates"][0]["id"] == f"s0@{int(NOW + 600)}"
+        clock.now += 60
+        page, hold = read(api, index, schedule)
+        assert hold is not None and page["updates"][0]["id"] == f"s0@{int(NOW + 600)}"
+
+    def test_unknown_schedule_is_looked_up(self, api, index, schedule, clock):
+        read(api, index, schedule)
+        assert schedule._scouts["s0"].due == NOW
+        run_due(schedule, clock)
+        assert api.detail_calls == 1
+        _, hold = read(api, index, schedule)
+        assert hold is not None
+        assert api.update_calls == 1
+
+    def test_refreshed_after_run_then_dropped_when_unread(self, api, index, schedule, clock):
+        index.upsert(api.detail("s0"))
+        read(api, index, schedule)
+        clock.now = NOW + 600 + 120
+        run_due(schedule, clock)
+        assert api.update_calls == 2  # refreshed in the background
+
+        page, hold = read(api, index, schedule)
+        assert hold is not None and page["updates"]
+        clock.now += DAY
+        run_due(schedule, clock)
+        assert "s0" in schedule._scouts
+        clock.now += DAY
+        run_due(schedule, clock)
+        # Not read since the last refresh
+        assert "s0" not in schedule._scouts
+
+    def test_write_forgets_held_pages(self, api, index, schedule):
+        index.upsert(api.detail("s0"))
+        read(api, index, schedule)
+        adapter = make_adapter(api, index, schedule)
+        adapter._client.scouts.update.return_value = {"id": "s0"}
+        adapter.edit_scout("s0", output_interval=3600)
+        read(api, index, schedule)
+        assert api.update_calls == 2
+
+    def test_disabled_schedule_always_fetches(self, api, index):
+        schedule = UpdateSchedule(False)
+        index.upsert(api.detail("s0"))
+        read(api, index, schedule)
+        _, hold = read(api, index, schedule)
+        assert hold is None
+        assert api.update_calls == 2
+        assert not schedule._scouts
+
+    @pytest.mark.parametrize("publish_delay", [PUBLISH_DELAY, 300])
+    def test_daily_scouts_polled_every_15_minutes(self, clock, index, publish_delay):
+        api = FakeAPI(clock, count=80, spacing=1000, publish_delay=publish_delay)
+        schedule = UpdateSchedule(True, grace=120, adapter_factory=lambda: adapter, clock=clock)
+        schedule._thread = threading.current_thread()
+        adapter = make_adapter(api, index, schedule)
+        reads = 0
+        while clock.now < NOW + DAY:
+            for scout_id in api.first_runs:
+                run_due(schedule, clock)
+                page = adapter.get_scout_updates(scout_id, limit=5)
+                # A held page is never behind what the API would return
+                assert page == api.current_updates(scout_id, 5)
+                reads += 1
+            clock.now += 900
+        assert reads == 80 * 96
+        assert api.update_calls < reads * 0.1
+        assert schedule.held > reads * 0.9
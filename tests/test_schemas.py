@@ -254,6 +254,11 @@ class TestGetUpdatesInput:
         assert data.cursor == "next_page"
         assert data.limit == 50
 
+    def test_delta_optional(self):
+        """delta defaults to None and accepts a boolean."""
+        assert GetUpdatesInput(scout_id="abc-123").delta is None
+        assert GetUpdatesInput(scout_id="abc-123", delta=True).delta is True
+
 
 class TestResearchTaskInput:
     def test_minimal_input(self):
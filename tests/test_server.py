@@ -1,13 +1,39 @@
 """Tests for server helper functions."""
 
-from unittest.mock import patch
-
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import anyio
 import pytest
+from mcp import types
 
 from yutori.auth.types import AuthStatus, LoginResult
 from yutori_mcp import __version__
-from yutori_mcp.server import _output_fields_to_output_schema, _simplify_schema, _get_simplified_schema, main
+from yutori_mcp.adapter import CallCancelled, YutoriAPIError
+from yutori_mcp.index import ScoutIndex
+from yutori_mcp import metrics, schemas
+from yutori_mcp.server import (
+    TOOL_DEFINITIONS,
+    ToolError,
+    _load_tool_schemas,
+    _ResourceSubscribers,
+    _ToolCall,
+    _get_simplified_schema,
+    _output_fields_to_output_schema,
+    _run_tool,
+    _simplify_schema,
+    _tool_deadline,
+    create_server,
+    get_tools,
+    initialization_options,
+    main,
+)
 from yutori_mcp.schemas import ListScoutsInput, CreateScoutInput
+from yutori_mcp.subscriptions import ScoutWatcher
 
 
 class TestSimplifySchema:
@@ -140,6 +166,34 @@ class TestGetSimplifiedSchema:
         assert "anyOf" not in interval_schema
 
 
+class TestPrebuiltToolSchemas:
+    def test_match_pydantic_models(self):
+        """tool_schemas.json is up to date; regenerate with scripts/generate_tool_schemas.py."""
+        prebuilt = _load_tool_schemas()
+        expected = {d["schema"] for d in TOOL_DEFINITIONS}
+        assert set(prebuilt) == expected
+        for name in expected:
+            assert prebuilt[name] == _get_simplified_schema(getattr(schemas, name)), name
+
+    def test_tools_use_prebuilt_schemas(self):
+        tools = {t.name: t for t in get_tools()}
+        assert len(tools) == len(TOOL_DEFINITIONS)
+        assert tools["list_scouts"].inputSchema == _get_simplified_schema(ListScoutsInput)
+        assert tools["list_scouts"].annotations.readOnlyHint is True
+
+
+class TestLazyImports:
+    def test_server_import_defers_heavy_modules(self):
+        """Importing the entry point module must not pull in mcp, pydantic or the SDK."""
+        code = (
+            "import sys, yutori_mcp.server\n"
+            "print(','.join(m for m in ('mcp', 'pydantic', 'yutori', 'httpx', 'yutori_mcp.formatters')"
+            " if m in sys.modules))"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == ""
+
+
 class TestOutputFieldsToOutputSchema:
     def test_none_returns_none(self):
         """None input returns None."""
@@ -246,3 +300,363 @@ class TestMainVersionFlag:
             assert exc_info.value.code == 0
         output = capsys.readouterr().out.strip()
         assert output == f"yutori-mcp {__version__}"
+
+
+class TestRunTool:
+    """_run_tool turns results and errors into the text returned to the model."""
+
+    def test_formats_result(self):
+        with patch("yutori_mcp.adapter.MCPClientAdapter") as mock_adapter:
+            client = mock_adapter.return_value.__enter__.return_value
+            client.upstream_seconds = 0.0
+            client.stale_age = None
+            client.reused_task_age = None
+            client.memo_age = None
+            client.schedule_hold = None
+            client.cancelled = False
+            client.get_scout_detail.return_value = {"id": "s1", "display_name": "Scout"}
+            text = _run_tool("get_scout_detail", {"scout_id": "s1"})
+        assert "Scout: Scout" in text
+        assert "cached data" not in text
+
+    def test_stale_result_is_marked(self):
+        with patch("yutori_mcp.adapter.MCPClientAdapter") as mock_adapter:
+            client = mock_adapter.return_value.__enter__.return_value
+            client.upstream_seconds = 0.0
+            client.stale_age = 300
+            client.stale_reason = "unavailable"
+            client.reused_task_age = None
+            client.memo_age = None
+            client.schedule_hold = None
+            client.cancelled = False
+            client.get_scout_detail.return_value = {"id": "s1", "display_name": "Scout"}
+            text = _run_tool("get_scout_detail", {"scout_id": "s1"})
+        assert text.endswith("cached data from 5 min ago and may be out of date.")
+
+    def test_reused_task_is_marked(self):
+        with patch("yutori_mcp.adapter.MCPClientAdapter") as mock_adapter:
+            client = mock_adapter.return_value.__enter__.return_value
+            client.upstream_seconds = 0.0
+            client.stale_age = None
+            client.reused_task_age = 90
+            client.memo_age = None
+            client.schedule_hold = None
+            client.cancelled = False
+            client.run_research_task.return_value = {"task_id": "t1", "status": "running"}
+            text = _run_tool("run_research_task", {"query": "GPU prices", "idempotency_key": "k1"})
+        assert "Task ID: t1" in text
+        assert "An identical task was started 1 min ago" in text
+        assert client.run_research_task.call_args.kwargs["idempotency_key"] == "k1"
+
+    def test_memoized_research_is_formatted_as_result(self):
+        with patch("yutori_mcp.adapter.MCPClientAdapter") as mock_adapter:
+            client = mock_adapter.return_value.__enter__.return_value
+            client.upstream_seconds = 0.0
+            client.stale_age = None
+            client.reused_task_age = None
+            client.memo_age = 7200
+            client.schedule_hold = None
+            client.cancelled = False
+            client.run_research_task.return_value = {"task_id": "t1", "status": "succeeded", "result": "Findings"}
+            text = _run_tool("run_research_task", {"query": "GPU prices", "max_age": 86400})
+        assert "Findings" in text
+        assert "task started" not in text
+        assert "completed 2.0 h ago" in text
+        assert client.run_research_task.call_args.kwargs["max_age"] == 86400
+
+    def test_held_updates_are_marked(self):
+        with patch("yutori_mcp.adapter.MCPClientAdapter") as mock_adapter:
+            client = mock_adapter.return_value.__enter__.return_value
+            client.upstream_seconds = 0.0
+            client.stale_age = None
+            client.reused_task_age = None
+            client.memo_age = None
+            client.schedule_hold = (1500, 1_767_225_600.0)
+            client.cancelled = False
+            client.get_scout_updates.return_value = {"updates": []}
+            text = _run_tool("get_scout_updates", {"scout_id": "s1"})
+        assert "has not run since these updates were fetched 25 min ago" in text
+        assert "next run is at 2026-01-01 00:00 UTC" in text
+
+    def test_api_error_text(self):
+        with patch("yutori_mcp.adapter.MCPClientAdapter") as mock_adapter:
+            client = mock_adapter.return_value.__enter__.return_value
+            client.upstream_seconds = 0.0
+            client.get_scout_detail.side_effect = YutoriAPIError("Not found", 404)
+            text = _run_tool("get_scout_detail", {"scout_id": "s1"})
+        assert text == "API Error (404): Not found"
+
+    def test_cancelled_call_is_not_formatted(self):
+        with patch("yutori_mcp.adapter.MCPClientAdapter") as mock_adapter, \
+             patch("yutori_mcp.formatters.format_response") as mock_format:
+            client = mock_adapter.return_value.__enter__.return_value
+            client.upstream_seconds = 0.0
+            client.cancelled = True
+            client.get_scout_detail.return_value = {"id": "s1"}
+            assert _run_tool("get_scout_detail", {"scout_id": "s1"}) is None
+        mock_format.assert_not_called()
+
+    def test_call_cancelled_error_returns_none(self):
+        with patch("yutori_mcp.adapter.MCPClientAdapter") as mock_adapter:
+            client = mock_adapter.return_value.__enter__.return_value
+            client.upstream_seconds = 0.0
+            client.get_scout_detail.side_effect = CallCancelled("Call cancelled")
+            assert _run_tool("get_scout_detail", {"scout_id": "s1"}) is None
+
+    def test_deadline_passed_to_adapter(self):
+        with patch("yutori_mcp.adapter.MCPClientAdapter") as mock_adapter:
+            mock_adapter.return_value.__enter__.return_value.upstream_seconds = 0.0
+            _run_tool("get_scout_detail", {"scout_id": "s1"}, deadline=12.0)
+        mock_adapter.assert_called_once_with(deadline=12.0)
+
+    def test_unexpected_error_text(self):
+        with patch("yutori_mcp.adapter.MCPClientAdapter") as mock_adapter:
+            mock_adapter.return_value.__enter__.return_value.upstream_seconds = 0.0
+            text = _run_tool("no_such_tool", {})
+        assert text == "Error: Unknown tool: no_such_tool"
+
+
+class TestRunToolMetrics:
+    def test_records_outcome_phases_and_size(self):
+        before = metrics.tool_calls.value("get_scout_detail", "ok")
+        phase_count = metrics.tool_phase_duration.count("get_scout_detail", "upstream")
+        with patch("yutori_mcp.adapter.MCPClientAdapter") as mock_adapter:
+            client = mock_adapter.return_value.__enter__.return_value
+            client.upstream_seconds = 0.25
+            client.stale_age = None
+            client.reused_task_age = None
+            client.memo_age = None
+            client.schedule_hold = None
+            client.cancelled = False
+            client.get_scout_detail.return_value = {"id": "s1", "display_name": "Scout"}
+            text = _run_tool("get_scout_detail", {"scout_id": "s1"})
+        assert metrics.tool_calls.value("get_scout_detail", "ok") == before + 1
+        assert metrics.tool_phase_duration.count("get_scout_detail", "upstream") == phase_count + 1
+        assert metrics.tool_phase_duration.count("get_scout_detail", "format") >= 1
+        assert metrics.tool_response_bytes.sum("get_scout_detail") >= len(text.encode())
+
+    def test_records_api_errors(self):
+        before = metrics.tool_calls.value("list_scouts", "api_error")
+        with patch("yutori_mcp.adapter.MCPClientAdapter") as mock_adapter:
+            client = mock_adapter.return_value.__enter__.return_value
+            client.upstream_seconds = 0.0
+            client.list_scouts.side_effect = YutoriAPIError("down", 503)
+            _run_tool("list_scouts", {})
+        assert metrics.tool_calls.value("list_scouts", "api_error") == before + 1
+
+
+class TestMetricsResource:
+    def test_listed_and_readable(self):
+        with patch("yutori_mcp.index.default_scout_index", return_value=ScoutIndex()):
+            server = create_server()
+        listed = anyio.run(server.request_handlers[types.ListResourcesRequest], types.ListResourcesRequest(method="resources/list"))
+        assert [str(r.uri) for r in listed.root.resources] == [metrics.METRICS_URI]
+
+        request = types.ReadResourceRequest(
+            method="resources/read", params=types.ReadResourceRequestParams(uri=metrics.METRICS_URI)
+        )
+        result = anyio.run(server.request_handlers[types.ReadResourceRequest], request).root
+        assert "# TYPE yutori_mcp_tool_calls_total counter" in result.contents[0].text
+
+
+class TestScoutResources:
+    @pytest.fixture()
+    def server(self):
+        index = ScoutIndex()
+        scout = {"id": "s1", "display_name": "H100 pricing", "status": "active"}
+        index.observe_list({"scouts": [scout]}, complete=True)
+        with patch("yutori_mcp.index.default_scout_index", return_value=index):
+            yield create_server()
+
+    def test_indexed_scouts_listed_with_templates(self, server):
+        listed = anyio.run(
+            server.request_handlers[types.ListResourcesRequest], types.ListResourcesRequest(method="resources/list")
+        ).root.resources
+        assert [(str(r.uri), r.name) for r in listed][1:] == [("yutori://scouts/s1", "H100 pricing")]
+
+        templates = anyio.run(
+            server.request_handlers[types.ListResourceTemplatesRequest],
+            types.ListResourceTemplatesRequest(method="resources/templates/list"),
+        ).root.resourceTemplates
+        assert [t.uriTemplate for t in templates] == [
+            "yutori://scouts/{scout_id}",
+            "yutori://scouts/{scout_id}/updates",
+        ]
+
+    def test_read_scout_updates_resource(self, server):
+        request = types.ReadResourceRequest(
+            method="resources/read", params=types.ReadResourceRequestParams(uri="yutori://scouts/s1/updates")
+        )
+        with patch("yutori_mcp.server._run_tool", return_value="Found 1 update(s):") as run_tool:
+            result = anyio.run(server.request_handlers[types.ReadResourceRequest], request).root
+        name, arguments, call, deadline = run_tool.call_args.args
+        assert (name, arguments, deadline) == ("get_scout_updates", {"scout_id": "s1"}, _tool_deadline(name))
+        assert isinstance(call, _ToolCall)
+        assert result.contents[0].text == "Found 1 update(s):"
+
+    def test_slow_resource_read_times_out(self, server, monkeypatch):
+        monkeypatch.setenv("YUTORI_MCP_TOOL_DEADLINES", "get_scout_detail=0.2")
+        request = types.ReadResourceRequest(
+            method="resources/read", params=types.ReadResourceRequestParams(uri="yutori://scouts/s1")
+        )
+        calls = []
+
+        def slow_run_tool(name, arguments, call, deadline):
+            calls.append(call)
+            time.sleep(1)
+
+        with patch("yutori_mcp.server._run_tool", side_effect=slow_run_tool):
+            with pytest.raises(ToolError, match="get_scout_detail timed out after 0.2s"):
+                anyio.run(server.request_handlers[types.ReadResourceRequest], request)
+        assert calls[0].cancelled
+
+    def test_failed_resource_read_is_an_error(self, server):
+        request = types.ReadResourceRequest(
+            method="resources/read", params=types.ReadResourceRequestParams(uri="yutori://scouts/s1")
+        )
+        with patch("yutori_mcp.adapter.MCPClientAdapter") as mock_adapter:
+            client = mock_adapter.return_value.__enter__.return_value
+            client.upstream_seconds = 0.0
+            client.get_scout_detail.side_effect = YutoriAPIError("Scout not found", 404)
+            with pytest.raises(ToolError, match=r"API Error \(404\): Scout not found"):
+                anyio.run(server.request_handlers[types.ReadResourceRequest], request)
+
+    def test_subscribe_registers_with_watcher(self, server):
+        from mcp.server.lowlevel.server import request_ctx
+
+        request = types.SubscribeRequest(
+            method="resources/subscribe", params=types.SubscribeRequestParams(uri="yutori://scouts/s1/updates")
+        )
+
+        async def subscribe():
+            token = request_ctx.set(MagicMock())
+            try:
+                await server.request_handlers[types.SubscribeRequest](request)
+            finally:
+                request_ctx.reset(token)
+
+        with patch("yutori_mcp.subscriptions.ScoutWatcher.subscribe", return_value=True) as subscribe_mock:
+            anyio.run(subscribe)
+        subscribe_mock.assert_called_once_with("yutori://scouts/s1/updates")
+
+    def test_subscribe_capability_advertised(self, server):
+        assert initialization_options(server).capabilities.resources.subscribe is True
+
+
+class TestResourceSubscribers:
+    UPDATES = "yutori://scouts/s1/updates"
+
+    @pytest.fixture()
+    def watcher(self):
+        return ScoutWatcher(adapter_factory=MagicMock())
+
+    def run_notify(self, subscribers, sessions):
+        async def main():
+            loop = asyncio.get_running_loop()
+            for uri, session in sessions:
+                subscribers.add(uri, session, loop)
+            await anyio.to_thread.run_sync(subscribers.notify, self.UPDATES)
+            await asyncio.sleep(0.05)
+
+        anyio.run(main)
+
+    def test_notifications_go_only_to_subscribed_sessions(self, watcher):
+        subscribers = _ResourceSubscribers(watcher)
+        assert watcher.notify == subscribers.notify
+        first, second = AsyncMock(), AsyncMock()
+        self.run_notify(subscribers, [(self.UPDATES, first), ("yutori://scouts/s2/updates", second)])
+        first.send_resource_updated.assert_awaited_once()
+        second.send_resource_updated.assert_not_awaited()
+
+        # The watch ends only when the last session unsubscribes
+        subscribers.add(self.UPDATES, second, None)
+        subscribers.remove(self.UPDATES, first)
+        assert self.UPDATES in watcher.subscriptions()
+        subscribers.remove(self.UPDATES, second)
+        assert self.UPDATES not in watcher.subscriptions()
+        watcher.close()
+
+    def test_failed_send_is_logged_and_session_dropped(self, watcher, caplog):
+        subscribers = _ResourceSubscribers(watcher)
+        gone = AsyncMock()
+        gone.send_resource_updated.side_effect = ConnectionError("stream closed")
+        self.run_notify(subscribers, [(self.UPDATES, gone)])
+        assert "Cannot send update notification" in caplog.text
+        assert watcher.subscriptions() == []
+        watcher.close()
+
+
+class TestMainRateLimitFlags:
+    """Rate limit flags are exported as YUTORI_MCP_* variables."""
+
+    def test_flags_set_environment(self, monkeypatch):
+        # Register the variables so monkeypatch removes them afterwards
+        monkeypatch.setenv("YUTORI_MCP_READ_RATE", "")
+        monkeypatch.setenv("YUTORI_MCP_TASK_RATE", "")
+        with patch("sys.argv", ["yutori-mcp", "--read-rate", "5", "--task-rate", "0.5"]), \
+             patch("yutori_mcp.server.run_server", new=lambda: None), \
+             patch("asyncio.run"):
+            main()
+        assert os.environ["YUTORI_MCP_READ_RATE"] == "5.0"
+        assert os.environ["YUTORI_MCP_TASK_RATE"] == "0.5"
+
+    def test_metrics_port_flag(self, monkeypatch):
+        monkeypatch.setenv("YUTORI_MCP_METRICS_PORT", "")
+        with patch("sys.argv", ["yutori-mcp", "--metrics-port", "9464"]), \
+             patch("yutori_mcp.server.run_server", new=lambda: None), \
+             patch("asyncio.run"):
+            main()
+        assert os.environ["YUTORI_MCP_METRICS_PORT"] == "9464"
+
+
+def _call_tool(name: str, arguments: dict) -> types.CallToolResult:
+    """Invoke the registered call_tool handler like the MCP runtime would."""
+    server = create_server()
+    handler = server.request_handlers[types.CallToolRequest]
+    request = types.CallToolRequest(
+        method="tools/call", params=types.CallToolRequestParams(name=name, arguments=arguments)
+    )
+    return anyio.run(handler, request).root
+
+
+class TestToolDeadlines:
+    def test_default_deadline(self, monkeypatch):
+        monkeypatch.delenv("YUTORI_MCP_TOOL_DEADLINES", raising=False)
+        monkeypatch.setenv("YUTORI_MCP_CALL_DEADLINE", "45")
+        assert _tool_deadline("list_scouts") == 45
+
+    def test_per_tool_override(self, monkeypatch):
+        monkeypatch.setenv("YUTORI_MCP_TOOL_DEADLINES", "list_scouts=5, edit_scout=90")
+        assert _tool_deadline("list_scouts") == 5
+        assert _tool_deadline("edit_scout") == 90
+
+    def test_slow_call_times_out_and_is_cancelled(self, monkeypatch):
+        monkeypatch.setenv("YUTORI_MCP_TOOL_DEADLINES", "list_scouts=0.2")
+        calls: list[_ToolCall] = []
+
+        def slow_run_tool(name, arguments, call, deadline):
+            calls.append(call)
+            time.sleep(1)
+            return "too late"
+
+        with patch("yutori_mcp.server._run_tool", side_effect=slow_run_tool):
+            result = _call_tool("list_scouts", {})
+        assert result.content[0].text == "Error: list_scouts timed out after 0.2s"
+        assert calls[0].cancelled
+        assert metrics.tool_calls.value("list_scouts", "timeout") >= 1
+
+
+class TestToolCall:
+    def test_cancel_before_attach_cancels_client(self):
+        call = _ToolCall()
+        call.cancel()
+        client = MagicMock()
+        call.attach(client)
+        client.cancel.assert_called_once()
+
+    def test_cancel_after_attach(self):
+        call = _ToolCall()
+        client = MagicMock()
+        call.attach(client)
+        call.cancel()
+        client.cancel.assert_called_once()
@@ -0,0 +1,118 @@
+"""Tests for concurrent request coalescing."""
+
+import threading
+import time
+
+import pytest
+
+from yutori_mcp.singleflight import SingleFlight
+
+
+def _wait_for_followers(flights, label, count):
+    while flights.shared[label] < count:
+        time.sleep(0.01)
+
+
+class TestSingleFlight:
+    def test_sequential_calls_are_not_shared(self):
+        flights = SingleFlight()
+        calls = []
+        assert flights.do("k", lambda: calls.append(1) or "a") == "a"
+        assert flights.do("k", lambda: calls.append(1) or "b") == "b"
+        assert len(calls) == 2
+        assert flights.in_flight() == 0
+
+    def test_concurrent_calls_share_leader_result(self):
+        flights = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            release.wait(5)
+            return {"value": 42}
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flights.do("k", fetch, label="get"))) for _ in range(5)]
+        for t in threads:
+            t.start()
+        _wait_for_followers(flights, "get", 4)
+        release.set()
+        for t in threads:
+            t.join(5)
+
+        assert calls == [1]
+        assert results == [{"value": 42}] * 5
+        assert flights.snapshot() == {"leaders": {"get": 1}, "shared": {"get": 4}, "in_flight": 0}
+
+    def test_different_keys_run_independently(self):
+        flights = SingleFlight()
+        release = threading.Event()
+        results = {}
+
+        def run(key):
+            results[key] = flights.do(key, lambda: release.wait(5) and key)
+
+        threads = [threading.Thread(target=run, args=(k,)) for k in ("a", "b")]
+        for t in threads:
+            t.start()
+        while flights.in_flight() < 2:
+            time.sleep(0.01)
+        release.set()
+        for t in threads:
+            t.join(5)
+        assert results == {"a": "a", "b": "b"}
+
+    def test_leader_error_propagates_to_followers(self):
+        flights = SingleFlight()
+        release = threading.Event()
+
+        def fail():
+            release.wait(5)
+            raise ValueError("upstream down")
+
+        errors = []
+
+        def run():
+            try:
+                flights.do("k", fail)
+            except ValueError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=run) for _ in range(3)]
+        for t in threads:
+            t.start()
+        _wait_for_followers(flights, "", 2)
+        release.set()
+        for t in threads:
+            t.join(5)
+        assert len(errors) == 3
+        assert flights.in_flight() == 0
+
+    def test_cancelled_follower_stops_waiting(self):
+        flights = SingleFlight()
+        release = threading.Event()
+        leader = threading.Thread(target=lambda: flights.do("k", lambda: release.wait(5)))
+        leader.start()
+        while flights.in_flight() < 1:
+            time.sleep(0.01)
+
+        def own_call():
+            raise RuntimeError("cancelled")
+
+        with pytest.raises(RuntimeError, match="cancelled"):
+            flights.do("k", own_call, cancelled=lambda: True)
+        release.set()
+        leader.join(5)
+
+    def test_disabled_calls_every_time(self):
+        flights = SingleFlight(enabled=False)
+        calls = []
+        flights.do("k", lambda: calls.append(1))
+        flights.do("k", lambda: calls.append(1))
+        assert len(calls) == 2
+        assert flights.snapshot()["leaders"] == {}
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("YUTORI_MCP_COALESCE_READS", "false")
+        assert SingleFlight.from_env().enabled is False
@@ -0,0 +1,162 @@
+"""Tests for scout resource subscriptions and the schedule-aligned watcher."""
+
+import threading
+
+import pytest
+
+from yutori_mcp.subscriptions import ScoutWatcher, parse_scout_uri, parse_timestamp
+
+NOW = 1_767_225_600.0  # 2026-01-01T00:00:00Z
+UPDATES = "yutori://scouts/s1/updates"
+DETAIL = "yutori://scouts/s1"
+
+
+class FakeScout:
+    """Scout state served by FakeAdapter."""
+
+    def __init__(self):
+        self.detail = {"id": "s1", "status": "active", "next_output_timestamp": "2026-01-01T00:30:00Z"}
+        self.updates = [{"id": "u1"}]
+
+
+class FakeAdapter:
+    def __init__(self, scout, calls):
+        self.scout = scout
+        self.calls = calls
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def get_scout_detail(self, scout_id):
+        self.calls.append("detail")
+        return dict(self.scout.detail)
+
+    def get_scout_updates(self, scout_id, limit=None):
+        self.calls.append("updates")
+        return {"updates": list(self.scout.updates[:limit])}
+
+
+@pytest.fixture()
+def scout():
+    return FakeScout()
+
+
+@pytest.fixture()
+def calls():
+    return []
+
+
+@pytest.fixture()
+def clock(clock):
+    clock.now = NOW
+    return clock
+
+
+@pytest.fixture()
+def notified():
+    return []
+
+
+@pytest.fixture()
+def watcher(scout, calls, clock, notified):
+    watcher = ScoutWatcher(
+        notified.append, grace=60, max_interval=3600, adapter_factory=lambda: FakeAdapter(scout, calls), clock=clock
+    )
+    # Register without starting the polling thread
+    watcher._thread = threading.current_thread()
+    yield watcher
+    watcher.close()
+
+
+class TestParsing:
+    def test_scout_uris(self):
+        assert parse_scout_uri(DETAIL) == ("s1", False)
+        assert parse_scout_uri(UPDATES) == ("s1", True)
+        assert parse_scout_uri("yutori://metrics") is None
+
+    def test_timestamps(self):
+        assert parse_timestamp("2026-01-01T00:00:00Z") == NOW
+        assert parse_timestamp(NOW) == NOW
+        assert parse_timestamp(NOW * 1000) == NOW
+        assert parse_timestamp("soon") is None
+        assert parse_timestamp(None) is None
+
+
+class TestScoutWatcher:
+    def test_first_check_records_without_notifying(self, watcher, notified):
+        assert watcher.subscribe(UPDATES)
+        assert not watcher.subscribe("yutori://metrics")
+        assert watcher.check("s1") == NOW + 1800 + 60  # just after the next run
+        assert notified == []
+
+    def test_new_update_notifies_and_follows_schedule(self, watcher, scout, clock, notified):
+        watcher.subscribe(UPDATES)
+        watcher.check("s1")
+
+        clock.now = NOW + 1860
+        scout.updates.insert(0, {"id": "u2"})
+        scout.detail["next_output_timestamp"] = "2026-01-01T01:00:00Z"
+        assert watcher.check("s1") == NOW + 3600 + 60
+        # Only subscribed resources are reported
+        assert notified == [UPDATES]
+
+    def test_missing_run_update_retried_with_backoff(self, watcher, clock):
+        watcher.subscribe(UPDATES)
+        watcher.check("s1")
+
+        clock.now = NOW + 1860
+        assert watcher.check("s1") == clock.now + 60
+        clock.now += 60
+        assert watcher.check("s1") == clock.now + 120
+
+    def test_inactive_scout_checked_at_max_interval(self, watcher, scout, calls):
+        scout.detail["status"] = "paused"
+        watcher.subscribe(DETAIL)
+        assert watcher.check("s1") == NOW + 3600
+        assert calls == ["detail"]  # updates are only read for /updates subscribers
+
+    def test_detail_change_notifies_detail_subscribers(self, watcher, scout, notified):
+        watcher.subscribe(DETAIL)
+        watcher.check("s1")
+        scout.detail["status"] = "paused"
+        watcher.check("s1")
+        assert notified == [DETAIL]
+
+    def test_unsubscribed_scout_is_not_checked(self, watcher, calls):
+        watcher.subscribe(UPDATES)
+        watcher.unsubscribe(UPDATES)
+        assert watcher.check("s1") is None
+        assert calls == []
+        assert watcher.subscriptions() == []
+
+    def test_failed_check_backs_off(self, clock):
+        class Failing:
+            def __enter__(self):
+                raise RuntimeError("down")
+
+            def __exit__(self, *exc):
+                pass
+
+        watcher = ScoutWatcher(grace=60, adapter_factory=Failing, clock=clock)
+        watcher._thread = threading.current_thread()
+        watcher.subscribe(UPDATES)
+        assert watcher.check("s1") == NOW + 60
+        assert watcher.check("s1") == NOW + 120
+
+    def test_background_thread_notifies(self, scout, calls):
+        notified = threading.Event()
+        watcher = ScoutWatcher(
+            lambda uri: notified.set(), grace=0.05, max_interval=0.05, adapter_factory=lambda: FakeAdapter(scout, calls)
+        )
+        scout.detail["next_output_timestamp"] = None
+        watcher.subscribe(UPDATES)
+        try:
+            while not watcher._watches["s1"].checked:
+                threading.Event().wait(0.01)
+            scout.updates.insert(0, {"id": "u2"})
+            assert notified.wait(5)
+        finally:
+            watcher.close()
@@ -0,0 +1,122 @@
+"""Tests for optional OpenTelemetry tracing."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from yutori_mcp import tracing
+from yutori_mcp.server import _run_tool, _ToolCall
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+TRACEPARENT = f"00-{TRACE_ID}-00f067aa0ba902b7-01"
+
+
+class TestDisabled:
+    def test_span_is_noop(self, monkeypatch):
+        monkeypatch.setattr(tracing, "_tracer", None)
+        with tracing.span("anything", {"k": "v"}) as span:
+            span.set_attribute("x", 1)
+            assert not span.is_recording()
+
+    def test_not_configured_without_env(self, monkeypatch):
+        monkeypatch.delenv("YUTORI_MCP_TRACING", raising=False)
+        assert tracing.configure_tracing() is False
+
+    def test_unknown_exporter(self, monkeypatch):
+        pytest.importorskip("opentelemetry.sdk")
+        monkeypatch.setenv("YUTORI_MCP_TRACING", "carrier-pigeon")
+        assert tracing.configure_tracing() is False
+        assert not tracing.enabled()
+
+
+@pytest.fixture(scope="module")
+def trace_file(tmp_path_factory):
+    """Enable the file exporter once; the global tracer provider can only be set once."""
+    pytest.importorskip("opentelemetry.sdk")
+    path = tmp_path_factory.mktemp("traces") / "spans.jsonl"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("YUTORI_MCP_TRACING", "file")
+        mp.setenv("YUTORI_MCP_TRACE_FILE", str(path))
+        assert tracing.configure_tracing() is True
+    yield path
+    tracing._tracer = None
+
+
+def _spans(path, trace_id=None):
+    spans = [json.loads(line) for line in path.read_text().splitlines()]
+    if trace_id is not None:
+        spans = [s for s in spans if s["context"]["trace_id"] == "0x" + trace_id]
+    return {s["name"]: s for s in spans}
+
+
+def _mock_adapter(mock_adapter):
+    client = mock_adapter.return_value.__enter__.return_value
+    client.upstream_seconds = 0.0
+    client.stale_age = None
+    client.schedule_hold = None
+    client.cancelled = False
+    return client
+
+
+class TestFileExporter:
+    def test_tool_call_spans(self, trace_file):
+        with patch("yutori_mcp.adapter.MCPClientAdapter") as mock_adapter:
+            _mock_adapter(mock_adapter).get_scout_detail.return_value = {"id": "s1", "display_name": "Scout"}
+            text = _run_tool("get_scout_detail", {"scout_id": "s1"}, _ToolCall(trace_carrier={"traceparent": TRACEPARENT}))
+
+        spans = _spans(trace_file, TRACE_ID)
+        root = spans["tool get_scout_detail"]
+        assert root["parent_id"] == "0x00f067aa0ba902b7"
+        assert root["attributes"]["yutori.tool"] == "get_scout_detail"
+        assert root["attributes"]["yutori.scout_id"] == "s1"
+        assert root["attributes"]["yutori.outcome"] == "ok"
+        assert root["attributes"]["yutori.response_bytes"] == len(text.encode())
+        root_id = root["context"]["span_id"]
+        assert spans["handle_tool"]["parent_id"] == root_id
+        assert spans["format get_scout_detail"]["parent_id"] == root_id
+
+    def test_adapter_spans(self, trace_file):
+        from yutori_mcp.adapter import MCPClientAdapter
+        from yutori_mcp.breaker import CircuitBreaker
+        from yutori_mcp.cache import ResponseCache
+        from yutori_mcp.ratelimit import RateLimiter
+        from yutori_mcp.singleflight import SingleFlight
+
+        with patch("yutori_mcp.adapter.resolve_api_key", return_value="yt-test-key"), \
+             patch("yutori_mcp.adapter.YutoriClient"):
+            adapter = MCPClientAdapter(
+                rate_limiter=RateLimiter.unlimited(),
+                breaker=CircuitBreaker(failure_rate=0),
+                cache=ResponseCache(),
+                singleflight=SingleFlight(),
+            )
+        adapter._client.research.get = MagicMock(return_value={"status": "running"})
+        with tracing.span("parent", carrier={"traceparent": TRACEPARENT.replace("4bf9", "5bf9")}):
+            adapter.get_research_task("t-42")
+
+        spans = _spans(trace_file, "5bf9" + TRACE_ID[4:])
+        attributes = spans["yutori.get_research_task"]["attributes"]
+        assert attributes == {"yutori.operation": "get_research_task", "yutori.task_id": "t-42"}
+        assert spans["yutori.get_research_task"]["parent_id"] == spans["parent"]["context"]["span_id"]
+
+
+class TestRequestTraceCarrier:
+    def test_reads_traceparent_from_meta(self):
+        from mcp import types
+
+        from yutori_mcp.server import _request_trace_carrier
+
+        server = MagicMock()
+        server.request_context.meta = types.RequestParams.Meta(progressToken=1, traceparent=TRACEPARENT)
+        assert _request_trace_carrier(server) == {"traceparent": TRACEPARENT}
+
+        server.request_context.meta = None
+        assert _request_trace_carrier(server) is None
+
+    def test_outside_request(self):
+        from yutori_mcp.server import _request_trace_carrier
+
+        server = MagicMock()
+        type(server).request_context = property(lambda self: (_ for _ in ()).throw(LookupError()))
+        assert _request_trace_carrier(server) is None
@@ -0,0 +1,103 @@
+"""Tests for the startup cache warm-up."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from yutori_mcp.cache import ResponseCache, cache_key
+from yutori_mcp.prefetch import Prefetcher
+from yutori_mcp.warmup import WarmUp
+
+LISTING = {
+    "scouts": [
+        {"id": "s1", "status": "paused"},
+        {"id": "s2", "status": "active"},
+        {"id": "s3", "status": "active"},
+    ]
+}
+
+
+class FakeAdapter:
+    stale_age = None
+
+    def __init__(self, calls):
+        self.calls = calls
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def list_scouts(self, **kwargs):
+        self.calls.append(("list_scouts", kwargs))
+        return LISTING
+
+    def get_scout_detail(self, scout_id):
+        self.calls.append(("get_scout_detail", scout_id))
+        return {"id": scout_id}
+
+
+def make_warmup(calls, scouts=2, snapshot_path=None, cache=None):
+    cache = cache if cache is not None else ResponseCache()
+    prefetcher = Prefetcher(adapter_factory=lambda: FakeAdapter(calls))
+    warmup = WarmUp(scouts, snapshot_path, cache=cache, prefetcher=prefetcher)
+    return warmup, prefetcher
+
+
+class TestWarmUp:
+    def test_warms_list_and_active_scouts(self):
+        calls = []
+        warmup, prefetcher = make_warmup(calls)
+        warmup.run()
+        assert prefetcher.wait_idle()
+
+        # Keyed as the list_scouts tool calls it with default arguments
+        assert prefetcher.take(cache_key("list_scouts", (), {"limit": 10})) == LISTING
+        assert prefetcher.take(cache_key("get_scout_detail", ("s2",), {})) == {"id": "s2"}
+        assert prefetcher.take(cache_key("get_scout_detail", ("s3",), {})) == {"id": "s3"}
+        assert ("get_scout_detail", "s1") not in calls
+
+    def test_previous_session_scouts_come_first(self, tmp_path):
+        path = tmp_path / "cache.jsonl"
+        previous = ResponseCache(clock=lambda: 100.0)
+        previous.put("k", {"id": "s1"}, operation="get_scout_detail", resource_id="s1")
+        previous.save(path)
+
+        calls = []
+        cache = ResponseCache()
+        warmup, prefetcher = make_warmup(calls, scouts=1, snapshot_path=path, cache=cache)
+        warmup.run()
+        assert prefetcher.wait_idle()
+
+        assert cache.get("k").stored_at == 100.0
+        assert [c for c in calls if c[0] == "get_scout_detail"] == [("get_scout_detail", "s1")]
+
+    def test_snapshot_only_loads_and_saves(self, tmp_path):
+        calls = []
+        cache = ResponseCache()
+        warmup, _ = make_warmup(calls, scouts=0, snapshot_path=tmp_path / "cache.jsonl", cache=cache)
+        warmup.run()
+        cache.put("k", {}, operation="list_scouts")
+        warmup.save()
+
+        assert calls == []
+        assert ResponseCache().load(tmp_path / "cache.jsonl") == 1
+
+    def test_starts_once_and_only_when_enabled(self):
+        assert WarmUp(cache=ResponseCache(), prefetcher=Prefetcher()).start() is None
+        warmup, _ = make_warmup([])
+        with patch.object(warmup, "run"):
+            assert warmup.start() is not None
+            assert warmup.start() is None
+
+    def test_server_starts_warmup_after_handshake(self):
+        from mcp.types import InitializedNotification
+
+        from yutori_mcp.server import create_server
+
+        warmup = MagicMock()
+        with patch("yutori_mcp.warmup.default_warmup", return_value=warmup):
+            server = create_server()
+            handler = server.notification_handlers[InitializedNotification]
+            asyncio.run(handler(InitializedNotification(method="notifications/initialized")))
+        warmup.start.assert_called_once()